@@ -93,6 +93,16 @@ class UniquePropertyMergeConflict(PysaurusError):
     pass
 
 
+class SharedMoveDestination(PysaurusError):
+    """Several moved-video entries would be merged into a same destination.
+
+    Their property values would all be carried onto the destination, so the
+    moves are refused. Args: sorted list of shared destination video IDs.
+    """
+
+    pass
+
+
 class InvalidPropertyValue(PysaurusError):
     pass
 
@@ -0,0 +1,63 @@
+"""Run benchmark scenarios on a synthetic collection.
+
+Synthetic collection is generated once per size and seed, then reused.
+Medians are appended to history files, and compared to previous runs.
+
+Usage:
+    uv run -m pysaurus.benchmarks --size 10000
+    uv run -m pysaurus.benchmarks --size 100000 --scenario group --scenario sort
+"""
+
+import argparse
+import os
+import sys
+
+from pysaurus.benchmarks.scenarios import SCENARIOS, quiet_notifier, run_scenarios
+from pysaurus.benchmarks.synthetic_collection import open_collection
+from pysaurus.core.informer import Information
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pysaurus benchmark suite")
+    parser.add_argument("--size", type=int, default=10_000, help="Number of videos")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario")
+    parser.add_argument(
+        "--folder",
+        default=".benchmarks",
+        help="Folder for synthetic collections and history (default: .benchmarks)",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Scenario to run (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--no-history", action="store_true", help="Do not record results"
+    )
+    parser.add_argument(
+        "--plot", action="store_true", help="Plot history (requires matplotlib)"
+    )
+    args = parser.parse_args()
+
+    collection_path = os.path.join(
+        args.folder, "collections", f"synthetic-{args.size}-{args.seed}"
+    )
+    history_folder = None if args.no_history else os.path.join(args.folder, "history")
+    print(f"Collection: {os.path.abspath(collection_path)}")
+    db = open_collection(collection_path, args.size, args.seed, quiet_notifier())
+    with Information():
+        results = run_scenarios(
+            db, args.scenario, args.repeat, history_folder, plot=args.plot
+        )
+    for result in results:
+        print(result)
+    if history_folder:
+        print(f"History: {os.path.abspath(history_folder)}")
+    if any(result.is_regression for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,18 @@
+"""
+Benchmark history: one JSON file per benchmark, with a plot of durations.
+"""
+
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
-
-import matplotlib.pyplot as plt
+from typing import NotRequired, TypedDict
 
 
 class BenchmarkDict(TypedDict):
     microseconds: float
     timestamp: float
+    # Revision benchmarked (e.g. git commit), if known.
+    commit: NotRequired[str]
 
 
 class Benchline:
@@ -24,7 +28,12 @@ class Benchline:
         if not reset:
             self._load()
 
-    def add(self, microseconds: float, timestamp: datetime | float | None = None):
+    def add(
+        self,
+        microseconds: float,
+        timestamp: datetime | float | None = None,
+        commit: str | None = None,
+    ):
         if timestamp is None:
             timestamp = datetime.now()
         if isinstance(timestamp, datetime):
@@ -34,9 +43,10 @@ class Benchline:
 
         assert not self.benchmarks or self.benchmarks[-1]["timestamp"] < timestamp
 
-        self.benchmarks.append(
-            BenchmarkDict(microseconds=microseconds, timestamp=timestamp)
-        )
+        benchmark = BenchmarkDict(microseconds=microseconds, timestamp=timestamp)
+        if commit:
+            benchmark["commit"] = commit
+        self.benchmarks.append(benchmark)
         self._save()
 
     def _load(self):
@@ -53,6 +63,8 @@ class Benchline:
         if not self.benchmarks:
             return
 
+        import matplotlib.pyplot as plt
+
         dates = [record["timestamp"] for record in self.benchmarks]
         durations = [record["microseconds"] for record in self.benchmarks]
 
@@ -71,18 +83,3 @@ class Benchline:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.plot()
-
-
-if __name__ == "__main__":
-    with Benchline(reset=True) as line:
-        line.add(12)
-        line.add(11)
-        line.add(12)
-        line.add(10)
-        line.add(9)
-        line.add(8)
-        line.add(7)
-        line.add(6)
-        line.add(5)
-        line.add(2)
-        line.add(11)
@@ -0,0 +1,181 @@
+"""
+First-render benchmark: time of first render of videroid Videos page,
+against page size (number of cards).
+
+Cards are built lazily (only those in scroll viewport), so first render
+must not grow with page size. For each page size, reported:
+
+- first render time (min, median, max) over cold runs: card cache is
+  cleared, so every visible card is built and shaped;
+- median warm time: same page reloaded, cards reused from card cache;
+- number of cards actually built.
+
+Exits with status 1 if cold median of largest page exceeds cold median
+of smallest page by more than tolerance: that means off-screen cards
+are built again.
+
+Runs on a synthetic collection, or on a local database given by name.
+Only totals are reliable, see wip/videroid_perf/README.md.
+
+Usage:
+    uv run -m pysaurus.benchmarks.first_render --size 2000 --pages 20,100,500
+    uv run -m pysaurus.benchmarks.first_render --database Divertissement
+"""
+
+import argparse
+import os
+import statistics
+import sys
+
+from videre.testing.step_window import StepWindow
+
+from pysaurus.application.application import Application
+from pysaurus.benchmarks.scenarios import quiet_notifier
+from pysaurus.benchmarks.synthetic_collection import open_collection
+from pysaurus.core.informer import Information
+from pysaurus.core.perf_counter import PerfCounter
+from pysaurus.database.abstract_database import AbstractDatabase
+from pysaurus.interface.videroid.app import VideroidApp
+
+# Default ratio of largest over smallest page cold median.
+TOLERANCE = 1.5
+
+
+class FirstRenderResult:
+    __slots__ = ("page_size", "nb_cards", "nb_built", "cold", "warm")
+
+    def __init__(
+        self,
+        page_size: int,
+        nb_cards: int,
+        nb_built: int,
+        cold: list[float],
+        warm: list[float],
+    ):
+        self.page_size = page_size
+        self.nb_cards = nb_cards
+        self.nb_built = nb_built
+        self.cold = cold
+        self.warm = warm
+
+    @property
+    def cold_median(self) -> float:
+        return statistics.median(self.cold)
+
+    @property
+    def warm_median(self) -> float:
+        return statistics.median(self.warm)
+
+    def __str__(self):
+        return (
+            f"page {self.page_size}: {self.nb_cards} card(s), "
+            f"{self.nb_built} built, cold {min(self.cold):.1f} / "
+            f"{self.cold_median:.1f} / {max(self.cold):.1f} ms "
+            f"(min / median / max), warm {self.warm_median:.1f} ms"
+        )
+
+
+def _measure(window: StepWindow, page, page_size: int, repeat: int):
+    cold, warm = [], []
+    nb_built = 0
+    for _ in range(repeat):
+        page._card_cache.clear()
+        # Setter reloads page, so cards are rebuilt.
+        page.page_size = page_size
+        with PerfCounter() as counter:
+            window.render()
+        cold.append(counter.microseconds / 1000)
+        nb_built = len(page._cards.cards)
+        # Same cards, from card cache.
+        page.refresh()
+        with PerfCounter() as counter:
+            window.render()
+        warm.append(counter.microseconds / 1000)
+    return FirstRenderResult(page_size, page._cards.count, nb_built, cold, warm)
+
+
+def run_first_render(
+    db: AbstractDatabase,
+    page_sizes: list[int],
+    repeat: int = 6,
+    width: int = 1280,
+    height: int = 900,
+) -> list[FirstRenderResult]:
+    """Render Videos page of a headless videroid app on given database.
+
+    Database is not closed.
+    """
+    with StepWindow(width=width, height=height) as window:
+        app = VideroidApp(window=window)
+        try:
+            app.context._api.database = db
+            app.show_page("videos")
+            window.render()
+            page = app._pages["videos"]
+            return [_measure(window, page, size, repeat) for size in page_sizes]
+        finally:
+            app.context.close_app()
+
+
+def growth(results: list[FirstRenderResult]) -> float:
+    """Return ratio of largest over smallest page cold median."""
+    by_size = sorted(results, key=lambda result: result.page_size)
+    smallest, largest = by_size[0].cold_median, by_size[-1].cold_median
+    return largest / smallest if smallest else 0.0
+
+
+def _integers(text: str) -> list[int]:
+    return sorted({int(piece) for piece in text.split(",") if piece.strip()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Videroid first-render benchmark")
+    parser.add_argument(
+        "--database", help="Name of a local database (default: synthetic collection)"
+    )
+    parser.add_argument("--size", type=int, default=2_000, help="Number of videos")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--pages",
+        type=_integers,
+        default=[20, 100, 500],
+        help="Comma-separated page sizes",
+    )
+    parser.add_argument("--repeat", type=int, default=6, help="Cold runs per page")
+    parser.add_argument(
+        "--tolerance", type=float, default=TOLERANCE, help="Maximum growth"
+    )
+    parser.add_argument(
+        "--folder",
+        default=".benchmarks",
+        help="Folder for synthetic collections (default: .benchmarks)",
+    )
+    args = parser.parse_args()
+
+    with Information():
+        if args.database:
+            application = Application(notifier=quiet_notifier())
+            db = application.open_database_from_name(args.database)
+        else:
+            collection_path = os.path.join(
+                args.folder, "collections", f"synthetic-{args.size}-{args.seed}"
+            )
+            print(f"Collection: {os.path.abspath(collection_path)}")
+            db = open_collection(
+                collection_path, args.size, args.seed, quiet_notifier()
+            )
+        try:
+            results = run_first_render(db, args.pages, args.repeat)
+        finally:
+            db.__close__()
+    for result in results:
+        print(result)
+    ratio = growth(results)
+    print(f"Largest / smallest page cold median: {ratio:.2f} (max {args.tolerance})")
+    if ratio > args.tolerance:
+        print("REGRESSION: first render grows with card count")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Media corpus generator, for probe benchmarks.
+
+Generates small video files with PyAV, with varied containers, video and
+audio codecs, resolutions and durations. Some files are defective:
+
+- video without audio stream;
+- audio without video stream (reported as unreadable);
+- broken tail (file truncated after encoding);
+- garbage (random bytes with a video extension).
+
+Encoders not available in current FFmpeg build are skipped.
+Generation is reproducible: same count and seed give same files.
+"""
+
+import os
+import random
+from fractions import Fraction
+
+import av
+import numpy as np
+
+from pysaurus.core.absolute_path import AbsolutePath, PathType
+
+# (extension, video encoder, audio encoder)
+FORMATS = (
+    ("mp4", "libx264", "aac"),
+    ("mp4", "mpeg4", "aac"),
+    ("mkv", "libx264", "libopus"),
+    ("mkv", "mpeg4", "flac"),
+    ("webm", "libvpx", "libopus"),
+    ("avi", "mjpeg", "libmp3lame"),
+    ("mov", "mpeg4", "pcm_s16le"),
+    ("mpg", "mpeg2video", "mp2"),
+    ("wmv", "wmv2", None),
+)
+RESOLUTIONS = ((160, 120), (320, 240), (320, 180), (480, 270))
+DURATIONS = (1, 2, 3)
+FRAME_RATES = (10, 15, 24)
+AUDIO_RATE = 48000
+AUDIO_FRAME_SIZE = 1024
+
+# (kind, weight)
+KINDS = (
+    ("normal", 80),
+    ("no audio", 8),
+    ("no video", 4),
+    ("broken tail", 6),
+    ("garbage", 2),
+)
+
+
+def _has_encoder(name: str) -> bool:
+    try:
+        av.Codec(name, "w")
+    except Exception:
+        return False
+    return True
+
+
+def available_formats() -> list[tuple[str, str, str | None]]:
+    """Return formats whose encoders are available."""
+    return [
+        (extension, video_codec, audio_codec)
+        for extension, video_codec, audio_codec in FORMATS
+        if _has_encoder(video_codec)
+        and (audio_codec is None or _has_encoder(audio_codec))
+    ]
+
+
+def _video_frames(width: int, height: int, nb_frames: int, color: tuple):
+    # Moving diagonal gradient over a base color.
+    x = np.arange(width, dtype=np.uint16)[None, :]
+    y = np.arange(height, dtype=np.uint16)[:, None]
+    base = np.array(color, dtype=np.uint16)
+    for index in range(nb_frames):
+        wave = ((x + y + index * 8) % 256)[:, :, None]
+        image = ((base + wave) % 256).astype(np.uint8)
+        yield av.VideoFrame.from_ndarray(image, format="rgb24")
+
+
+def _audio_frames(duration: float, pitch: float):
+    nb_samples = int(duration * AUDIO_RATE)
+    for start in range(0, nb_samples, AUDIO_FRAME_SIZE):
+        t = np.arange(start, min(start + AUDIO_FRAME_SIZE, nb_samples)) / AUDIO_RATE
+        wave = (np.sin(2 * np.pi * pitch * t) * 8000).astype(np.int16)
+        samples = np.repeat(wave, 2)[None, :]
+        frame = av.AudioFrame.from_ndarray(samples, format="s16", layout="stereo")
+        frame.sample_rate = AUDIO_RATE
+        frame.pts = start
+        frame.time_base = Fraction(1, AUDIO_RATE)
+        yield frame
+
+
+def write_video(
+    path: str,
+    video_codec: str | None,
+    audio_codec: str | None,
+    width: int = 320,
+    height: int = 240,
+    duration: float = 1,
+    fps: int = 15,
+    color: tuple[int, int, int] = (64, 128, 192),
+) -> None:
+    """Encode a video file with given streams (None to skip a stream)."""
+    with av.open(path, mode="w") as container:
+        video_stream = audio_stream = None
+        if video_codec:
+            video_stream = container.add_stream(video_codec, rate=fps)
+            video_stream.width = width
+            video_stream.height = height
+            video_stream.pix_fmt = "yuvj420p" if video_codec == "mjpeg" else "yuv420p"
+        if audio_codec:
+            audio_stream = container.add_stream(audio_codec, rate=AUDIO_RATE)
+            audio_stream.layout = "stereo"
+        if video_stream:
+            for frame in _video_frames(width, height, int(duration * fps), color):
+                container.mux(video_stream.encode(frame))
+            container.mux(video_stream.encode())
+        if audio_stream:
+            for frame in _audio_frames(duration, 220 + color[0]):
+                container.mux(audio_stream.encode(frame))
+            container.mux(audio_stream.encode())
+
+
+def generate_corpus(folder: PathType, count: int, seed: int = 0) -> dict[str, str]:
+    """Generate `count` media files in folder.
+
+    Return a dictionary mapping each file path to its kind.
+    """
+    folder = AbsolutePath.ensure(folder).mkdir()
+    rng = random.Random(seed)
+    formats = available_formats()
+    if not formats:
+        raise RuntimeError("No available encoder to generate media corpus")
+    kinds = [kind for kind, _ in KINDS]
+    weights = [weight for _, weight in KINDS]
+    corpus = {}
+    for index in range(count):
+        (kind,) = rng.choices(kinds, weights)
+        extension, video_codec, audio_codec = rng.choice(formats)
+        width, height = rng.choice(RESOLUTIONS)
+        duration = rng.choice(DURATIONS)
+        fps = rng.choice(FRAME_RATES)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        path = AbsolutePath.join(
+            folder, f"{index:05}_{kind.replace(' ', '_')}.{extension}"
+        ).path
+        if kind == "garbage":
+            with open(path, "wb") as file:
+                file.write(rng.randbytes(rng.randint(1024, 64 * 1024)))
+        else:
+            if kind == "no audio":
+                audio_codec = None
+            elif kind == "no video":
+                video_codec = None
+                audio_codec = audio_codec or "mp2"
+            write_video(
+                path, video_codec, audio_codec, width, height, duration, fps, color
+            )
+            if kind == "broken tail":
+                with open(path, "r+b") as file:
+                    file.truncate(os.path.getsize(path) * rng.randint(40, 80) // 100)
+        corpus[path] = kind
+    return corpus
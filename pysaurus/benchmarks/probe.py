@@ -0,0 +1,189 @@
+"""
+Probe benchmark: throughput of video probing (metadata and thumbnail
+extraction, through `Videos.hunt`) in full update pipeline.
+
+A media corpus is generated once per count and seed, then, for each pool
+size and chunk size, a new collection is created on corpus and updated
+with tracing enabled. Reported:
+
+- files per second, over whole update;
+- per-stage timings in main process (e.g. collecting files, probing,
+  saving thumbnails);
+- per-step timings summed over workers (open video, info, thumbnail);
+- worker utilization: time spent in probing calls, over probing stage
+  duration times pool size.
+
+Corpus files are in OS cache after generation, so all runs are warm.
+
+Usage:
+    uv run -m pysaurus.benchmarks.probe --count 500 --pools 1,2,4 --chunks 1,4,16
+"""
+
+import argparse
+import os
+import tempfile
+
+from pysaurus.benchmarks.media_corpus import generate_corpus
+from pysaurus.benchmarks.scenarios import quiet_notifier
+from pysaurus.core import tracing
+from pysaurus.core.absolute_path import AbsolutePath, PathType
+from pysaurus.core.informer import Information
+from pysaurus.core.language import say
+from pysaurus.core.parallelization import CPU_COUNT
+from pysaurus.core.perf_counter import PerfCounter
+from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
+
+# Name of function traced in workers for each probed video.
+PROBE_FUNCTION = "capture"
+
+
+def _durations(events: list[dict]) -> dict[str, float]:
+    """Return total duration (ms) per span name, in order of first start."""
+    durations: dict[str, float] = {}
+    for event in sorted(events, key=lambda event: event["ts"]):
+        durations[event["name"]] = durations.get(event["name"], 0) + event["dur"] / 1000
+    return durations
+
+
+class ProbeResult:
+    __slots__ = (
+        "pool_size",
+        "chunk_size",
+        "nb_files",
+        "nb_unreadable",
+        "milliseconds",
+        "stages",
+        "worker_steps",
+    )
+
+    def __init__(
+        self,
+        pool_size: int,
+        chunk_size: int,
+        nb_files: int,
+        nb_unreadable: int,
+        milliseconds: float,
+        tracer: tracing.Tracer,
+    ):
+        self.pool_size = pool_size
+        self.chunk_size = chunk_size
+        self.nb_files = nb_files
+        self.nb_unreadable = nb_unreadable
+        self.milliseconds = milliseconds
+        spans = [event for event in tracer.events if event["ph"] == "X"]
+        self.stages = _durations([span for span in spans if span["pid"] == tracer.pid])
+        self.worker_steps = _durations(
+            [span for span in spans if span["pid"] != tracer.pid]
+        )
+
+    @property
+    def files_per_second(self) -> float:
+        return self.nb_files * 1000 / self.milliseconds if self.milliseconds else 0.0
+
+    @property
+    def utilization(self) -> float | None:
+        """Ratio of pool time spent probing videos."""
+        probe_stage = self.stages.get(say("Collect videos info"))
+        if not probe_stage:
+            return None
+        return self.worker_steps.get(PROBE_FUNCTION, 0) / (probe_stage * self.pool_size)
+
+    def __str__(self):
+        utilization = self.utilization
+        return "\n".join(
+            (
+                f"pool {self.pool_size}, chunk {self.chunk_size}: "
+                f"{self.nb_files} file(s) ({self.nb_unreadable} unreadable) "
+                f"in {self.milliseconds:.1f} ms, "
+                f"{self.files_per_second:.1f} file(s)/s, "
+                f"worker utilization "
+                + ("n/a" if utilization is None else f"{utilization:.0%}"),
+                "  stages: "
+                + ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.stages.items()),
+                "  workers: "
+                + ", ".join(
+                    f"{name} {ms:.1f} ms" for name, ms in self.worker_steps.items()
+                ),
+            )
+        )
+
+
+def run_probe(
+    corpus_folder: PathType, pool_size: int, chunk_size: int, work_folder: PathType
+) -> ProbeResult:
+    """Create a collection on corpus in work folder, then update it."""
+    corpus_folder = AbsolutePath.ensure(corpus_folder)
+    with tempfile.TemporaryDirectory(dir=AbsolutePath.ensure(work_folder).path) as tmp:
+        db = PysaurusCollection(tmp, folders=[corpus_folder], notifier=quiet_notifier())
+        try:
+            with tracing.recording() as tracer:
+                with PerfCounter() as counter:
+                    db.algos.update(cpu_count=pool_size, chunksize=chunk_size)
+            return ProbeResult(
+                pool_size,
+                chunk_size,
+                db.count_videos(),
+                db.count_videos(where={"readable": False}),
+                counter.microseconds / 1000,
+                tracer,
+            )
+        finally:
+            db.db.close()
+
+
+def run_probes(
+    corpus_folder: PathType,
+    pool_sizes: list[int],
+    chunk_sizes: list[int],
+    work_folder: PathType,
+) -> list[ProbeResult]:
+    return [
+        run_probe(corpus_folder, pool_size, chunk_size, work_folder)
+        for pool_size in pool_sizes
+        for chunk_size in chunk_sizes
+    ]
+
+
+def _integers(text: str) -> list[int]:
+    return sorted({int(piece) for piece in text.split(",") if piece.strip()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pysaurus probe benchmark")
+    parser.add_argument("--count", type=int, default=200, help="Number of files")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--pools",
+        type=_integers,
+        default=sorted({1, 2, 4, CPU_COUNT}),
+        help="Comma-separated pool sizes",
+    )
+    parser.add_argument(
+        "--chunks",
+        type=_integers,
+        default=[1, 4, 16],
+        help="Comma-separated chunk sizes",
+    )
+    parser.add_argument(
+        "--folder",
+        default=".benchmarks",
+        help="Folder for media corpus and work files (default: .benchmarks)",
+    )
+    args = parser.parse_args()
+
+    corpus_folder = os.path.join(args.folder, f"corpus-{args.count}-{args.seed}")
+    if not os.path.isdir(corpus_folder):
+        print(f"Generating {args.count} file(s) in: {os.path.abspath(corpus_folder)}")
+        # Generate in a temporary folder, so that an interrupted generation
+        # is not reused.
+        partial_folder = f"{corpus_folder}.partial"
+        generate_corpus(partial_folder, args.count, args.seed)
+        os.replace(partial_folder, corpus_folder)
+    with Information():
+        results = run_probes(corpus_folder, args.pools, args.chunks, args.folder)
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Benchmark scenarios, run on a (synthetic) collection.
+
+Each scenario is timed over several runs, after an untimed setup.
+Median duration may be appended to a `Benchline` history file per scenario
+and collection size, so that regressions are visible across commits.
+"""
+
+import os
+import statistics
+import subprocess
+from typing import Any, Callable, Iterable
+
+from pysaurus.benchmarks.benchline import Benchline
+from pysaurus.core.notifying import Notifier
+from pysaurus.core.perf_counter import PerfCounter
+from pysaurus.database.abstract_database import Change
+from pysaurus.database.db_utils import DatabaseLoaded
+from pysaurus.database.features.db_similar_videos import DbSimilarVideos
+from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
+from pysaurus.dbview.view_context import ViewContext
+
+# Property set by bulk tag scenario, created if missing.
+BENCHMARK_PROPERTY = "benchmark label"
+PAGE_SIZE = 20
+NB_PAGES = 10
+# Slowdown (relative to median of previous runs) reported as regression.
+REGRESSION_THRESHOLD = 0.2
+# Number of previous runs used as reference.
+REFERENCE_SIZE = 5
+
+
+def quiet_notifier() -> Notifier:
+    """Return a notifier ignoring notifications."""
+    notifier = Notifier()
+    notifier.never_call_default_manager()
+    return notifier
+
+
+class Scenario:
+    __slots__ = ("name", "run", "setup")
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[PysaurusCollection, Any], Any],
+        setup: Callable[[PysaurusCollection], Any] | None = None,
+    ):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+    @property
+    def description(self) -> str:
+        return (self.run.__doc__ or "").strip()
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str, setup: Callable[[PysaurusCollection], Any] | None = None):
+    """Register decorated function as a scenario.
+
+    Function receives collection and value returned by setup, if any.
+    """
+
+    def decorator(function):
+        SCENARIOS[name] = Scenario(name, function, setup)
+        return function
+
+    return decorator
+
+
+@scenario("open")
+def _open(db: PysaurusCollection, _):
+    """Open collection and compute loading stats."""
+    other = PysaurusCollection(db.get_database_folder(), notifier=db.notifier)
+    try:
+        DatabaseLoaded(other)
+    finally:
+        other.db.close()
+
+
+@scenario("update")
+def _update(db: PysaurusCollection, _):
+    """Update collection with no change on disk."""
+    db.algos.update()
+
+
+@scenario("group")
+def _group(db: PysaurusCollection, _):
+    """Query first page of view grouped by a multiple property."""
+    view = ViewContext()
+    view.set_grouping("category", is_property=True, sorting="count", reverse=True)
+    return db.query_videos(view, PAGE_SIZE, 0)
+
+
+@scenario("sort")
+def _sort(db: PysaurusCollection, _):
+    """Query first page of view sorted by size then title."""
+    view = ViewContext()
+    view.set_sort(["-file_size", "title"])
+    return db.query_videos(view, PAGE_SIZE, 0)
+
+
+@scenario("search")
+def _search(db: PysaurusCollection, _):
+    """Query first page of view searched with a two-terms text."""
+    view = ViewContext()
+    view.set_search("silver lake", "or")
+    return db.query_videos(view, PAGE_SIZE, 0)
+
+
+@scenario("page_flip")
+def _page_flip(db: PysaurusCollection, _):
+    """Query successive pages of default view."""
+    view = ViewContext()
+    for page_number in range(NB_PAGES):
+        db.query_videos(view, PAGE_SIZE, page_number)
+
+
+def _setup_bulk_tag(db: PysaurusCollection) -> dict[int, list[str]]:
+    if not db.get_prop_types(name=BENCHMARK_PROPERTY):
+        db.prop_type_add(BENCHMARK_PROPERTY, "str", "", True)
+    video_ids = sorted(video.video_id for video in db.get_videos(include=["video_id"]))
+    return {video_id: ["bulk", f"bulk {video_id % 10}"] for video_id in video_ids[::2]}
+
+
+@scenario("bulk_tag", setup=_setup_bulk_tag)
+def _bulk_tag(db: PysaurusCollection, updates: dict[int, list[str]]):
+    """Replace a string property on half of videos."""
+    db.videos_tag_set(BENCHMARK_PROPERTY, dict(updates), Change.REPLACE)
+
+
+def _setup_similarity(db: PysaurusCollection):
+    db.algos.ensure_miniatures()
+    db.ops.set_similarities(
+        {video.video_id: None for video in db.get_videos(include=["video_id"])}
+    )
+
+
+@scenario("similarity", setup=_setup_similarity)
+def _similarity(db: PysaurusCollection, _):
+    """Search similar videos from scratch, with miniatures already built."""
+    DbSimilarVideos.find_similar_videos(db)
+
+
+def _setup_miniatures(db: PysaurusCollection):
+    miniatures_path = db.get_miniatures_path()
+    if miniatures_path.exists():
+        miniatures_path.delete()
+
+
+@scenario("miniatures", setup=_setup_miniatures)
+def _miniatures(db: PysaurusCollection, _):
+    """Build miniatures of all thumbnails."""
+    db.algos.ensure_miniatures()
+
+
+class ScenarioResult:
+    __slots__ = ("name", "microseconds", "reference")
+
+    def __init__(self, name: str, microseconds: list[float]):
+        self.name = name
+        self.microseconds = microseconds
+        # Median of previous runs from history, if any.
+        self.reference: float | None = None
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.microseconds)
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of median compared to reference."""
+        if not self.reference:
+            return None
+        return self.median / self.reference - 1
+
+    @property
+    def is_regression(self) -> bool:
+        change = self.change
+        return change is not None and change > REGRESSION_THRESHOLD
+
+    def __str__(self):
+        change = self.change
+        return (
+            f"{self.name:<12} "
+            f"median {self.median / 1000:>10.3f} ms, "
+            f"min {min(self.microseconds) / 1000:>10.3f} ms"
+            + (
+                ""
+                if change is None
+                else f", {change:+.1%} vs previous"
+                + (" (REGRESSION)" if self.is_regression else "")
+            )
+        )
+
+
+def run_scenario(db: PysaurusCollection, name: str, repeat: int = 5) -> ScenarioResult:
+    """Run a scenario `repeat` times, with setup before each run."""
+    bench = SCENARIOS[name]
+    microseconds = []
+    for _ in range(repeat):
+        state = bench.setup(db) if bench.setup else None
+        with PerfCounter() as counter:
+            bench.run(db, state)
+        microseconds.append(counter.microseconds)
+    return ScenarioResult(name, microseconds)
+
+
+def current_commit() -> str | None:
+    """Return short hash of current git commit of pysaurus sources, if any."""
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+def run_scenarios(
+    db: PysaurusCollection,
+    names: Iterable[str] | None = None,
+    repeat: int = 5,
+    history_folder: str | None = None,
+    plot: bool = False,
+) -> list[ScenarioResult]:
+    """Run scenarios (all by default) in registration order.
+
+    If a history folder is given, each median is compared to previous runs,
+    then appended to history file `<scenario>-<collection size>.json`.
+    """
+    names = list(SCENARIOS) if names is None else list(names)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenario(s): {', '.join(unknown)}")
+    size = db.count_videos()
+    commit = None
+    if history_folder:
+        os.makedirs(history_folder, exist_ok=True)
+        commit = current_commit()
+    results = []
+    for name in names:
+        result = run_scenario(db, name, repeat)
+        if history_folder:
+            line = Benchline(f"{name}-{size}", history_folder)
+            previous = line.benchmarks[-REFERENCE_SIZE:]
+            if previous:
+                result.reference = statistics.median(
+                    benchmark["microseconds"] for benchmark in previous
+                )
+            line.add(result.median, commit=commit)
+            if plot:
+                line.plot()
+        results.append(result)
+    return results
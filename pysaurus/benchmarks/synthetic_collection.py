@@ -0,0 +1,357 @@
+"""
+Synthetic collection generator, for benchmarks.
+
+Builds a Pysaurus collection of N videos without real video files:
+
+- filenames follow a series / movies / clips layout, with accented words;
+- video properties (codecs, containers, resolutions, durations, sizes,
+  audio languages) follow weighted distributions;
+- custom properties (categories, actors, rating, watched) are set, with a
+  Zipf-like distribution of actors;
+- each readable video has a JPEG thumbnail BLOB, generated so that some
+  groups of videos are near-duplicates (similarity search finds them);
+- some videos are not found, unreadable, or moved (not found, with a found
+  copy having same size and duration).
+
+Found videos are backed by placeholder files in `videos` folder of
+collection, with size and mtime recorded in collection, so that an update
+finds nothing to do. Placeholders are tiny: a file takes one byte per MiB
+of generated video size, so that size distribution is kept.
+
+Generation is reproducible: same size and seed give same collection
+(except file mtimes).
+"""
+
+import io
+import json
+import random
+from typing import Sequence
+
+from PIL import Image
+
+from pysaurus.core.absolute_path import AbsolutePath, PathType
+from pysaurus.core.notifying import DEFAULT_NOTIFIER
+from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
+from pysaurus.video.video_entry import VideoEntry
+from pysaurus.video.video_file_lister import scan_path_for_videos
+from pysaurus.video.video_runtime_info import VideoRuntimeInfo
+
+# Name of folder containing placeholder files, in collection folder.
+VIDEO_FOLDER = "videos"
+# Name of file describing generated collection, in collection folder.
+SYNTHETIC_INFO = "synthetic.json"
+# Generated video size (in bytes) per placeholder byte.
+FILE_SIZE_SCALE = 1 << 20
+
+THUMBNAIL_SIZE = (300, 169)
+# Ratios of generated videos.
+NOT_FOUND_RATIO = 0.02
+UNREADABLE_RATIO = 0.01
+MOVED_RATIO = 0.01
+SIMILAR_RATIO = 0.05
+
+_WORDS = (
+    "alpha,amber,ancient,autumn,blue,broken,café,canyon,city,cold,coral,crimson,"
+    "dark,dawn,deep,desert,dream,echo,electric,ember,été,fall,fire,forest,frozen,"
+    "garden,ghost,glass,golden,green,harbor,heart,hidden,hollow,island,iron,jade,"
+    "king,lake,last,light,lost,lunar,midnight,mirror,mountain,night,noël,ocean,"
+    "paper,river,road,secret,shadow,silent,silver,sky,snow,star,stone,storm,"
+    "street,summer,sun,tide,tower,valley,velvet,water,west,white,wild,winter,"
+    "wolf,über,señor,ciudad,東京,夏"
+).split(",")
+_FIRST_NAMES = (
+    "Ada,Alan,Alice,Bruno,Carla,Chloé,David,Elena,Emma,Farid,Grace,Hugo,Ines,"
+    "Jules,Kenji,Laura,Léa,Marco,Nadia,Omar,Paula,Quentin,Rosa,Sven,Yuki,Zoé"
+).split(",")
+_LAST_NAMES = (
+    "Adams,Bernard,Costa,Dubois,Evans,Fischer,García,Haddad,Ito,Jensen,Kowalski,"
+    "Lambert,Moreau,Nakamura,Okafor,Petit,Rossi,Schmidt,Tanaka,Novák,Weber"
+).split(",")
+_CATEGORIES = (
+    "action,animation,comedy,documentary,drama,family,fantasy,horror,music,"
+    "nature,news,science,sport,thriller,travel"
+).split(",")
+
+# (extension, container format, weight)
+_CONTAINERS = (
+    ("mp4", "mov,mp4,m4a,3gp,3g2,mj2", 50),
+    ("mkv", "matroska,webm", 30),
+    ("avi", "avi", 10),
+    ("webm", "matroska,webm", 5),
+    ("wmv", "asf", 5),
+)
+# (codec, description, weight)
+_VIDEO_CODECS = (
+    ("h264", "H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10", 55),
+    ("hevc", "H.265 / HEVC (High Efficiency Video Coding)", 25),
+    ("mpeg4", "MPEG-4 part 2", 10),
+    ("vp9", "Google VP9", 7),
+    ("av1", "Alliance for Open Media AV1", 3),
+)
+# (codec, description, weight)
+_AUDIO_CODECS = (
+    ("aac", "AAC (Advanced Audio Coding)", 60),
+    ("ac3", "ATSC A/52A (AC-3)", 15),
+    ("opus", "Opus (Opus Interactive Audio Codec)", 15),
+    ("mp3", "MP3 (MPEG audio layer 3)", 10),
+)
+# ((width, height), video bit rate in kbit/s, weight)
+_RESOLUTIONS = (
+    ((1920, 1080), 5000, 45),
+    ((1280, 720), 2500, 30),
+    ((3840, 2160), 16000, 10),
+    ((854, 480), 1000, 10),
+    ((640, 360), 600, 5),
+)
+# ((numerator, denominator), weight)
+_FRAME_RATES = (((24000, 1001), 30), ((25, 1), 25), ((30, 1), 30), ((60, 1), 15))
+_LANGUAGES = ("eng", "fre", "spa", "jpn", "ger")
+_ERRORS = ("ERROR_OPEN_VIDEO", "ERROR_NO_VIDEO_STREAM", "ERROR_SAVE_THUMBNAIL")
+
+
+def _choose(rng: random.Random, table: Sequence[tuple]) -> tuple:
+    """Choose a row from a table whose last column is a weight."""
+    (row,) = rng.choices(table, weights=[row[-1] for row in table])
+    return row
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(count))
+
+
+class _SyntheticGenerator:
+    __slots__ = ("rng", "folder", "actors", "_actor_weights", "_paths")
+
+    def __init__(self, seed: int, folder: AbsolutePath):
+        self.rng = random.Random(seed)
+        self.folder = folder
+        self.actors = sorted(
+            {f"{first} {last}" for first in _FIRST_NAMES for last in _LAST_NAMES}
+        )
+        self.rng.shuffle(self.actors)
+        # Zipf-like: a few actors appear in many videos.
+        self._actor_weights = [1 / (rank + 1) for rank in range(len(self.actors))]
+        self._paths: set[str] = set()
+
+    def filename(self, extension: str) -> str:
+        rng = self.rng
+        while True:
+            kind = rng.random()
+            if kind < 0.4:
+                show = _words(rng, rng.randint(1, 3)).title()
+                season = rng.randint(1, 8)
+                episode = rng.randint(1, 24)
+                pieces = (
+                    "series",
+                    show,
+                    f"Season {season:02}",
+                    f"{show} S{season:02}E{episode:02} {_words(rng, 2)}",
+                )
+            elif kind < 0.7:
+                title = _words(rng, rng.randint(1, 4)).title()
+                pieces = ("movies", f"{title} ({rng.randint(1950, 2025)})")
+            else:
+                pieces = (
+                    "clips",
+                    f"{rng.randint(2005, 2025)}-{rng.randint(1, 12):02}",
+                    f"{_words(rng, 2).replace(' ', '_')}_{rng.randint(0, 9999):04}",
+                )
+            path = AbsolutePath.join(
+                self.folder, *pieces[:-1], f"{pieces[-1]}.{extension}"
+            )
+            if path.path not in self._paths:
+                self._paths.add(path.path)
+                return path.path
+
+    def entry(self) -> VideoEntry:
+        rng = self.rng
+        extension, container_format, _ = _choose(rng, _CONTAINERS)
+        video_codec, video_codec_description, _ = _choose(rng, _VIDEO_CODECS)
+        audio_codec, audio_codec_description, _ = _choose(rng, _AUDIO_CODECS)
+        (width, height), kbit_rate, _ = _choose(rng, _RESOLUTIONS)
+        (frame_rate_num, frame_rate_den), _ = _choose(rng, _FRAME_RATES)
+        # Median around 20 minutes, from a few seconds to several hours.
+        seconds = min(max(rng.lognormvariate(7.1, 1.0), 5.0), 6 * 3600.0)
+        video_size = int(seconds * (kbit_rate + 128) * 1000 / 8)
+        nb_audio = _choose(rng, ((0, 5), (1, 80), (2, 12), (3, 3)))[0]
+        return VideoEntry(
+            filename=self.filename(extension),
+            file_size=max(1, video_size // FILE_SIZE_SCALE),
+            audio_bit_rate=128000 if nb_audio else 0,
+            audio_bits=16 if nb_audio else 0,
+            audio_codec=audio_codec if nb_audio else "",
+            audio_codec_description=audio_codec_description if nb_audio else "",
+            bit_depth=8,
+            channels=2 if nb_audio else 0,
+            container_format=container_format,
+            duration=round(seconds * 1000),
+            duration_time_base=1000,
+            frame_rate_den=frame_rate_den,
+            frame_rate_num=frame_rate_num,
+            height=height,
+            meta_title=_words(rng, rng.randint(2, 5)).title()
+            if rng.random() < 0.5
+            else "",
+            sample_rate=48000 if nb_audio else 0,
+            video_codec=video_codec,
+            video_codec_description=video_codec_description,
+            width=width,
+            mtime=rng.uniform(1.2e9, 1.75e9),
+            audio_languages=rng.sample(_LANGUAGES, nb_audio),
+            subtitle_languages=rng.sample(_LANGUAGES, rng.choice((0, 0, 1, 2))),
+        )
+
+    def thumbnail_seed(self) -> bytes:
+        # A tiny random image, upscaled to a smooth thumbnail.
+        return self.rng.randbytes(8 * 6 * 3)
+
+    def similar_seed(self, seed: bytes) -> bytes:
+        rng = self.rng
+        return bytes(min(255, max(0, value + rng.randint(-6, 6))) for value in seed)
+
+    def properties(self) -> dict[str, list]:
+        rng = self.rng
+        properties = {
+            "category": rng.sample(
+                _CATEGORIES, _choose(rng, ((1, 70), (2, 25), (3, 5)))[0]
+            ),
+            "actor": sorted(
+                set(
+                    rng.choices(
+                        self.actors,
+                        weights=self._actor_weights,
+                        k=_choose(rng, ((0, 30), (1, 40), (2, 20), (3, 10)))[0],
+                    )
+                )
+            ),
+            "watched": [rng.random() < 0.3],
+        }
+        if rng.random() < 0.4:
+            properties["rating"] = [rng.randint(1, 5)]
+        return properties
+
+
+def render_thumbnail(seed: bytes) -> bytes:
+    """Render an 8x6 RGB seed image into a JPEG thumbnail BLOB."""
+    image = Image.frombytes("RGB", (8, 6), seed).resize(
+        THUMBNAIL_SIZE, Image.Resampling.BICUBIC
+    )
+    output = io.BytesIO()
+    image.save(output, format="JPEG", quality=80)
+    return output.getvalue()
+
+
+def generate_collection(
+    path: PathType, size: int, seed: int = 0, notifier=DEFAULT_NOTIFIER
+) -> PysaurusCollection:
+    """Generate a synthetic collection of `size` videos in a new folder."""
+    folder = AbsolutePath.ensure(path)
+    if folder.exists():
+        raise FileExistsError(folder)
+    video_folder = AbsolutePath.join(folder, VIDEO_FOLDER).mkdir()
+    generator = _SyntheticGenerator(seed, video_folder)
+    rng = generator.rng
+
+    entries: list[VideoEntry] = []
+    missing: set[str] = set()
+    while len(entries) < size:
+        entry = generator.entry()
+        entries.append(entry)
+        draw = rng.random()
+        if draw < NOT_FOUND_RATIO:
+            missing.add(entry.filename)
+        elif draw < NOT_FOUND_RATIO + UNREADABLE_RATIO:
+            entry.unreadable = True
+            entry.errors = [rng.choice(_ERRORS)]
+        elif draw < NOT_FOUND_RATIO + UNREADABLE_RATIO + MOVED_RATIO and (
+            len(entries) < size
+        ):
+            # Moved: old entry is not found, new one is a copy elsewhere.
+            moved = generator.entry()
+            moved.file_size = entry.file_size
+            moved.duration = entry.duration
+            moved.duration_time_base = entry.duration_time_base
+            entries.append(moved)
+            missing.add(entry.filename)
+
+    # Create placeholder files, then collect their actual size and mtime.
+    for entry in entries:
+        if entry.filename not in missing:
+            file_path = AbsolutePath(entry.filename)
+            file_path.get_directory().mkdir()
+            with open(file_path.path, "wb") as file:
+                file.truncate(entry.file_size)
+    runtime_info: dict[AbsolutePath, VideoRuntimeInfo] = {}
+    scan_path_for_videos(video_folder, runtime_info)
+    for entry in entries:
+        if entry.filename in missing:
+            runtime_info[AbsolutePath(entry.filename)] = VideoRuntimeInfo(
+                size=entry.file_size, mtime=entry.mtime
+            )
+
+    # Thumbnails of readable videos, with groups of near-duplicates.
+    readable = [entry.filename for entry in entries if not entry.unreadable]
+    thumbnails: dict[str, bytes] = {}
+    nb_similar = int(len(readable) * SIMILAR_RATIO)
+    similar = rng.sample(readable, nb_similar)
+    while similar:
+        group_size = min(len(similar), rng.randint(2, 4))
+        group, similar = similar[:group_size], similar[group_size:]
+        group_seed = generator.thumbnail_seed()
+        for filename in group:
+            thumbnails[filename] = render_thumbnail(generator.similar_seed(group_seed))
+    for filename in readable:
+        if filename not in thumbnails:
+            thumbnails[filename] = render_thumbnail(generator.thumbnail_seed())
+
+    collection = PysaurusCollection(folder, folders=[video_folder], notifier=notifier)
+    with collection.batch():
+        collection.videos_add(entries, runtime_info)
+        collection.prop_type_add("category", "str", "", True)
+        collection.prop_type_add("actor", "str", "", True)
+        collection.prop_type_add("rating", "int", 0, False)
+        collection.prop_type_add("watched", "bool", False, False)
+        filename_to_video_id = {
+            video.filename.path: video.video_id
+            for video in collection.get_videos(include=["video_id", "filename"])
+        }
+        collection.db.modify_many(
+            "INSERT INTO video_thumbnail (video_id, thumbnail) VALUES (?, ?)",
+            (
+                (filename_to_video_id[filename], thumbnail)
+                for filename, thumbnail in thumbnails.items()
+            ),
+        )
+        updates: dict[str, dict[int, list]] = {}
+        for entry in entries:
+            video_id = filename_to_video_id[entry.filename]
+            for name, values in generator.properties().items():
+                if values:
+                    updates.setdefault(name, {})[video_id] = values
+        for name, values in updates.items():
+            collection.videos_tag_set(name, values)
+    collection.thumbnails.invalidate(filename_to_video_id.values())
+
+    with open(AbsolutePath.join(folder, SYNTHETIC_INFO).path, "w") as file:
+        json.dump({"size": size, "seed": seed}, file)
+    return collection
+
+
+def open_collection(
+    path: PathType, size: int, seed: int = 0, notifier=DEFAULT_NOTIFIER
+) -> PysaurusCollection:
+    """Open synthetic collection at given path, generating it if needed.
+
+    Raise an error if path contains another collection.
+    """
+    folder = AbsolutePath.ensure(path)
+    if not folder.exists():
+        return generate_collection(folder, size, seed, notifier)
+    info_path = AbsolutePath.join(folder, SYNTHETIC_INFO)
+    info = None
+    if info_path.isfile():
+        with open(info_path.path) as file:
+            info = json.load(file)
+    if info != {"size": size, "seed": seed}:
+        raise FileExistsError(f"Not a synthetic collection of {size} videos: {folder}")
+    return PysaurusCollection(folder, notifier=notifier)
@@ -1,4 +1,5 @@
 import functools
+import json
 import locale
 from abc import abstractmethod
 from io import StringIO
@@ -258,13 +259,14 @@ class Selector:
             return [element for element in data if element in self._selection]
 
     def to_sql(self, field: str):
-        selection = list(self._selection)
-        placeholders = ",".join(["?"] * len(selection))
-        if self._to_exclude:
-            query = f"{field} NOT IN ({placeholders})"
-        else:
-            query = f"{field} IN ({placeholders})"
-        return query, selection
+        """Return SQL condition and parameters matching selected values.
+
+        Selection is passed as one JSON array parameter read with
+        `json_each`, so that query does not depend on selection size.
+        """
+        operator = "NOT IN" if self._to_exclude else "IN"
+        query = f"{field} {operator} (SELECT value FROM json_each(?))"
+        return query, [json.dumps(list(self._selection))]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert selector to dictionary format for backend API."""
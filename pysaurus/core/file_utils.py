@@ -1,21 +1,76 @@
-from typing import Iterable
+from typing import Iterable, Iterator
+from xml.sax.saxutils import escape
 
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.functions import generate_temporary_file
 
+# A playlist entry: (path, title, duration in seconds).
+PlaylistEntry = tuple[AbsolutePath, str, float]
 
-def create_xspf_playlist(paths: Iterable[AbsolutePath], output=None) -> AbsolutePath:
-    tracks = "".join(
-        f"<track><location>{filename.uri}</location></track>" for filename in paths
-    )
-    file_content = (
-        f'<?xml version="1.0" encoding="UTF-8"?>'
-        f'<playlist version="1" xmlns="http://xspf.org/ns/0/">'
-        f"<trackList>{tracks}</trackList>"
-        f"</playlist>"
+
+def iter_xspf_playlist(entries: Iterable[PlaylistEntry]) -> Iterator[str]:
+    """Yield XSPF playlist text, one track at a time."""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<playlist version="1" xmlns="http://xspf.org/ns/0/">\n'
+        "<trackList>\n"
     )
+    for path, title, duration in entries:
+        yield (
+            f"<track>"
+            f"<location>{escape(path.uri)}</location>"
+            f"<title>{escape(title)}</title>"
+            f"<duration>{round(duration * 1000)}</duration>"
+            f"</track>\n"
+        )
+    yield "</trackList>\n</playlist>\n"
+
+
+def iter_m3u8_playlist(entries: Iterable[PlaylistEntry]) -> Iterator[str]:
+    """Yield extended M3U playlist text (UTF-8), one track at a time."""
+    yield "#EXTM3U\n"
+    for path, title, duration in entries:
+        # Titles must fit on EXTINF line.
+        title = " ".join(title.split())
+        yield f"#EXTINF:{round(duration)},{title}\n{path.standard_path}\n"
+
+
+# Playlist format => (text generator, mimetype)
+PLAYLIST_FORMATS = {
+    "xspf": (iter_xspf_playlist, "application/xspf+xml"),
+    "m3u8": (iter_m3u8_playlist, "audio/x-mpegurl"),
+}
+
+
+def iter_playlist(
+    entries: Iterable[PlaylistEntry], fmt: str = "xspf", chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """Yield playlist as UTF-8 chunks of about `chunk_size` bytes.
+
+    Entries are consumed lazily, so memory does not depend on
+    playlist size. Used both to write files and to stream HTTP responses.
+    """
+    generator, _ = PLAYLIST_FORMATS[fmt]
+    buffer = []
+    size = 0
+    for text in generator(entries):
+        data = text.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def write_playlist(
+    entries: Iterable[PlaylistEntry], output=None, fmt: str = "xspf"
+) -> AbsolutePath:
+    """Write playlist to output file (a temporary file by default)."""
     if output is None:
-        output = generate_temporary_file(basename="playlist", suffix=".xspf")
-    with open(output, "w") as file:
-        file.write(file_content)
+        output = generate_temporary_file(basename="playlist", suffix=f".{fmt}")
+    with open(output, "wb") as file:
+        file.writelines(iter_playlist(entries, fmt))
     return AbsolutePath(output)
@@ -152,15 +152,6 @@ def apply_selector(selector: dict, data: Iterable, key: str, return_data=False):
     return output
 
 
-def apply_selector_to_data(selector: dict, data: Iterable) -> list:
-    if selector["all"]:
-        exclude = set(selector["exclude"])
-        output = [element for element in data if element not in exclude]
-    else:
-        output = selector["include"]
-    return output
-
-
 def generate_temporary_file(basename="pysaurus", suffix=".pkl"):
     """Generate a temporary file where data could be saved.
     Create an empty file without collision.
@@ -1,29 +1,57 @@
-import multiprocessing
+import queue
 import sys
 import threading
+import time
 from typing import Callable
 
-from pysaurus.core.datestring import Date
 from pysaurus.core.functions import do_nothing
 from pysaurus.core.job_notifications import AbstractNotifier
+from pysaurus.core.notification_bus import (
+    NotificationLog,
+    ProgressCoalescer,
+    WorkerPipe,
+)
 from pysaurus.core.notifications import Notification
 from pysaurus.interface.api.api_utils.console_notification_printer import (
     ConsoleNotificationPrinter,
 )
 
+# Seconds to wait for a notification before flushing log file.
+LOG_FLUSH_INTERVAL = 0.5
+
 
 class _InformationNotifier(AbstractNotifier):
-    __slots__ = ("_queue",)
+    __slots__ = ("_information",)
 
-    def __init__(self, shared_queue):
-        self._queue = shared_queue
+    def __init__(self, information: "Information"):
+        self._information = information
 
     def notify(self, notification):
-        self._queue.put_nowait(notification)
+        self._information._queue.put(notification)
+
+    def __reduce__(self):
+        # Notifier is pickled to be sent to a pool worker:
+        # worker will notify through a pipe.
+        return self._information._worker_notifier().__reduce__()
 
 
 class Information:
-    __slots__ = ("_manager", "_queue", "_thread", "_callback", "_initialized")
+    """Notification bus.
+
+    Notifications are sent through an in-process queue (or through a pipe
+    from pool workers), then handled in a monitoring thread, where job
+    progress is coalesced before being passed to callback.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_pipe",
+        "_pipe_lock",
+        "_log",
+        "_thread",
+        "_callback",
+        "_initialized",
+    )
     __default__ = None
 
     def __new__(cls, *args, **kwargs):
@@ -36,8 +64,11 @@ class Information:
     def __init__(self):
         if not getattr(self, "_initialized", False):
             print("INIT INFORMATION", file=sys.stderr)
-            self._manager = multiprocessing.Manager()
-            self._queue = self._manager.Queue()
+            self._queue: queue.SimpleQueue = queue.SimpleQueue()
+            # Pipe is opened only when a notifier is sent to a pool worker.
+            self._pipe: WorkerPipe | None = None
+            self._pipe_lock = threading.Lock()
+            self._log = NotificationLog()
             self._thread = None
             self._callback = do_nothing
             self._initialized = True
@@ -45,6 +76,12 @@ class Information:
     def _set_callback(self, callback: Callable[[Notification], None] | None):
         self._callback = callback if callback is not None else do_nothing
 
+    def _worker_notifier(self):
+        with self._pipe_lock:
+            if self._pipe is None:
+                self._pipe = WorkerPipe(self._queue)
+            return self._pipe.notifier()
+
     def __enter__(self):
         if self._thread is None:
             th = threading.Thread(target=self._monitor)
@@ -57,18 +94,35 @@ class Information:
         self._queue.put(None)
         self._thread.join()
         self._thread = None
+        self._log.close()
 
     def _monitor(self):
         # We are in a thread, with notifications handled sequentially,
         # thus no need to be process-safe.
         print("Monitoring notifications ...")
         notification_printer = ConsoleNotificationPrinter()
+        coalescer = ProgressCoalescer()
+
+        def handle(notifications: list[Notification]):
+            for notification in notifications:
+                notification_printer.collect(notification)
+                self._callback(notification)
+
         while True:
-            notification = self._queue.get()
+            timeout = coalescer.timeout(time.monotonic())
+            try:
+                notification = self._queue.get(
+                    timeout=LOG_FLUSH_INTERVAL if timeout is None else timeout
+                )
+            except queue.Empty:
+                handle(coalescer.due(time.monotonic()))
+                self._log.flush()
+                continue
             if notification is None:
+                handle(coalescer.flush())
                 break
-            notification_printer.collect(notification)
-            self._callback(notification)
+            handle(coalescer.push(notification, time.monotonic()))
+        self._log.flush()
         print("End monitoring.")
 
     @classmethod
@@ -83,9 +137,8 @@ class Information:
 
     @classmethod
     def notifier(cls) -> _InformationNotifier:
-        return _InformationNotifier(cls._get()._queue)
+        return _InformationNotifier(cls._get())
 
-    @staticmethod
-    def log(filename: str, something):
-        with open(filename, "a", encoding="utf-8") as file:
-            file.write(f"[{Date.now()}] {something}\n")
+    @classmethod
+    def log(cls, filename: str, something):
+        cls._get()._log.write(filename, something)
@@ -2,7 +2,6 @@ import base64
 from io import BytesIO
 from typing import Any, Iterable, cast
 
-import numpy as np
 from PIL import Image
 
 from pysaurus.core.classes import AbstractMatrix
@@ -18,6 +17,8 @@ class NumpyMiniature:
     def __init__(
         self, r: Bytes, g: Bytes, b: Bytes, width: int, height: int, identifier
     ):
+        import numpy as np
+
         self.width = width
         self.height = height
         self.r = np.asarray(r, dtype=np.float32).reshape((height, width))
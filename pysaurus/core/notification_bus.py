@@ -0,0 +1,208 @@
+"""
+Building blocks for notification transport used by `Information`.
+
+- Threads notify through a plain in-process queue.
+- Pool workers get a `PipeNotifier` (a pickled notifier is converted to it),
+  which sends notifications to a `WorkerPipe` listening in main process.
+- `ProgressCoalescer` throttles job progress before notifications are handled.
+- `NotificationLog` keeps log file open and buffers writes.
+"""
+
+import math
+import os
+import queue
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any
+
+from pysaurus.core.datestring import Date
+from pysaurus.core.job_notifications import AbstractNotifier, JobStep, JobToDo
+from pysaurus.core.notifications import Notification
+
+
+class ProgressCoalescer:
+    """Coalesce job progress notifications.
+
+    JobStep notifications are held per job and channel (last value wins),
+    and pending steps of a job are released at most once per `interval`
+    seconds. A step completing a job is released immediately. Any other
+    notification releases all pending steps first, so that order between
+    progress and other notifications is kept.
+    """
+
+    __slots__ = ("interval", "_totals", "_pending", "_released")
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        # job name => (job total, step per channel)
+        self._totals: dict[str, tuple[int, dict[Any, int]]] = {}
+        self._pending: dict[tuple[str, Any], JobStep] = {}
+        # job name => last release time
+        self._released: dict[str, float] = {}
+
+    def push(self, notification: Notification, now: float) -> list[Notification]:
+        """Add a notification and return notifications to handle now."""
+        if not isinstance(notification, JobStep):
+            output = self.flush()
+            if isinstance(notification, JobToDo):
+                self._totals[notification.name] = (notification.total, {})
+            output.append(notification)
+            return output
+        name = notification.name
+        self._pending[(name, notification.channel)] = notification
+        if name in self._totals:
+            total, channels = self._totals[name]
+            channels[notification.channel] = notification.step
+            done = sum(channels.values()) >= total
+        else:
+            done = notification.step >= notification.total
+        if done:
+            self._totals.pop(name, None)
+            output = self._release(name, now)
+            del self._released[name]
+        elif now - self._released.get(name, -math.inf) >= self.interval:
+            output = self._release(name, now)
+        else:
+            output = []
+        output.extend(self.due(now))
+        return output
+
+    def due(self, now: float) -> list[Notification]:
+        """Return pending steps whose job was not released for `interval`."""
+        names = dict.fromkeys(
+            name
+            for name, _ in self._pending
+            if now - self._released.get(name, -math.inf) >= self.interval
+        )
+        return [step for name in names for step in self._release(name, now)]
+
+    def timeout(self, now: float) -> float | None:
+        """Return delay before next pending step is due, or None if none."""
+        if not self._pending:
+            return None
+        return max(
+            0.0,
+            min(
+                self._released.get(name, -math.inf) + self.interval - now
+                for name, _ in self._pending
+            ),
+        )
+
+    def flush(self) -> list[Notification]:
+        """Return all pending steps."""
+        output = list(self._pending.values())
+        self._pending.clear()
+        return output
+
+    def _release(self, name: str, now: float) -> list[Notification]:
+        keys = [key for key in self._pending if key[0] == name]
+        self._released[name] = now
+        return [self._pending.pop(key) for key in keys]
+
+
+class NotificationLog:
+    """Log file kept open, with buffered writes.
+
+    Previous file is closed when notifications are logged to another file
+    (e.g. when another database is opened).
+    """
+
+    __slots__ = ("_filename", "_file", "_lock")
+
+    def __init__(self):
+        self._filename: str | None = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def write(self, filename: str, something) -> None:
+        with self._lock:
+            if filename != self._filename:
+                self._close()
+                self._file = open(filename, "a", encoding="utf-8")
+                self._filename = filename
+            self._file.write(f"[{Date.now()}] {something}\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._filename = None
+
+
+class WorkerPipe:
+    """Receive notifications sent by pool workers into a queue.
+
+    Listener accepts one connection per worker process. Threads are daemons,
+    and a connection is dropped when its worker exits.
+    """
+
+    __slots__ = ("address", "authkey", "_queue", "_listener")
+
+    def __init__(self, output: queue.SimpleQueue):
+        self.authkey = os.urandom(32)
+        self._queue = output
+        self._listener = Listener(authkey=self.authkey)
+        self.address = self._listener.address
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def notifier(self) -> "PipeNotifier":
+        return PipeNotifier(self.address, self.authkey)
+
+    def _accept(self):
+        while True:
+            try:
+                connection = self._listener.accept()
+            except AuthenticationError:
+                continue
+            except OSError:
+                break
+            threading.Thread(
+                target=self._receive, args=(connection,), daemon=True
+            ).start()
+
+    def _receive(self, connection: Connection):
+        with connection:
+            try:
+                while True:
+                    self._queue.put(connection.recv())
+            except (EOFError, OSError):
+                pass
+
+
+# Worker connections, one per process and address, opened on first
+# notification. Process ID is part of key, so that a forked process
+# does not share connection inherited from its parent.
+_WORKER_CONNECTIONS: dict[tuple[int, Any], Connection] = {}
+_WORKER_LOCK = threading.Lock()
+
+
+class PipeNotifier(AbstractNotifier):
+    """Notifier used in pool workers. Sends notifications to a WorkerPipe."""
+
+    __slots__ = ("address", "authkey")
+
+    def __init__(self, address, authkey: bytes):
+        self.address = address
+        self.authkey = authkey
+
+    def __reduce__(self):
+        return type(self), (self.address, self.authkey)
+
+    def notify(self, notification):
+        key = (os.getpid(), self.address)
+        with _WORKER_LOCK:
+            connection = _WORKER_CONNECTIONS.get(key)
+            if connection is None:
+                connection = Client(self.address, authkey=self.authkey)
+                _WORKER_CONNECTIONS[key] = connection
+            connection.send(notification)
@@ -3,6 +3,7 @@ import os
 from multiprocessing import Pool
 from typing import Any, Callable, Iterable, Sized
 
+from pysaurus.core import tracing
 from pysaurus.core.job_notifications import AbstractNotifier
 
 CPU_COUNT = os.cpu_count() or 1
@@ -57,6 +58,11 @@ def parallelize(
         # Assume tasks is an iterable of non-expandable elements
         run = function
 
+    tracer = tracing.get_tracer()
+    if tracer is not None:
+        # Trace each call in workers, then merge traces in this process.
+        run = tracing.TracedFunction(run)
+
     if notifier:
         if isinstance(tasks, Sized):
             nb_tasks = len(tasks)
@@ -67,7 +73,10 @@ def parallelize(
             assert ordered
             notifier.task(run, nb_tasks, kind or "task(s)")
             with Pool(cpu_count) as p:
-                for i, result in enumerate(p.imap(run, tasks, chunksize=chunksize)):
+                results = p.imap(run, tasks, chunksize=chunksize)
+                if tracer is not None:
+                    results = tracing.merge_traced_results(results, tracer)
+                for i, result in enumerate(results):
                     yield result
                     if (i + 1) % progress_step == 0 or i + 1 == nb_tasks:
                         notifier.progress(run, i + 1, nb_tasks)
@@ -81,4 +90,7 @@ def parallelize(
 
     with Pool(cpu_count) as p:
         mapper = p.imap if ordered else p.imap_unordered
-        yield from mapper(wrapped_run, wrapped_tasks, chunksize=chunksize)
+        results = mapper(wrapped_run, wrapped_tasks, chunksize=chunksize)
+        if tracer is not None:
+            results = tracing.merge_traced_results(results, tracer)
+        yield from results
@@ -1,5 +1,6 @@
 import functools
 
+from pysaurus.core import tracing
 from pysaurus.core.duration import Duration
 from pysaurus.core.informer import Information
 from pysaurus.core.notifications import ProfilingEnd, ProfilingStart
@@ -7,21 +8,24 @@ from pysaurus.core.perf_counter import PerfCounter
 
 
 class Profiler(PerfCounter):
-    __slots__ = "_title", "_notifier", "_inline"
+    __slots__ = "_title", "_notifier", "_inline", "_span"
 
     def __init__(self, title, notifier=None, inline=False):
         self._title = title
         self._notifier = notifier or Information.notifier()
         self._inline = inline
+        self._span = tracing.span(str(title))
         super().__init__()
 
     def __enter__(self):
         if not self._inline:
             self._notifier.notify(ProfilingStart(self._title))
+        self._span.__enter__()
         return super().__enter__()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         super().__exit__(exc_type, exc_val, exc_tb)
+        self._span.__exit__(exc_type, exc_val, exc_tb)
         self._notifier.notify(
             ProfilingEnd(self._title, Duration(self.microseconds), inline=self._inline)
         )
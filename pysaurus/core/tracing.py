@@ -0,0 +1,327 @@
+"""
+Performance tracing: nested spans and counters.
+
+Tracing is disabled by default. Then `span()` returns a shared no-op
+context manager and `count()` returns immediately, so instrumented code
+costs only a global lookup.
+
+Once enabled with `start()`:
+
+- spans are recorded per process and thread (`Profiler` records a span too);
+- counters (e.g. rows fetched, files stat'ed, bytes read) are summed;
+- functions run by `parallelize()` are traced in workers, and their spans
+  and counters are merged into main trace when results come back;
+- each top-level span may be appended to a rolling perf log (JSON lines).
+
+Trace can be exported to Chrome trace-event JSON, readable with
+chrome://tracing or https://ui.perfetto.dev
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+
+from pysaurus.core.absolute_path import AbsolutePath, PathType
+from pysaurus.core.datestring import Date
+
+
+class PerfLog:
+    """Rolling log of top-level spans, one JSON object per line.
+
+    When file exceeds `max_bytes`, it is moved to `<path>.1`
+    (replacing previous one) and a new file is started.
+    """
+
+    __slots__ = ("path", "max_bytes", "_lock")
+
+    def __init__(self, path: PathType, max_bytes: int = 1024 * 1024):
+        self.path = AbsolutePath.ensure(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            path = self.path.path
+            if os.path.isfile(path) and os.path.getsize(path) >= self.max_bytes:
+                os.replace(path, f"{path}.1")
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(line)
+
+    def read(self) -> list[dict[str, Any]]:
+        """Return logged records, oldest first."""
+        records = []
+        for path in (f"{self.path.path}.1", self.path.path):
+            if os.path.isfile(path):
+                with open(path, encoding="utf-8") as file:
+                    records.extend(json.loads(line) for line in file if line.strip())
+        return records
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "_start", "_top_counters")
+
+    def __init__(self, tracer: "Tracer", name: str, args: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self._start = 0
+        self._top_counters: dict[str, int] | None = None
+
+    def __enter__(self):
+        self._top_counters = self.tracer._open_span()
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._close_span(self, self._start, end, self._top_counters)
+
+
+class Tracer:
+    """Collect spans and counters of current process."""
+
+    __slots__ = (
+        "pid",
+        "events",
+        "counters",
+        "perf_log",
+        "_origin_ns",
+        "_origin_us",
+        "_emitted_counters",
+        "_threads",
+        "_local",
+        "_lock",
+    )
+
+    def __init__(self, perf_log: PerfLog | None = None):
+        self.pid = os.getpid()
+        self.events: list[dict[str, Any]] = []
+        self.counters: dict[str, int] = {}
+        self.perf_log = perf_log
+        # Timestamps are microseconds since epoch, measured with perf counter
+        # from an origin, so that spans from other processes can be merged.
+        self._origin_ns = time.perf_counter_ns()
+        self._origin_us = time.time_ns() / 1000
+        self._emitted_counters: dict[str, int] = {}
+        self._threads: dict[tuple[int, int], str] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _timestamp(self, perf_ns: int) -> float:
+        return self._origin_us + (perf_ns - self._origin_ns) / 1000
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def _open_span(self) -> dict[str, int] | None:
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        if depth == 0 and self.perf_log is not None:
+            with self._lock:
+                return dict(self.counters)
+        return None
+
+    def _close_span(
+        self, span: _Span, start: int, end: int, top_counters: dict | None
+    ) -> None:
+        self._local.depth -= 1
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "ph": "X",
+            "ts": self._timestamp(start),
+            "dur": (end - start) / 1000,
+            "pid": self.pid,
+            "tid": thread.ident,
+        }
+        if span.args:
+            event["args"] = span.args
+        with self._lock:
+            self._threads.setdefault((self.pid, thread.ident), thread.name)
+            self.events.append(event)
+            self._emit_counters(self._timestamp(end))
+            if top_counters is not None:
+                counters = {
+                    name: value - top_counters.get(name, 0)
+                    for name, value in self.counters.items()
+                    if value != top_counters.get(name, 0)
+                }
+        if top_counters is not None:
+            self.perf_log.append(
+                {
+                    "date": str(Date.now()),
+                    "name": span.name,
+                    "ms": event["dur"] / 1000,
+                    "counters": counters,
+                    **({"args": span.args} if span.args else {}),
+                }
+            )
+
+    def _emit_counters(self, timestamp: float) -> None:
+        if self.counters != self._emitted_counters:
+            self._emitted_counters = dict(self.counters)
+            self.events.append(
+                {
+                    "name": "counters",
+                    "ph": "C",
+                    "ts": timestamp,
+                    "pid": self.pid,
+                    "args": self._emitted_counters,
+                }
+            )
+
+    def export(self) -> tuple[list[dict], dict[str, int], dict]:
+        """Return (events, counters, thread names), e.g. to send them back
+        from a worker process."""
+        with self._lock:
+            return list(self.events), dict(self.counters), dict(self._threads)
+
+    def merge(self, state: tuple[list[dict], dict[str, int], dict]) -> None:
+        """Merge state exported by another tracer."""
+        events, counters, threads = state
+        with self._lock:
+            # Counters are merged into main process counters track.
+            self.events.extend(event for event in events if event["ph"] != "C")
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for key, thread_name in threads.items():
+                self._threads.setdefault(key, thread_name)
+            self._emit_counters(self._timestamp(time.perf_counter_ns()))
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["ts"])
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+                for (pid, tid), thread_name in self._threads.items()
+            ]
+            metadata.extend(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "args": {
+                        "name": "pysaurus" if pid == self.pid else f"worker {pid}"
+                    },
+                }
+                for pid in sorted({pid for pid, _ in self._threads})
+            )
+            return {
+                "traceEvents": metadata + events,
+                "displayTimeUnit": "ms",
+                "otherData": {"counters": dict(self.counters)},
+            }
+
+    def save(self, path: PathType) -> AbsolutePath:
+        """Save trace as Chrome trace-event JSON file."""
+        path = AbsolutePath.ensure(path)
+        with open(path.path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(), file)
+        return path
+
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer | None:
+    """Return current tracer, or None if tracing is disabled."""
+    return _tracer
+
+
+def start(perf_log: PathType | None = None) -> Tracer:
+    """Enable tracing, with an optional perf log path."""
+    global _tracer
+    _tracer = Tracer(PerfLog(perf_log) if perf_log is not None else None)
+    return _tracer
+
+
+def stop() -> Tracer | None:
+    """Disable tracing and return tracer used until now."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+@contextmanager
+def recording(perf_log: PathType | None = None) -> Iterator[Tracer]:
+    """Enable tracing in a context. Previous tracer is restored on exit."""
+    global _tracer
+    previous = _tracer
+    tracer = start(perf_log)
+    try:
+        yield tracer
+    finally:
+        _tracer = previous
+
+
+def span(name: str, **args):
+    """Return a context manager recording a span, if tracing is enabled."""
+    if _tracer is None:
+        return _NO_SPAN
+    return _Span(_tracer, name, args)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add value to a counter, if tracing is enabled."""
+    if _tracer is not None:
+        _tracer.count(name, value)
+
+
+class TracedFunction:
+    """Function wrapper tracing a call in a worker process.
+
+    Returns (result, exported trace), to be unwrapped in main process
+    with `merge_traced_results()`.
+    """
+
+    __slots__ = ("function", "__name__")
+
+    def __init__(self, function):
+        self.function = function
+        self.__name__ = getattr(function, "__name__", "")
+
+    def __call__(self, task):
+        global _tracer
+        # In a forked worker, a copy of main tracer may be inherited:
+        # use a fresh one, so that only this call is sent back.
+        previous = _tracer
+        tracer = _tracer = Tracer()
+        try:
+            with _Span(tracer, self.__name__ or "task", {}):
+                result = self.function(task)
+        finally:
+            _tracer = previous
+        return result, tracer.export()
+
+
+def merge_traced_results(results: Iterable[tuple[Any, tuple]], tracer: Tracer):
+    """Yield results from TracedFunction calls, merging their traces."""
+    for result, state in results:
+        tracer.merge(state)
+        yield result
@@ -1,3 +1,4 @@
+import contextlib
 import enum
 import logging
 from abc import ABC, abstractmethod
@@ -11,7 +12,12 @@ from pysaurus.core.notifying import DEFAULT_NOTIFIER
 from pysaurus.database.database_algorithms import DatabaseAlgorithms
 from pysaurus.database.database_operations import DatabaseOperations
 from pysaurus.database.db_paths import Basename, DatabasePaths
-from pysaurus.database.db_utils import DatabaseSaved, DatabaseToSaveContext
+from pysaurus.database.db_thumbnails import ThumbnailService
+from pysaurus.database.db_utils import (
+    DatabaseSaved,
+    DatabaseToSaveContext,
+    VideoStatusCounts,
+)
 from pysaurus.dbview.view_context import ViewContext
 from pysaurus.properties.properties import PropRawType, PropType, PropUnitType
 from pysaurus.video.video_entry import VideoEntry
@@ -23,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 DB_LOG_PATH = Basename("log_path", "log")
 DB_MINIATURES_PATH = Basename("miniatures_path", "miniatures.json")
+DB_PERF_LOG_PATH = Basename("perf_log_path", "perf.jsonl")
 
 
 class Change(enum.StrEnum):
@@ -56,7 +63,7 @@ class AbstractDatabase(ABC):
     - Subclass optimizations still work via delegation
     """
 
-    __slots__ = ("ways", "notifier", "in_save_context", "app_dir")
+    __slots__ = ("ways", "notifier", "in_save_context", "app_dir", "thumbnails")
     action = Change
 
     def __init__(
@@ -67,10 +74,13 @@ class AbstractDatabase(ABC):
         app_dir: AbsolutePath | None = None,
     ):
         db_folder = AbsolutePath.ensure(db_folder).assert_dir()
-        self.ways = DatabasePaths(db_folder, (DB_LOG_PATH, DB_MINIATURES_PATH))
+        self.ways = DatabasePaths(
+            db_folder, (DB_LOG_PATH, DB_MINIATURES_PATH, DB_PERF_LOG_PATH)
+        )
         self.notifier = notifier
         self.in_save_context = False
         self.app_dir = app_dir
+        self.thumbnails = ThumbnailService(self)
 
     def get_database_folder(self) -> AbsolutePath:
         return self.ways.db_folder
@@ -81,6 +91,10 @@ class AbstractDatabase(ABC):
     def get_miniatures_path(self) -> AbsolutePath:
         return self.ways.get_path(DB_MINIATURES_PATH)
 
+    def get_perf_log_path(self) -> AbsolutePath:
+        """Return path of rolling perf log, written while tracing is enabled."""
+        return self.ways.get_path(DB_PERF_LOG_PATH)
+
     @abstractmethod
     def _set_date(self, date: Date):
         raise NotImplementedError()
@@ -135,6 +149,27 @@ class AbstractDatabase(ABC):
     def has_videos(self, *, where: dict | None = None) -> bool:
         raise NotImplementedError()
 
+    def get_status_counts(self) -> VideoStatusCounts:
+        """Return number of videos for each video status.
+
+        Used by DatabaseLoaded/DatabaseSaved notifications. Default
+        implementation runs one count per status. Subclasses should
+        read maintained counters instead.
+        """
+        return VideoStatusCounts(
+            {
+                status: self.count_videos(
+                    where={
+                        "discarded": status[0],
+                        "unreadable": status[1],
+                        "found": status[2],
+                        "with_thumbnails": status[3],
+                    }
+                )
+                for status in VideoStatusCounts.statuses()
+            }
+        )
+
     @abstractmethod
     def query_videos(
         self,
@@ -150,6 +185,59 @@ class AbstractDatabase(ABC):
         """
         raise NotImplementedError()
 
+    def resolve_view_columns(
+        self,
+        view: ViewContext,
+        columns: Sequence[str],
+        selector: Selector | None = None,
+    ) -> Iterable[tuple]:
+        """Yield given video columns for each video of view, in view order.
+
+        Meant for bulk actions on a whole view (or a selection in view),
+        which only need a few columns. Default implementation queries
+        whole view. Subclasses should override it to read only given
+        columns.
+        """
+        context = self.query_videos(view, 0, 0, selector)
+        for video in context.result:
+            yield tuple(getattr(video, column) for column in columns)
+
+    def resolve_view_ids(
+        self, view: ViewContext, selector: Selector | None = None
+    ) -> list[int]:
+        """Return IDs of videos in view (or in selection), in view order."""
+        return [
+            video_id
+            for (video_id,) in self.resolve_view_columns(view, ["video_id"], selector)
+        ]
+
+    def set_sql_stats(self, enabled: bool) -> bool:
+        """Enable or disable SQL statement statistics.
+
+        Return False if backend does not record them.
+        """
+        return False
+
+    def get_sql_stats_report(self) -> str | None:
+        """Return SQL statement statistics report, or None if not recorded."""
+        return None
+
+    def get_thumbnails(self, video_ids: Collection[int]) -> dict[int, bytes]:
+        """Return thumbnails for given video IDs, skipping videos without one.
+
+        Used by `self.thumbnails` cache. Subclasses may override
+        to read thumbnail storage directly.
+        """
+        if not video_ids:
+            return {}
+        return {
+            video.video_id: video.thumbnail
+            for video in self.get_videos(
+                include=["video_id", "thumbnail"], where={"video_id": list(video_ids)}
+            )
+            if video.thumbnail
+        }
+
     @abstractmethod
     def videos_get_terms(self) -> dict[int, list[str]]:
         raise NotImplementedError()
@@ -244,11 +332,20 @@ class AbstractDatabase(ABC):
         """Save database after fields were modified."""
         self.save()
 
+    def batch(self):
+        """Return a context grouping all writes into one unit of work.
+
+        Do nothing by default. Databases supporting transactions
+        should commit writes once when leaving the context.
+        """
+        return contextlib.nullcontext(self)
+
     def to_save(self):
         """Return a save context.
 
         Save context forbids any save while in context,
         and make a save as long as we exit the context.
+        It also runs writes in a `batch()`.
 
         This is useful if a piece of code may generate many save calls
         while we just want one final save at the end.
@@ -6,7 +6,7 @@ from pysaurus.core.constants import THUMBNAIL_EXTENSION
 from pysaurus.core.informer import Information
 from pysaurus.core.language import say
 from pysaurus.core.modules import FNV64
-from pysaurus.core.parallelization import parallelize
+from pysaurus.core.parallelization import CPU_COUNT, parallelize
 from pysaurus.core.profiling import Profiler
 from pysaurus.video.video_file_lister import scan_path_for_videos
 from pysaurus.video.video_runtime_info import VideoRuntimeInfo
@@ -52,6 +52,9 @@ class Videos:
         filenames: list[AbsolutePath],
         need_thumbs: list[AbsolutePath],
         working_directory: str,
+        *,
+        cpu_count: int = CPU_COUNT,
+        chunksize: int = 1,
     ) -> list[VideoTaskResult]:
         hasher = FNV64()
         tasks = []
@@ -89,6 +92,8 @@ class Videos:
                 parallelize(
                     raptor.capture,
                     tasks,
+                    cpu_count=cpu_count,
+                    chunksize=chunksize,
                     ordered=False,
                     notifier=notifier,
                     kind="video(s)",
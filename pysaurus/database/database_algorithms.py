@@ -9,6 +9,7 @@ This class contains algorithms that:
 
 import logging
 import tempfile
+from collections import Counter
 from typing import Collection, Sequence
 
 import ujson as json
@@ -20,6 +21,7 @@ from pysaurus.core.datestring import Date
 from pysaurus.core.language import say
 from pysaurus.core.miniature import Miniature
 from pysaurus.core.modules import ImageUtils
+from pysaurus.core.parallelization import CPU_COUNT
 from pysaurus.core.profiling import Profiler
 from pysaurus.database.algorithms.folder_scan import FolderScanner, FolderScanResult
 from pysaurus.database.algorithms.miniatures import Miniatures
@@ -64,8 +66,12 @@ class DatabaseAlgorithms:
         return scanner.scan()
 
     @Profiler.profile_method()
-    def update(self) -> None:
-        """Scan folders and update database with new/modified videos."""
+    def update(self, *, cpu_count: int = CPU_COUNT, chunksize: int = 1) -> None:
+        """Scan folders and update database with new/modified videos.
+
+        Videos are probed in a pool of `cpu_count` processes,
+        sending them `chunksize` videos at once.
+        """
         with self.db.to_save():
             current_date = Date.now()
             all_files = Videos.get_runtime_info_from_paths(self.db.get_folders())
@@ -76,7 +82,13 @@ class DatabaseAlgorithms:
             expected_thumbs: dict[str, str] = {}
             thumb_errors: dict[str, Sequence[str]] = {}
             with tempfile.TemporaryDirectory() as tmp_dir:
-                for result in Videos.hunt(files_to_update, needing_thumbs, tmp_dir):
+                for result in Videos.hunt(
+                    files_to_update,
+                    needing_thumbs,
+                    tmp_dir,
+                    cpu_count=cpu_count,
+                    chunksize=chunksize,
+                ):
                     task = result.task
                     filename = task.filename
                     if task.need_info and task.thumb_path:
@@ -147,7 +159,7 @@ class DatabaseAlgorithms:
             file_name
             for file_name, file_info in file_paths.items()
             if not self.db.get_videos(
-                include=(),
+                include=["video_id"],
                 where={
                     "filename": file_name,
                     "mtime": file_info.mtime,
@@ -228,46 +240,24 @@ class DatabaseAlgorithms:
         return len(unique_moves)
 
     def get_unique_moves(self) -> list[tuple[int, int]]:
-        """Get list of unique video moves (1-to-1 mappings)."""
-        return [
+        """Get list of unique video moves (1-to-1 mappings).
+
+        Moves whose destination is also the only candidate of another source
+        are excluded, as a destination can receive only one entry.
+        """
+        moves = [
             (video_id, moves[0]["video_id"])
             for video_id, moves in self.db.videos_get_moves()
             if len(moves) == 1
         ]
+        nb_sources = Counter(to_id for _, to_id in moves)
+        return [(from_id, to_id) for from_id, to_id in moves if nb_sources[to_id] == 1]
 
     def move_video_entries(self, moves: list[tuple[int, int]]):
         """Move multiple video entries from not-found to found videos."""
         if not moves:
             return
-        from_indices = [move[0] for move in moves]
-        to_indices = [move[1] for move in moves]
-        from_map = {
-            row.video_id: row
-            for row in self.db.get_videos(
-                include=(
-                    "video_id",
-                    "similarity_id",
-                    "similarity_id_reencoded",
-                    "date_entry_modified",
-                    "date_entry_opened",
-                    "properties",
-                ),
-                where={"video_id": from_indices, "found": False},
-            )
-        }
-        assert all(from_id in from_map for from_id in from_indices)
-        assert set(to_indices) == set(
-            row.video_id
-            for row in self.db.get_videos(
-                include=["video_id"], where={"video_id": to_indices, "found": True}
-            )
-        )
-        # Refuse merges that would corrupt a unique property: carrying the source
-        # value onto a destination that already holds a *different* value for a
-        # multiple=False property would stack two values on it (and crash on the
-        # next read). Validate before opening the save context so a refused move
-        # writes nothing.
-        self._refuse_unique_property_conflicts(moves, from_map)
+        from_map = self._check_video_moves(moves)
         with self.db.to_save():
             to_properties: dict[str, dict[int | None, Collection[PropUnitType]]] = {}
             for from_id, to_id in moves:
@@ -303,9 +293,51 @@ class DatabaseAlgorithms:
                     for from_id, to_id in moves
                 },
             )
-            for from_id in from_indices:
+            for from_id, _ in moves:
                 self.db.video_entry_del(from_id)
 
+    def _check_video_moves(self, moves: list[tuple[int, int]]) -> dict:
+        """Check moves and return source videos (with properties), by video ID.
+
+        Sources must be not found videos, and destinations found videos,
+        each receiving only one source.
+        """
+        from_indices = [move[0] for move in moves]
+        to_indices = [move[1] for move in moves]
+        shared = sorted(
+            to_id for to_id, count in Counter(to_indices).items() if count > 1
+        )
+        if shared:
+            raise exceptions.SharedMoveDestination(shared)
+        from_map = {
+            row.video_id: row
+            for row in self.db.get_videos(
+                include=(
+                    "video_id",
+                    "similarity_id",
+                    "similarity_id_reencoded",
+                    "date_entry_modified",
+                    "date_entry_opened",
+                    "properties",
+                ),
+                where={"video_id": from_indices, "found": False},
+            )
+        }
+        assert all(from_id in from_map for from_id in from_indices)
+        assert set(to_indices) == set(
+            row.video_id
+            for row in self.db.get_videos(
+                include=["video_id"], where={"video_id": to_indices, "found": True}
+            )
+        )
+        # Refuse merges that would corrupt a unique property: carrying the source
+        # value onto a destination that already holds a *different* value for a
+        # multiple=False property would stack two values on it (and crash on the
+        # next read). Validate before opening the save context so a refused move
+        # writes nothing.
+        self._refuse_unique_property_conflicts(moves, from_map)
+        return from_map
+
     def _refuse_unique_property_conflicts(
         self, moves: list[tuple[int, int]], from_map: dict
     ) -> None:
@@ -371,13 +403,14 @@ class DatabaseAlgorithms:
             ):
                 from_new[video_id] = new_values
         if from_new:
-            self.db.videos_tag_set(from_name, from_new)
-            self.db.videos_tag_set(
-                to_name,
-                {video_id: to_extended for video_id in from_new},
-                action=self.db.action.ADD,
-            )
-            self.db._notify_fields_modified([from_name, to_name], is_property=True)
+            with self.db.to_save():
+                self.db.videos_tag_set(from_name, from_new)
+                self.db.videos_tag_set(
+                    to_name,
+                    {video_id: to_extended for video_id in from_new},
+                    action=self.db.action.ADD,
+                )
+                self.db._notify_fields_modified([from_name, to_name], is_property=True)
         return len(from_new)
 
     def delete_property_values(self, name: str, values: list) -> None:
@@ -403,7 +436,8 @@ class DatabaseAlgorithms:
                 next_values.add(new_value)
                 modified[video_id] = next_values
         if modified:
-            ops.set_property_for_videos(name, modified)
+            with self.db.to_save():
+                ops.set_property_for_videos(name, modified)
         return bool(modified)
 
     def fill_property_with_terms(self, prop_name: str, only_empty=False) -> None:
@@ -8,11 +8,12 @@ All methods delegate to AbstractDatabase abstract methods, allowing
 subclasses (like PysaurusCollection) to override them with optimized implementations.
 """
 
-from typing import Collection
+from typing import Collection, Iterator
 
 from pysaurus.application import exceptions
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.datestring import Date
+from pysaurus.core.file_utils import PlaylistEntry
 from pysaurus.core.path_tree import PathTree
 from pysaurus.properties.properties import PropUnitType
 from pysaurus.properties.property_value_modifier import PropertyValueModifier
@@ -71,6 +72,18 @@ class DatabaseOperations:
         (row,) = self.db.get_videos(include=["filename"], where={"video_id": video_id})
         return row.filename
 
+    def iter_playlist_entries(self, view) -> Iterator[PlaylistEntry]:
+        """Yield (path, title, duration in seconds) for each video in view.
+
+        Read lazily from a single query over view, so that a playlist
+        can be streamed without loading videos.
+        """
+        for filename, meta_title, duration, time_base in self.db.resolve_view_columns(
+            view, ["filename", "meta_title", "duration", "duration_time_base"]
+        ):
+            path = AbsolutePath.ensure(filename)
+            yield path, meta_title or path.file_title, duration / (time_base or 1)
+
     def open_video(self, video_id: int):
         """Open video file and mark as watched."""
         (video,) = self.db.get_videos(
@@ -87,17 +100,19 @@ class DatabaseOperations:
 
     def mark_as_read(self, video_id: int) -> bool:
         """Toggle watched status and return new value."""
-        (row,) = self.db.get_videos(where={"video_id": video_id})
+        (row,) = self.db.get_videos(include=["watched"], where={"video_id": video_id})
         self.db.videos_set_field("watched", {video_id: not row.watched})
         self.db._notify_fields_modified(["watched"])
-        (row,) = self.db.get_videos(where={"video_id": video_id})
+        (row,) = self.db.get_videos(include=["watched"], where={"video_id": video_id})
         return row.watched
 
     def toggle_watched_many(self, video_ids: set[int]) -> None:
         """Toggle watched status for multiple videos in a single batch."""
         if not video_ids:
             return
-        rows = self.db.get_videos(where={"video_id": video_ids})
+        rows = self.db.get_videos(
+            include=["video_id", "watched"], where={"video_id": video_ids}
+        )
         changes = {row.video_id: not row.watched for row in rows}
         self.db.videos_set_field("watched", changes)
         self.db._notify_fields_modified(["watched"])
@@ -0,0 +1,108 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+from pysaurus.core import tracing
+
+# Rough per-entry overhead, so that cached misses (None) still count.
+_ENTRY_OVERHEAD = 64
+
+
+class ThumbnailService:
+    """
+    LRU cache of thumbnail blobs, loaded out of band from page queries.
+
+    Page queries only fetch a thumbnail key (video ID + with_thumbnails flag).
+    Blobs are loaded here, in batches, through
+    `AbstractDatabase.get_thumbnails()`. Cache is bounded by total blob size.
+    Missing thumbnails are cached too, as None.
+    """
+
+    __slots__ = ("database", "max_bytes", "_entries", "_nb_bytes", "_lock")
+
+    def __init__(self, database, max_bytes: int = 32 * 1024 * 1024):
+        self.database = database
+        self.max_bytes = max_bytes
+        # video_id => (thumbnail, etag)
+        self._entries: OrderedDict[int, tuple[bytes | None, str | None]] = OrderedDict()
+        self._nb_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, video_id: int) -> bool:
+        return video_id in self._entries
+
+    def get(self, video_id: int) -> bytes | None:
+        return self._get_entry(video_id)[0]
+
+    def get_many(self, video_ids: Iterable[int]) -> dict[int, bytes | None]:
+        video_ids = list(video_ids)
+        self.prefetch(video_ids)
+        return {video_id: self.get(video_id) for video_id in video_ids}
+
+    def etag(self, video_id: int) -> str | None:
+        return self._get_entry(video_id)[1]
+
+    def prefetch(self, video_ids: Iterable[int]) -> None:
+        """Load missing thumbnails with one batch query."""
+        with self._lock:
+            missing = [
+                video_id
+                for video_id in dict.fromkeys(video_ids)
+                if video_id not in self._entries
+            ]
+        if missing:
+            thumbnails = self.database.get_thumbnails(missing)
+            if tracing.get_tracer() is not None:
+                nb_bytes = sum(len(blob) for blob in thumbnails.values())
+                tracing.count("thumbnail bytes read", nb_bytes)
+            with self._lock:
+                for video_id in missing:
+                    self._put(video_id, thumbnails.get(video_id))
+
+    def invalidate(self, video_ids: Iterable[int] | None = None) -> None:
+        """Drop given thumbnails from cache, or whole cache if None."""
+        with self._lock:
+            if video_ids is None:
+                self._entries.clear()
+                self._nb_bytes = 0
+            else:
+                for video_id in video_ids:
+                    entry = self._entries.pop(video_id, None)
+                    if entry is not None:
+                        self._nb_bytes -= self._entry_size(entry)
+
+    def _get_entry(self, video_id: int) -> tuple[bytes | None, str | None]:
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is not None:
+                self._entries.move_to_end(video_id)
+                return entry
+        self.prefetch([video_id])
+        with self._lock:
+            return self._entries.get(video_id, (None, None))
+
+    def _put(self, video_id: int, thumbnail: bytes | None) -> None:
+        thumbnail = thumbnail or None
+        etag = (
+            hashlib.blake2b(thumbnail, digest_size=16).hexdigest()
+            if thumbnail
+            else None
+        )
+        entry = (thumbnail, etag)
+        previous = self._entries.pop(video_id, None)
+        if previous is not None:
+            self._nb_bytes -= self._entry_size(previous)
+        self._entries[video_id] = entry
+        self._nb_bytes += self._entry_size(entry)
+        # Evict least recently used entries, but always keep the new one.
+        while self._nb_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._nb_bytes -= self._entry_size(evicted)
+
+    @classmethod
+    def _entry_size(cls, entry: tuple[bytes | None, str | None]) -> int:
+        return len(entry[0] or b"") + _ENTRY_OVERHEAD
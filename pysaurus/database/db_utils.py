@@ -6,8 +6,81 @@ from pysaurus.core.notifications import Notification
 logger = logging.getLogger(__name__)
 
 
+# Video status: (discarded, unreadable, found, with_thumbnails)
+VideoStatus = tuple[bool, bool, bool, bool]
+
+
+class VideoStatusCounts:
+    """Number of videos for each video status.
+
+    Allows to count videos matching any combination of status flags
+    without querying videos again.
+    """
+
+    __slots__ = ("_counts",)
+
+    # flag => (position in VideoStatus, expected value)
+    FLAGS = {
+        "discarded": (0, True),
+        "unreadable": (1, True),
+        "readable": (1, False),
+        "found": (2, True),
+        "not_found": (2, False),
+        "with_thumbnails": (3, True),
+        "without_thumbnails": (3, False),
+    }
+
+    def __init__(self, counts: dict[VideoStatus, int]):
+        self._counts = counts
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._counts == other._counts
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._counts})"
+
+    @classmethod
+    def statuses(cls) -> list[VideoStatus]:
+        return [
+            (bool(d), bool(u), bool(f), bool(t))
+            for d in (0, 1)
+            for u in (0, 1)
+            for f in (0, 1)
+            for t in (0, 1)
+        ]
+
+    @classmethod
+    def accepts(cls, where: dict | None) -> bool:
+        """Return True if `where` only filters on status flags."""
+        return not where or all(
+            flag in cls.FLAGS and isinstance(value, (bool, int))
+            for flag, value in where.items()
+        )
+
+    def count(self, **flags: bool) -> int:
+        """Count videos matching given flags (e.g. readable=True, found=False)."""
+        expected = {}
+        for flag, value in flags.items():
+            position, flag_value = self.FLAGS[flag]
+            required = flag_value if value else not flag_value
+            if expected.setdefault(position, required) != required:
+                return 0
+        return sum(
+            count
+            for status, count in self._counts.items()
+            if all(status[position] == value for position, value in expected.items())
+        )
+
+
 class DatabaseLoaded(Notification):
-    __slots__ = (
+    """Database video counts.
+
+    Counts are computed from `database.get_status_counts()` only when
+    first read, e.g. when notification is displayed or pickled.
+    """
+
+    __slots__ = ("_database", "_counts")
+    __props__ = (
         "entries",
         "discarded",
         "unreadable_not_found",
@@ -16,22 +89,54 @@ class DatabaseLoaded(Notification):
         "readable_found_without_thumbnails",
         "valid",
     )
-    __slot_sorter__ = list
 
     def __init__(self, database):
         super().__init__()
-        from pysaurus.database.database_operations import DatabaseOperations
-
-        ops = DatabaseOperations(database)
-        self.entries = ops.count_videos()
-        self.discarded = ops.count_videos("discarded")
-        self.unreadable_not_found = ops.count_videos("unreadable", "not_found")
-        self.unreadable_found = ops.count_videos("unreadable", "found")
-        self.readable_not_found = ops.count_videos("readable", "not_found")
-        self.readable_found_without_thumbnails = ops.count_videos(
-            "readable", "found", "without_thumbnails"
+        self._database = database
+        self._counts: VideoStatusCounts | None = None
+
+    def __getstate__(self):
+        # Database can't be pickled (e.g. to be sent to another process).
+        return None, {"_database": None, "_counts": self.counts}
+
+    @property
+    def counts(self) -> VideoStatusCounts:
+        if self._counts is None:
+            self._counts = self._database.get_status_counts()
+            self._database = None
+        return self._counts
+
+    @property
+    def entries(self) -> int:
+        return self.counts.count()
+
+    @property
+    def discarded(self) -> int:
+        return self.counts.count(discarded=True)
+
+    @property
+    def unreadable_not_found(self) -> int:
+        return self.counts.count(discarded=False, unreadable=True, found=False)
+
+    @property
+    def unreadable_found(self) -> int:
+        return self.counts.count(discarded=False, unreadable=True, found=True)
+
+    @property
+    def readable_not_found(self) -> int:
+        return self.counts.count(discarded=False, unreadable=False, found=False)
+
+    @property
+    def readable_found_without_thumbnails(self) -> int:
+        return self.counts.count(
+            discarded=False, unreadable=False, found=True, with_thumbnails=False
+        )
+
+    @property
+    def valid(self) -> int:
+        return self.counts.count(
+            discarded=False, unreadable=False, found=True, with_thumbnails=True
         )
-        self.valid = ops.count_videos("readable", "found", "with_thumbnails")
 
     def __str__(self):
         name = camel_case_to_snake_case(type(self).__name__).replace("_", " ")
@@ -51,18 +156,23 @@ class DatabaseSaved(DatabaseLoaded):
 
 
 class DatabaseToSaveContext:
-    __slots__ = ("database",)
+    __slots__ = ("database", "batch")
 
     def __init__(self, database):
         from pysaurus.database.abstract_database import AbstractDatabase
 
         self.database: AbstractDatabase = database
+        self.batch = database.batch()
 
     def __enter__(self):
+        self.batch.__enter__()
         self.database.in_save_context = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.database.in_save_context = False
-        self.database.save()
-        logger.info("Saved in context.")
+        try:
+            self.batch.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.database.save()
+            logger.info("Saved in context.")
@@ -1,8 +1,8 @@
+import copy
 import logging
 import threading
 
-from flask import Flask, send_file
-from werkzeug.serving import make_server
+from pysaurus.core.file_utils import PLAYLIST_FORMATS, iter_playlist
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +11,8 @@ class _ServerThread(threading.Thread):
     def __init__(self, appl):
         # Make thread a daemon to be sure it is closed if sys.exit is called.
         # (2022/12/29) https://stackoverflow.com/a/38805873
+        from werkzeug.serving import make_server
+
         super().__init__(daemon=True)
         self.hostname = "127.0.0.1"
         self.port = 0  # Set port to 0 so that system chooses a port dynamically
@@ -41,19 +43,49 @@ class _ServerThread(threading.Thread):
 
 
 class ServerLauncher:
-    def __init__(self, database_getter):
+    """Video server.
+
+    Flask is imported, and server is started, on first use
+    (i.e. on first access to `server_thread`).
+    """
+
+    def __init__(self, database_getter, view_getter=None):
         self.db_getter = database_getter
-        self.application = Flask(__name__)
-        self.application.route("/")(self._home)
-        self.application.route("/video/<video_id>")(self._video)
-        self.server_thread = _ServerThread(self.application)
+        self.view_getter = view_getter
+        self._application = None
+        self._server_thread: _ServerThread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def application(self):
+        if self._application is None:
+            from flask import Flask
 
-    def start(self):
-        self.server_thread.start()
-        logger.info("server started")
+            self._application = Flask(__name__)
+            self._application.route("/")(self._home)
+            self._application.route("/video/<video_id>")(self._video)
+            self._application.route("/thumbnail/<video_id>")(self._thumbnail)
+            self._application.route("/playlist.<fmt>")(self._playlist)
+        return self._application
+
+    @property
+    def server_thread(self) -> _ServerThread:
+        with self._lock:
+            if self._server_thread is None:
+                self._server_thread = _ServerThread(self.application)
+                self._server_thread.start()
+                logger.info("server started")
+            return self._server_thread
+
+    def url(self, path: str) -> str:
+        server_thread = self.server_thread
+        return f"http://{server_thread.hostname}:{server_thread.port}{path}"
 
     def stop(self):
-        self.server_thread.shutdown()
+        with self._lock:
+            if self._server_thread is not None:
+                self._server_thread.shutdown()
+                self._server_thread = None
 
     @classmethod
     def _home(cls):
@@ -61,9 +93,47 @@ class ServerLauncher:
 
     def _video(self, video_id):
         # TODO An error here does not stop the program.
+        from flask import send_file
+
         video_id = int(video_id)
         logger.info(f"Required video ID {video_id}")
         database = self.db_getter()
         filename = database.ops.get_video_filename(video_id)
         logger.info(f"Found video: {filename}")
         return send_file(filename.path)
+
+    def _thumbnail(self, video_id):
+        # Served from database thumbnail cache. ETag lets browser
+        # revalidate with a 304 instead of downloading blob again.
+        from flask import Response, abort, request
+
+        database = self.db_getter()
+        if database is None:
+            abort(404)
+        video_id = int(video_id)
+        thumbnails = database.thumbnails
+        thumbnail = thumbnails.get(video_id)
+        if not thumbnail:
+            abort(404)
+        response = Response(thumbnail, mimetype="image/jpeg")
+        response.set_etag(thumbnails.etag(video_id))
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
+
+    def _playlist(self, fmt):
+        # Streamed as a chunked response, read lazily from database,
+        # so memory does not depend on playlist size.
+        from flask import Response, abort
+
+        if fmt not in PLAYLIST_FORMATS or self.view_getter is None:
+            abort(404)
+        database = self.db_getter()
+        if database is None:
+            abort(404)
+        # Copy view, as it may change while playlist is streamed.
+        view = copy.deepcopy(self.view_getter())
+        entries = database.ops.iter_playlist_entries(view)
+        _, mimetype = PLAYLIST_FORMATS[fmt]
+        return Response(
+            iter_playlist(entries, fmt), mimetype=f"{mimetype}; charset=utf-8"
+        )
@@ -12,10 +12,6 @@ from pysaurus.imgsimsearch.abstract_approximate_comparator import (
     AbstractApproximateComparator,
 )
 from pysaurus.imgsimsearch.abstract_image_provider import AbstractImageProvider
-from pysaurus.imgsimsearch.approximate_comparator_numpy import (
-    ApproximateComparatorNumpy,
-)
-from pysaurus.imgsimsearch.python_fine_comparator import compare_miniatures
 from pysaurus.video.video_pattern import VideoPattern
 
 SIM_LIMIT = float(Fraction(88, 100))
@@ -91,6 +87,11 @@ class DbSimilarVideos:
     @classmethod
     @Profiler.profile()
     def find_similar_videos(cls, db: AbstractDatabase) -> None:
+        # NumPy-based comparators are imported only when needed.
+        from pysaurus.imgsimsearch.approximate_comparator_numpy import (
+            ApproximateComparatorNumpy,
+        )
+
         miniatures: list[Miniature] = db.algos.ensure_miniatures()
         similarities, imp = cls._compute_similar_videos(
             db, miniatures, ApproximateComparatorNumpy
@@ -148,6 +149,8 @@ class DbSimilarVideos:
         Returns:
             Tuple of (similarity groups, image provider).
         """
+        from pysaurus.imgsimsearch.python_fine_comparator import compare_miniatures
+
         with Profiler("Loading thumbnails from database.", db.notifier):
             imp = DbImageProvider(db)
         comparator_imp = _CompareAllProvider(imp) if compare_all else imp
@@ -0,0 +1,173 @@
+"""
+Connections to a collection database file.
+
+Database is used in WAL mode, so that readers are not blocked by a
+writer (e.g. GUI reading videos while an update is running).
+A pool holds:
+
+- one writer connection, shared by all threads and serialized by a lock;
+- a few read-only connections, lent to threads for reads.
+
+All connections are kept open, use the same PRAGMA profile and have
+pysaurus_* SQL functions registered.
+"""
+
+import pathlib
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from skullite import DbID, SkulliteFunction
+
+# PRAGMAs set on every connection.
+PRAGMAS = {
+    "busy_timeout": 10_000,  # ms
+    "cache_size": -64_000,  # KiB, i.e. ~64 MB
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+# PRAGMAs set on writer only.
+WRITER_PRAGMAS = {
+    "journal_mode": "WAL",
+    # Safe in WAL mode: a power loss may only lose last commits.
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+}
+
+
+class PooledConnection:
+    """Connection usable from any thread, not closed on exit.
+
+    Provides the connection methods Skullite calls on its persistent
+    connection (script, modify, query, query_one, query_all), so that
+    PysaurusConnection can bind it to a thread.
+    """
+
+    __slots__ = ("connection", "cursor")
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        functions: Iterable[SkulliteFunction] = (),
+        read_only: bool = False,
+    ):
+        if read_only:
+            # Temporary tables can still be created in read-only mode.
+            uri = f"{pathlib.Path(db_path).absolute().as_uri()}?mode=ro"
+            self.connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        pragmas = PRAGMAS if read_only else {**PRAGMAS, **WRITER_PRAGMAS}
+        for name, value in pragmas.items():
+            self.connection.execute(f"PRAGMA {name} = {value}")
+        self.cursor = self.connection.cursor()
+        self.cursor.arraysize = 1000
+        for fn in functions:
+            self.connection.create_function(
+                fn.name, fn.nb_args, fn.function, deterministic=fn.deterministic
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Connection is kept open, see close()."""
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def script(self, script: str) -> None:
+        self.cursor.executescript(script)
+        self.connection.commit()
+
+    def modify(self, query, parameters=(), many=False) -> DbID | None:
+        """Run and commit a modification query. Return last inserted row ID."""
+        if many:
+            self.cursor.executemany(query, parameters)
+        else:
+            self.cursor.execute(query, parameters)
+        self.connection.commit()
+        last_id = self.cursor.lastrowid
+        return last_id if last_id is None else DbID(last_id)
+
+    def query(self, query, parameters=()) -> Iterator[sqlite3.Row]:
+        self.cursor.execute(query, parameters)
+        yield from self.cursor
+
+    def query_one(self, query, parameters=()) -> sqlite3.Row | None:
+        self.cursor.execute(query, parameters)
+        return self.cursor.fetchone()
+
+    def query_all(self, query, parameters=()) -> list[sqlite3.Row]:
+        self.cursor.execute(query, parameters)
+        return self.cursor.fetchall()
+
+
+class ConnectionPool:
+    __slots__ = (
+        "db_path",
+        "functions",
+        "size",
+        "_writer",
+        "_writer_lock",
+        "_idle",
+        "_readers",
+        "_lock",
+    )
+
+    def __init__(
+        self, db_path: str, functions: Iterable[SkulliteFunction] = (), size: int = 4
+    ):
+        self.db_path = db_path
+        self.functions = tuple(functions)
+        self.size = size
+        # Writer is created first, as it enables WAL mode.
+        self._writer = PooledConnection(db_path, functions=self.functions)
+        self._writer_lock = threading.RLock()
+        self._idle: queue.LifoQueue[PooledConnection] = queue.LifoQueue()
+        self._readers: list[PooledConnection] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def writer(self) -> Iterator[PooledConnection]:
+        """Lend writer connection, waiting for other threads to release it."""
+        with self._writer_lock:
+            yield self._writer
+
+    @contextmanager
+    def reader(self) -> Iterator[PooledConnection]:
+        """Lend a read-only connection.
+
+        A new one is opened if all are busy and pool is not full.
+        Otherwise, wait for another thread to release one.
+        """
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def _acquire_reader(self) -> PooledConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._readers) < self.size:
+                connection = PooledConnection(
+                    self.db_path, functions=self.functions, read_only=True
+                )
+                self._readers.append(connection)
+                return connection
+        return self._idle.get()
+
+    def close(self) -> None:
+        with self._writer_lock, self._lock:
+            for connection in self._readers:
+                connection.close()
+            self._readers.clear()
+            self._writer.close()
@@ -47,6 +47,8 @@ CREATE TABLE IF NOT EXISTS video (
 	similarity_id INTEGER,
 	similarity_id_reencoded INTEGER,
 	watched INTEGER NOT NULL DEFAULT 0,
+	-- maintained by triggers on video_thumbnail: IIF(LENGTH(thumbnail), 1, 0)
+	has_thumbnail INTEGER NOT NULL DEFAULT 0,
 	-- virtual columns
 	readable INTEGER GENERATED ALWAYS AS (1 - unreadable) VIRTUAL,
 	found INTEGER GENERATED ALWAYS AS (is_file) VIRTUAL,
@@ -85,10 +87,20 @@ CREATE TABLE IF NOT EXISTS video (
 			ELSE SUBSTR(_basename, 1, LENGTH(RTRIM(_basename, REPLACE(_basename, '.', ''))) - 1)
 		END
 	) STORED,
+	-- move detection: videos sharing a signature may be the same file, moved.
+	-- NULL for videos ignored by move detection.
+	move_signature TEXT GENERATED ALWAYS AS (
+		IIF(
+			unreadable = 0 AND discarded = 0,
+			file_size || ':' || duration || ':' || duration_time_base_not_null,
+			NULL
+		)
+	) VIRTUAL,
 	-- constraints
 	CHECK (is_file IN (0, 1)),
 	CHECK (discarded IN (0, 1)),
 	CHECK (unreadable IN (0, 1)),
+	CHECK (has_thumbnail IN (0, 1)),
 	UNIQUE (filename)
 );
 
@@ -154,23 +166,45 @@ USING fts5(filename, meta_title, properties);
 
 ----------------------------------------------------------------------------------------
 -- Triggers for video_text.
--- INSERT/UPDATE triggers call pysaurus_text_to_fts() (registered Python function)
--- to apply camelCase splitting for FTS5 search.
--- Property updates are handled manually in Python for batch performance.
+-- FTS text is camelCase-split text produced by pysaurus_text_to_fts().
+-- Bulk inserts precompute it in Python and stage it in video_text_staging
+-- (keyed by filename) before inserting videos, so that triggers read it
+-- instead of calling back into Python for each row. COALESCE short-circuits:
+-- pysaurus_text_to_fts() (registered Python function) is only called for
+-- rows written without staging (e.g. raw SQL).
+-- Property updates are tracked in video_text_dirty and applied in Python in batch.
 ----------------------------------------------------------------------------------------
 
+CREATE TABLE IF NOT EXISTS video_text_staging (
+    filename TEXT PRIMARY KEY,
+    filename_fts TEXT,
+    meta_title_fts TEXT
+) WITHOUT ROWID;
+
 CREATE TRIGGER IF NOT EXISTS on_video_insert AFTER INSERT ON video
 BEGIN
     INSERT INTO video_text (rowid, filename, meta_title)
-    VALUES (NEW.video_id, pysaurus_text_to_fts(NEW.filename), pysaurus_text_to_fts(NEW.meta_title));
+    VALUES (
+        NEW.video_id,
+        COALESCE(
+            (SELECT filename_fts FROM video_text_staging WHERE filename = NEW.filename),
+            pysaurus_text_to_fts(NEW.filename)
+        ),
+        COALESCE(
+            (SELECT meta_title_fts FROM video_text_staging WHERE filename = NEW.filename),
+            pysaurus_text_to_fts(NEW.meta_title)
+        )
+    );
 END;
 
 CREATE TRIGGER IF NOT EXISTS on_video_update_filename AFTER UPDATE OF filename ON video
+WHEN OLD.filename IS NOT NEW.filename
 BEGIN
     UPDATE video_text SET filename = pysaurus_text_to_fts(NEW.filename) WHERE rowid = OLD.video_id;
 END;
 
 CREATE TRIGGER IF NOT EXISTS on_video_update_meta_title AFTER UPDATE OF meta_title ON video
+WHEN OLD.meta_title IS NOT NEW.meta_title
 BEGIN
     UPDATE video_text SET meta_title = pysaurus_text_to_fts(NEW.meta_title) WHERE rowid = OLD.video_id;
 END;
@@ -181,61 +215,225 @@ BEGIN
 END;
 
 ----------------------------------------------------------------------------------------
--- Indexes for video table.
--- Columns used for filtering (WHERE clauses).
-----------------------------------------------------------------------------------------
-
-CREATE INDEX IF NOT EXISTS idx_video_audio_bit_rate ON video(audio_bit_rate);
-CREATE INDEX IF NOT EXISTS idx_video_audio_bits ON video(audio_bits);
-CREATE INDEX IF NOT EXISTS idx_video_audio_codec ON video(audio_codec);
-CREATE INDEX IF NOT EXISTS idx_video_audio_codec_description ON video(audio_codec_description);
-CREATE INDEX IF NOT EXISTS idx_video_channels ON video(channels);
-CREATE INDEX IF NOT EXISTS idx_video_container_format ON video(container_format);
-CREATE INDEX IF NOT EXISTS idx_video_date_entry_modified ON video(date_entry_modified);
-CREATE INDEX IF NOT EXISTS idx_video_date_entry_opened ON video(date_entry_opened);
-CREATE INDEX IF NOT EXISTS idx_video_device_name ON video(device_name);
-CREATE INDEX IF NOT EXISTS idx_video_discarded ON video(discarded);
-CREATE INDEX IF NOT EXISTS idx_video_driver_id ON video(driver_id);
-CREATE INDEX IF NOT EXISTS idx_video_duration ON video(duration);
-CREATE INDEX IF NOT EXISTS idx_video_duration_time_base ON video(duration_time_base);
-CREATE INDEX IF NOT EXISTS idx_video_extension ON video(extension);
-CREATE INDEX IF NOT EXISTS idx_video_file_size ON video(file_size);
-CREATE INDEX IF NOT EXISTS idx_video_file_title ON video(file_title);
-CREATE INDEX IF NOT EXISTS idx_video_frame_rate_den ON video(frame_rate_den);
-CREATE INDEX IF NOT EXISTS idx_video_frame_rate_num ON video(frame_rate_num);
-CREATE INDEX IF NOT EXISTS idx_video_height ON video(height);
-CREATE INDEX IF NOT EXISTS idx_video_is_file ON video(is_file);
-CREATE INDEX IF NOT EXISTS idx_video_meta_title ON video(meta_title);
-CREATE INDEX IF NOT EXISTS idx_video_mtime ON video(mtime);
-CREATE INDEX IF NOT EXISTS idx_video_sample_rate ON video(sample_rate);
-CREATE INDEX IF NOT EXISTS idx_video_similarity_id ON video(similarity_id);
-CREATE INDEX IF NOT EXISTS idx_video_similarity_id_reencoded ON video(similarity_id_reencoded);
-CREATE INDEX IF NOT EXISTS idx_video_unreadable ON video(unreadable);
-CREATE INDEX IF NOT EXISTS idx_video_video_codec ON video(video_codec);
-CREATE INDEX IF NOT EXISTS idx_video_video_codec_description ON video(video_codec_description);
-CREATE INDEX IF NOT EXISTS idx_video_watched ON video(watched);
-CREATE INDEX IF NOT EXISTS idx_video_width ON video(width);
+-- Dirty tracking for video_text.properties.
+-- Triggers record videos whose string property values changed.
+-- Python recomputes `properties` only for these videos, then clears them
+-- (see PysaurusCollection._flush_fts_properties).
+-- A deleted property (cascade) has no type anymore, so it is considered a string.
+----------------------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS video_text_dirty (
+    video_id INTEGER PRIMARY KEY
+);
+
+CREATE TRIGGER IF NOT EXISTS on_video_property_value_insert
+AFTER INSERT ON video_property_value
+WHEN (SELECT type FROM property WHERE property_id = NEW.property_id) = 'str'
+BEGIN
+    INSERT OR IGNORE INTO video_text_dirty (video_id) VALUES (NEW.video_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_property_value_delete
+AFTER DELETE ON video_property_value
+WHEN COALESCE((SELECT type FROM property WHERE property_id = OLD.property_id), 'str') = 'str'
+BEGIN
+    INSERT OR IGNORE INTO video_text_dirty (video_id) VALUES (OLD.video_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_property_value_update
+AFTER UPDATE ON video_property_value
+WHEN COALESCE((SELECT type FROM property WHERE property_id = OLD.property_id), 'str') = 'str'
+OR (SELECT type FROM property WHERE property_id = NEW.property_id) = 'str'
+BEGIN
+    INSERT OR IGNORE INTO video_text_dirty (video_id) VALUES (OLD.video_id);
+    INSERT OR IGNORE INTO video_text_dirty (video_id) VALUES (NEW.video_id);
+END;
 
 ----------------------------------------------------------------------------------------
--- Indexes for video_property_value table.
--- Used heavily for property lookups and grouping.
+-- Raw text index for exact (phrase) search.
+-- Trigram tokenizer indexes substrings of raw, case-folded text, so that
+-- `video_phrase MATCH '"phrase"'` finds videos containing the phrase
+-- without any LIKE scan on video data.
+-- Properties column holds raw string property values joined with ';',
+-- updated with video_text.properties (see PysaurusCollection._flush_fts_properties).
 ----------------------------------------------------------------------------------------
 
-CREATE INDEX IF NOT EXISTS idx_vpv_video_id ON video_property_value(video_id);
-CREATE INDEX IF NOT EXISTS idx_vpv_property_id ON video_property_value(property_id);
-CREATE INDEX IF NOT EXISTS idx_vpv_property_value ON video_property_value(property_id, property_value);
-CREATE INDEX IF NOT EXISTS idx_vpv_property_video ON video_property_value(property_id, video_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS video_phrase
+USING fts5(filename, meta_title, properties, tokenize='trigram');
+-- Uses rowid = video.video_id to link rows.
+
+CREATE TRIGGER IF NOT EXISTS on_video_insert_phrase AFTER INSERT ON video
+BEGIN
+    INSERT INTO video_phrase (rowid, filename, meta_title)
+    VALUES (NEW.video_id, NEW.filename, NEW.meta_title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_update_filename_phrase AFTER UPDATE OF filename ON video
+WHEN OLD.filename IS NOT NEW.filename
+BEGIN
+    UPDATE video_phrase SET filename = NEW.filename WHERE rowid = OLD.video_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_update_meta_title_phrase AFTER UPDATE OF meta_title ON video
+WHEN OLD.meta_title IS NOT NEW.meta_title
+BEGIN
+    UPDATE video_phrase SET meta_title = NEW.meta_title WHERE rowid = OLD.video_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_delete_phrase DELETE ON video
+BEGIN
+    DELETE FROM video_phrase WHERE rowid = OLD.video_id;
+END;
+
+----------------------------------------------------------------------------------------
+-- Thumbnail flag.
+-- video.has_thumbnail mirrors IIF(LENGTH(video_thumbnail.thumbnail), 1, 0),
+-- so that filtering on thumbnails never joins the thumbnail BLOB table.
+-- INSERT OR REPLACE does not fire delete triggers, but fires insert trigger.
+-- When video is deleted, its thumbnail is deleted by cascade after video row:
+-- delete trigger then updates no row.
+----------------------------------------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS on_video_thumbnail_insert AFTER INSERT ON video_thumbnail
+BEGIN
+    UPDATE video SET has_thumbnail = IIF(LENGTH(NEW.thumbnail), 1, 0)
+    WHERE video_id = NEW.video_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_thumbnail_update AFTER UPDATE OF thumbnail ON video_thumbnail
+BEGIN
+    UPDATE video SET has_thumbnail = IIF(LENGTH(NEW.thumbnail), 1, 0)
+    WHERE video_id = NEW.video_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_thumbnail_delete AFTER DELETE ON video_thumbnail
+BEGIN
+    UPDATE video SET has_thumbnail = 0 WHERE video_id = OLD.video_id;
+END;
 
 ----------------------------------------------------------------------------------------
--- Indexes for video_error table.
--- Used for error lookups by video_id.
+-- Video status counters.
+-- Number of videos for each (discarded, unreadable, is_file, has_thumbnail),
+-- maintained by triggers, so that status counts (e.g. DatabaseSaved notification)
+-- are read without scanning video table. All 16 rows always exist.
+-- Thumbnail changes are counted through video.has_thumbnail updates.
 ----------------------------------------------------------------------------------------
 
-CREATE INDEX IF NOT EXISTS idx_video_error_video_id ON video_error(video_id);
+CREATE TABLE IF NOT EXISTS video_status_count (
+	discarded INTEGER NOT NULL,
+	unreadable INTEGER NOT NULL,
+	is_file INTEGER NOT NULL,
+	with_thumbnails INTEGER NOT NULL,
+	count INTEGER NOT NULL DEFAULT 0,
+	PRIMARY KEY (discarded, unreadable, is_file, with_thumbnails)
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO video_status_count (discarded, unreadable, is_file, with_thumbnails)
+WITH flag(value) AS (VALUES (0), (1))
+SELECT d.value, u.value, f.value, t.value FROM flag AS d, flag AS u, flag AS f, flag AS t;
+
+CREATE TRIGGER IF NOT EXISTS on_video_insert_status AFTER INSERT ON video
+BEGIN
+    UPDATE video_status_count SET count = count + 1
+    WHERE (discarded, unreadable, is_file, with_thumbnails)
+    = (NEW.discarded, NEW.unreadable, NEW.is_file, NEW.has_thumbnail);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_delete_status AFTER DELETE ON video
+BEGIN
+    UPDATE video_status_count SET count = count - 1
+    WHERE (discarded, unreadable, is_file, with_thumbnails)
+    = (OLD.discarded, OLD.unreadable, OLD.is_file, OLD.has_thumbnail);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_update_status
+AFTER UPDATE OF discarded, unreadable, is_file, has_thumbnail ON video
+WHEN OLD.discarded <> NEW.discarded OR OLD.unreadable <> NEW.unreadable
+OR OLD.is_file <> NEW.is_file OR OLD.has_thumbnail <> NEW.has_thumbnail
+BEGIN
+    UPDATE video_status_count SET count = count - 1
+    WHERE (discarded, unreadable, is_file, with_thumbnails)
+    = (OLD.discarded, OLD.unreadable, OLD.is_file, OLD.has_thumbnail);
+    UPDATE video_status_count SET count = count + 1
+    WHERE (discarded, unreadable, is_file, with_thumbnails)
+    = (NEW.discarded, NEW.unreadable, NEW.is_file, NEW.has_thumbnail);
+END;
 
 ----------------------------------------------------------------------------------------
--- Indexes for video_language table.
--- Used for language lookups by video_id.
+-- Move candidates.
+-- Signatures of groups of videos (same move_signature) containing both found
+-- and not found videos: not found ones may have been moved to found ones.
+-- A group is recounted each time a video enters or leaves it, or is
+-- found or lost, so that potential moves are read without grouping all videos.
 ----------------------------------------------------------------------------------------
 
-CREATE INDEX IF NOT EXISTS idx_video_language_video_id ON video_language(video_id);
+CREATE TABLE IF NOT EXISTS move_candidates (
+    move_signature TEXT PRIMARY KEY
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS on_video_insert_move AFTER INSERT ON video
+WHEN NEW.move_signature IS NOT NULL
+BEGIN
+    DELETE FROM move_candidates WHERE move_signature = NEW.move_signature;
+    INSERT INTO move_candidates (move_signature)
+    SELECT move_signature FROM video WHERE move_signature = NEW.move_signature
+    GROUP BY move_signature HAVING SUM(is_file) > 0 AND SUM(is_file) < COUNT(*);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_delete_move AFTER DELETE ON video
+WHEN OLD.move_signature IS NOT NULL
+BEGIN
+    DELETE FROM move_candidates WHERE move_signature = OLD.move_signature;
+    INSERT INTO move_candidates (move_signature)
+    SELECT move_signature FROM video WHERE move_signature = OLD.move_signature
+    GROUP BY move_signature HAVING SUM(is_file) > 0 AND SUM(is_file) < COUNT(*);
+END;
+
+CREATE TRIGGER IF NOT EXISTS on_video_update_move
+AFTER UPDATE OF file_size, duration, duration_time_base, unreadable, discarded, is_file ON video
+WHEN OLD.move_signature IS NOT NEW.move_signature OR OLD.is_file <> NEW.is_file
+BEGIN
+    DELETE FROM move_candidates WHERE move_signature = OLD.move_signature;
+    INSERT INTO move_candidates (move_signature)
+    SELECT move_signature FROM video WHERE move_signature = OLD.move_signature
+    GROUP BY move_signature HAVING SUM(is_file) > 0 AND SUM(is_file) < COUNT(*);
+    DELETE FROM move_candidates WHERE move_signature = NEW.move_signature;
+    INSERT INTO move_candidates (move_signature)
+    SELECT move_signature FROM video WHERE move_signature = NEW.move_signature
+    GROUP BY move_signature HAVING SUM(is_file) > 0 AND SUM(is_file) < COUNT(*);
+END;
+
+----------------------------------------------------------------------------------------
+-- Indexes for video table.
+-- Derived from queries generated by video_mega_group() (see console `explain`).
+-- Views always filter on `discarded = 0`, so view indexes are partial.
+-- Each index is maintained on every video insert/update: add one only
+-- for a query that needs it.
+-- video_id is the rowid, so every index also covers it.
+----------------------------------------------------------------------------------------
+
+-- Source flags (readable, found, with_thumbnails and their negations).
+CREATE INDEX IF NOT EXISTS idx_video_view_source ON video(unreadable, is_file, has_thumbnail) WHERE discarded = 0;
+-- Most used sortings: date (default), size, length.
+CREATE INDEX IF NOT EXISTS idx_video_view_mtime ON video(mtime) WHERE discarded = 0;
+CREATE INDEX IF NOT EXISTS idx_video_view_file_size ON video(file_size) WHERE discarded = 0;
+CREATE INDEX IF NOT EXISTS idx_video_view_length ON video(length_seconds) WHERE discarded = 0;
+-- Similarity groups.
+CREATE INDEX IF NOT EXISTS idx_video_view_similarity_id ON video(similarity_id) WHERE discarded = 0;
+CREATE INDEX IF NOT EXISTS idx_video_view_similarity_id_reencoded ON video(similarity_id_reencoded) WHERE discarded = 0;
+-- Move detection: videos by move signature, with found flag.
+-- Covering, so move_candidates triggers count a group from index only.
+CREATE INDEX IF NOT EXISTS idx_video_move_signature ON video(move_signature, is_file) WHERE move_signature IS NOT NULL;
+
+----------------------------------------------------------------------------------------
+-- Indexes for video_property_value table.
+-- Lookups by video use UNIQUE (video_id, property_id, property_value).
+----------------------------------------------------------------------------------------
+
+-- Videos having a property value, and property group counts. Covering.
+CREATE INDEX IF NOT EXISTS idx_vpv_property_value_video ON video_property_value(property_id, property_value, video_id);
+-- Videos having a property, in video order (classifier groups).
+CREATE INDEX IF NOT EXISTS idx_vpv_property_video ON video_property_value(property_id, video_id);
+
+-- video_error and video_language are looked up by video_id
+-- through their UNIQUE constraints: no extra index needed.
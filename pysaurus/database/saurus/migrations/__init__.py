@@ -17,6 +17,12 @@ if TYPE_CHECKING:
 from pysaurus.database.saurus.migrations import (
     m0002_baseline,
     m0003_stored_filename_columns,
+    m0004_video_status_count,
+    m0005_staged_fts_triggers,
+    m0006_video_phrase,
+    m0007_video_has_thumbnail,
+    m0008_workload_indexes,
+    m0009_move_signature,
 )
 
 # Registry: target_version -> migrate(db) function.
@@ -24,6 +30,12 @@ from pysaurus.database.saurus.migrations import (
 MIGRATIONS: dict[int, Callable[[Skullite], None]] = {
     2: m0002_baseline.migrate,
     3: m0003_stored_filename_columns.migrate,
+    4: m0004_video_status_count.migrate,
+    5: m0005_staged_fts_triggers.migrate,
+    6: m0006_video_phrase.migrate,
+    7: m0007_video_has_thumbnail.migrate,
+    8: m0008_workload_indexes.migrate,
+    9: m0009_move_signature.migrate,
 }
 
 LATEST_VERSION: int = max(MIGRATIONS)
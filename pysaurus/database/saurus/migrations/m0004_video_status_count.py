@@ -0,0 +1,48 @@
+"""Migration to version 4: add video status counters.
+
+Table ``video_status_count`` holds the number of videos for each
+(discarded, unreadable, is_file, with_thumbnails) combination. It is
+maintained by triggers defined in database.sql; this migration creates
+the table and fills it from existing videos. Triggers are created
+afterwards, when database.sql is re-run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skullite import Skullite
+
+# Must stay in sync with database.sql.
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS video_status_count (
+    discarded INTEGER NOT NULL,
+    unreadable INTEGER NOT NULL,
+    is_file INTEGER NOT NULL,
+    with_thumbnails INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (discarded, unreadable, is_file, with_thumbnails)
+) WITHOUT ROWID
+"""
+
+_COUNT_VIDEOS = """\
+INSERT INTO video_status_count (discarded, unreadable, is_file, with_thumbnails, count)
+SELECT v.discarded, v.unreadable, v.is_file, IIF(LENGTH(vt.thumbnail), 1, 0), COUNT(*)
+FROM video AS v LEFT JOIN video_thumbnail AS vt ON v.video_id = vt.video_id
+GROUP BY v.discarded, v.unreadable, v.is_file, IIF(LENGTH(vt.thumbnail), 1, 0)
+"""
+
+_ADD_EMPTY_STATUSES = """\
+INSERT OR IGNORE INTO video_status_count (discarded, unreadable, is_file, with_thumbnails)
+WITH flag(value) AS (VALUES (0), (1))
+SELECT d.value, u.value, f.value, t.value FROM flag AS d, flag AS u, flag AS f, flag AS t
+"""
+
+
+def migrate(db: Skullite) -> None:
+    with db.connect() as connection:
+        connection.modify(_CREATE_TABLE)
+        connection.modify("DELETE FROM video_status_count")
+        connection.modify(_COUNT_VIDEOS)
+        connection.modify(_ADD_EMPTY_STATUSES)
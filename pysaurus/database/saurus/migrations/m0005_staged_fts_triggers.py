@@ -0,0 +1,27 @@
+"""Migration to version 5: video_text triggers read staged FTS text.
+
+Insert trigger now reads FTS text precomputed in Python from table
+``video_text_staging`` and only falls back to ``pysaurus_text_to_fts()``
+for unstaged rows. Update triggers skip rows whose text did not change.
+Triggers are created with IF NOT EXISTS in database.sql, so old ones
+are dropped here and recreated when database.sql is re-run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skullite import Skullite
+
+_OLD_TRIGGERS = (
+    "on_video_insert",
+    "on_video_update_filename",
+    "on_video_update_meta_title",
+)
+
+
+def migrate(db: Skullite) -> None:
+    with db.connect() as connection:
+        for trigger in _OLD_TRIGGERS:
+            connection.modify(f"DROP TRIGGER IF EXISTS {trigger}")
@@ -0,0 +1,39 @@
+"""Migration to version 6: add trigram index for exact search.
+
+Virtual table ``video_phrase`` indexes raw filename, meta title and
+string property values with FTS5 trigram tokenizer. This migration
+creates and fills it from existing videos. Triggers are created
+afterwards, when database.sql is re-run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skullite import Skullite
+
+# Must stay in sync with database.sql.
+_CREATE_TABLE = """\
+CREATE VIRTUAL TABLE IF NOT EXISTS video_phrase
+USING fts5(filename, meta_title, properties, tokenize='trigram')
+"""
+
+_FILL_TABLE = """\
+INSERT INTO video_phrase (rowid, filename, meta_title, properties)
+SELECT v.video_id, v.filename, v.meta_title, t.property_text
+FROM video AS v LEFT JOIN (
+    SELECT pv.video_id, GROUP_CONCAT(pv.property_value, ';') AS property_text
+    FROM video_property_value AS pv
+    JOIN property AS p ON pv.property_id = p.property_id
+    WHERE p.type = 'str'
+    GROUP BY pv.video_id
+) AS t ON v.video_id = t.video_id
+"""
+
+
+def migrate(db: Skullite) -> None:
+    with db.connect() as connection:
+        connection.modify(_CREATE_TABLE)
+        connection.modify("DELETE FROM video_phrase")
+        connection.modify(_FILL_TABLE)
@@ -0,0 +1,51 @@
+"""Migration to version 7: add ``video.has_thumbnail`` flag.
+
+Column is filled from ``video_thumbnail`` here, then maintained by
+triggers on ``video_thumbnail`` defined in database.sql. Status counter
+triggers now read this flag instead of querying ``video_thumbnail``:
+old counter triggers are dropped here and recreated (with thumbnail
+counting moved to video updates) when database.sql is re-run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skullite import Skullite
+
+# Must stay in sync with database.sql.
+_ADD_COLUMN = (
+    "ALTER TABLE video ADD COLUMN has_thumbnail INTEGER NOT NULL DEFAULT 0 "
+    "CHECK (has_thumbnail IN (0, 1))"
+)
+
+_OLD_TRIGGERS = (
+    "on_video_insert_status",
+    "on_video_delete_status",
+    "on_video_update_status",
+    "on_video_thumbnail_insert_status",
+    "on_video_thumbnail_update_status",
+    "on_video_thumbnail_delete_status",
+)
+
+_FILL_COLUMN = """\
+UPDATE video SET has_thumbnail = EXISTS (
+    SELECT 1 FROM video_thumbnail AS vt
+    WHERE vt.video_id = video.video_id AND LENGTH(vt.thumbnail)
+)
+"""
+
+
+def migrate(db: Skullite) -> None:
+    with db.connect() as connection:
+        columns = {
+            row["name"] for row in connection.query_all("PRAGMA table_xinfo(video)")
+        }
+        if "has_thumbnail" not in columns:
+            connection.modify(_ADD_COLUMN)
+        # Drop triggers first, so that filling column does not touch counters
+        # (they already count thumbnails the same way).
+        for trigger in _OLD_TRIGGERS:
+            connection.modify(f"DROP TRIGGER IF EXISTS {trigger}")
+        connection.modify(_FILL_COLUMN)
@@ -0,0 +1,61 @@
+"""Migration to version 8: replace single-column indexes with workload indexes.
+
+Former schema indexed about 30 video columns one by one, most of them
+never used by the planner, while every video insert or update had to
+maintain all of them. They are dropped here; the composite, covering
+and partial indexes now declared in database.sql are created when it
+is re-run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skullite import Skullite
+
+_OLD_INDEXES = (
+    "idx_video_audio_bit_rate",
+    "idx_video_audio_bits",
+    "idx_video_audio_codec",
+    "idx_video_audio_codec_description",
+    "idx_video_channels",
+    "idx_video_container_format",
+    "idx_video_date_entry_modified",
+    "idx_video_date_entry_opened",
+    "idx_video_device_name",
+    "idx_video_discarded",
+    "idx_video_status",
+    "idx_video_driver_id",
+    "idx_video_duration",
+    "idx_video_duration_time_base",
+    "idx_video_extension",
+    "idx_video_file_size",
+    "idx_video_file_title",
+    "idx_video_frame_rate_den",
+    "idx_video_frame_rate_num",
+    "idx_video_height",
+    "idx_video_is_file",
+    "idx_video_meta_title",
+    "idx_video_mtime",
+    "idx_video_sample_rate",
+    "idx_video_similarity_id",
+    "idx_video_similarity_id_reencoded",
+    "idx_video_unreadable",
+    "idx_video_video_codec",
+    "idx_video_video_codec_description",
+    "idx_video_watched",
+    "idx_video_width",
+    # Prefixes of UNIQUE constraints or of other indexes.
+    "idx_vpv_video_id",
+    "idx_vpv_property_id",
+    "idx_vpv_property_value",
+    "idx_video_error_video_id",
+    "idx_video_language_video_id",
+)
+
+
+def migrate(db: Skullite) -> None:
+    with db.connect() as connection:
+        for index in _OLD_INDEXES:
+            connection.modify(f"DROP INDEX IF EXISTS {index}")
@@ -0,0 +1,51 @@
+"""Migration to version 9: add ``video.move_signature`` and ``move_candidates``.
+
+Move detection used to group all readable videos by
+(file_size, duration, time base) on each query. Videos now expose this
+key as ``move_signature`` (indexed in database.sql), and signatures of
+groups holding potential moves are kept in ``move_candidates``, filled
+here, then maintained by triggers defined in database.sql.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skullite import Skullite
+
+# Must stay in sync with database.sql.
+_ADD_COLUMN = """\
+ALTER TABLE video ADD COLUMN move_signature TEXT GENERATED ALWAYS AS (
+    IIF(
+        unreadable = 0 AND discarded = 0,
+        file_size || ':' || duration || ':' || duration_time_base_not_null,
+        NULL
+    )
+) VIRTUAL
+"""
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS move_candidates (
+    move_signature TEXT PRIMARY KEY
+) WITHOUT ROWID
+"""
+
+_FILL_TABLE = """\
+INSERT OR IGNORE INTO move_candidates (move_signature)
+SELECT move_signature FROM video WHERE move_signature IS NOT NULL
+GROUP BY move_signature HAVING SUM(is_file) > 0 AND SUM(is_file) < COUNT(*)
+"""
+
+
+def migrate(db: Skullite) -> None:
+    with db.connect() as connection:
+        columns = {
+            row["name"] for row in connection.query_all("PRAGMA table_xinfo(video)")
+        }
+        if "move_signature" not in columns:
+            connection.modify(_ADD_COLUMN)
+        # Replaced by move signature index.
+        connection.modify("DROP INDEX IF EXISTS idx_video_move")
+        connection.modify(_CREATE_TABLE)
+        connection.modify(_FILL_TABLE)
@@ -0,0 +1,89 @@
+from pysaurus.properties.properties import PROP_UNIT_CONVERTER, PropType, PropUnitType
+
+# (by name, by ID, first enumeration value by ID)
+_Schema = tuple[dict[str, PropType], dict[int, PropType], dict[int, PropUnitType]]
+
+
+class PropTypeRegistry:
+    """
+    In-memory property schema of a collection.
+
+    Loaded on first access with one JOIN on `property` and
+    `property_enumeration`, then kept until `invalidate()` is called.
+    Only `prop_type_*` mutators change the schema, so they are the only
+    ones to invalidate it.
+    """
+
+    __slots__ = ("db", "_schema")
+
+    def __init__(self, db):
+        self.db = db
+        self._schema: _Schema | None = None
+
+    def __len__(self):
+        return len(self._get_schema()[0])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._get_schema()[0]
+
+    def all(self) -> list[PropType]:
+        """Return all property types, ordered by property ID."""
+        return list(self._get_schema()[0].values())
+
+    def get(self, name: str) -> PropType | None:
+        return self._get_schema()[0].get(name)
+
+    def get_by_id(self, property_id: int) -> PropType | None:
+        return self._get_schema()[1].get(property_id)
+
+    def stored_default(self, property_id: int) -> PropUnitType | None:
+        """Return first stored enumeration value, if any.
+
+        Unlike `PropType.default`, it is also available
+        for multiple properties defined with an enumeration.
+        """
+        return self._get_schema()[2].get(property_id)
+
+    def invalidate(self) -> None:
+        self._schema = None
+
+    def _get_schema(self) -> _Schema:
+        schema = self._schema
+        if schema is None:
+            schema = self._schema = self._load()
+        return schema
+
+    def _load(self) -> _Schema:
+        rows: dict[int, tuple[str, str, bool, list]] = {}
+        for row in self.db.query_all(
+            "SELECT p.property_id, p.name, p.type, p.multiple, e.enum_value "
+            "FROM property AS p "
+            "LEFT JOIN property_enumeration AS e ON p.property_id = e.property_id "
+            "ORDER BY p.property_id ASC, e.rank ASC"
+        ):
+            property_id = row["property_id"]
+            if property_id not in rows:
+                rows[property_id] = (
+                    row["name"],
+                    row["type"],
+                    bool(row["multiple"]),
+                    [],
+                )
+            if row["enum_value"] is not None:
+                rows[property_id][3].append(
+                    PROP_UNIT_CONVERTER[row["type"]](row["enum_value"])
+                )
+        by_id = {}
+        stored_defaults = {}
+        for property_id, (name, prop_type, multiple, enumeration) in rows.items():
+            by_id[property_id] = PropType(
+                property_id=property_id,
+                name=name,
+                type=prop_type,
+                multiple=multiple,
+                default=[] if multiple else [enumeration[0]],
+                enumeration=enumeration if len(enumeration) > 1 else None,
+            )
+            if enumeration:
+                stored_defaults[property_id] = enumeration[0]
+        return {pt.name: pt for pt in by_id.values()}, by_id, stored_defaults
@@ -1,6 +1,5 @@
 from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
-from pysaurus.database.saurus.sql_utils import SQLWhereBuilder
-from pysaurus.properties.properties import PROP_UNIT_CONVERTER, PropType
+from pysaurus.properties.properties import PropType
 
 
 def prop_type_search(
@@ -12,41 +11,21 @@ def prop_type_search(
     with_enum=None,
     default=None,
 ) -> list[PropType]:
-    where_clause = SQLWhereBuilder()
+    """Filter property types from connection schema registry (no SQL query
+    once the registry is loaded)."""
     if name is not None:
-        where_clause.append_field("name", name)
-    if with_type is not None:
-        where_clause.append_field("type", with_type.__name__)
-    if multiple is not None:
-        where_clause.append_field("multiple", int(bool(multiple)))
-    clause = "SELECT property_id, name, type, multiple FROM property"
-    if where_clause:
-        clause += f" WHERE {where_clause.get_clause()}"
-
-    ret = []
-    for row in db.query_all(clause, where_clause.get_parameters()):
-        tp = PROP_UNIT_CONVERTER[row["type"]]
-        enumeration = [
-            tp(res["enum_value"])
-            for res in db.query_all(
-                "SELECT enum_value FROM property_enumeration "
-                "WHERE property_id = ? ORDER BY rank ASC",
-                [row["property_id"]],
-            )
-        ]
-        if (
+        pt = db.prop_types.get(name)
+        candidates = [] if pt is None else [pt]
+    else:
+        candidates = db.prop_types.all()
+    return [
+        pt
+        for pt in candidates
+        if (with_type is None or pt.type == with_type.__name__)
+        and (multiple is None or pt.multiple is bool(multiple))
+        and (
             with_enum is None
-            or (len(enumeration) > 1 and set(enumeration) == set(with_enum))
-        ) and (default is None or enumeration[0] == default):
-            ret.append(
-                PropType(
-                    property_id=row["property_id"],
-                    name=row["name"],
-                    type=row["type"],
-                    multiple=bool(row["multiple"]),
-                    default=[] if row["multiple"] else [enumeration[0]],
-                    enumeration=enumeration if len(enumeration) > 1 else None,
-                )
-            )
-
-    return ret
+            or (pt.enumeration is not None and set(pt.enumeration) == set(with_enum))
+        )
+        and (default is None or db.prop_types.stored_default(pt.property_id) == default)
+    ]
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Collection, Iterable, Sequence
+from contextlib import contextmanager
+from typing import Any, Collection, Iterable, Iterator, Self, Sequence
 
 from pysaurus.application import exceptions
 from pysaurus.core import notifications
@@ -11,12 +12,19 @@ from pysaurus.core.notifying import DEFAULT_NOTIFIER
 from pysaurus.core.path_tree import PathTree
 from pysaurus.database.abstract_database import AbstractDatabase, Change
 from pysaurus.database.db_paths import Basename
+from pysaurus.database.db_utils import VideoStatusCounts
 from pysaurus.database.saurus.prop_type_search import prop_type_search
 from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+from pysaurus.database.saurus.query_plan import QueryPlan, explain_video_mega_group
 from pysaurus.database.saurus.saurus_database_algorithms import SaurusDatabaseAlgorithms
+from pysaurus.database.saurus.sql_functions import texts_to_fts
 from pysaurus.database.saurus.sql_useful_constants import WRITABLE_FIELDS
-from pysaurus.database.saurus.sql_utils import sql_placeholders
-from pysaurus.database.saurus.video_mega_group import video_mega_group
+from pysaurus.database.saurus.sql_utils import sql_in, sql_placeholders
+from pysaurus.database.saurus.sql_video_wrapper import PAGE_FIELD_NAMES
+from pysaurus.database.saurus.video_mega_group import (
+    video_mega_columns,
+    video_mega_group,
+)
 from pysaurus.database.saurus.video_mega_search import (
     video_mega_count,
     video_mega_exists,
@@ -67,8 +75,12 @@ class PysaurusCollection(AbstractDatabase):
             )
 
     def rename(self, new_name: str) -> None:
-        super().rename(new_name)
-        self._open_db()
+        # Database folder can't be moved while connections are open.
+        self.db.close()
+        try:
+            super().rename(new_name)
+        finally:
+            self._open_db()
 
     def _open_db(self) -> None:
         self.db = PysaurusConnection(self.ways.get_path(DB_SQL_PATH).path)
@@ -83,20 +95,10 @@ class PysaurusCollection(AbstractDatabase):
         page_number: int,
         selector: Selector | None = None,
     ):
-        grouped_by_moves = view.grouping and view.grouping.field == "move_id"
         output = video_mega_group(
             self.db,
-            sources=view.sources,
-            source_expression=view.source_expression,
-            grouping=view.grouping,
-            classifier=view.classifier,
-            group=view.group,
-            search=view.search,
-            sorting=view.sorting,
-            selector=selector,
-            page_size=page_size,
-            page_number=page_number,
-            with_moves=grouped_by_moves,
+            **self._get_view_arguments(view, page_size, page_number, selector),
+            thumbnails=self.thumbnails,
         )
         # Compute classifier stats from result groups
         output.classifier_stats = [
@@ -109,12 +111,81 @@ class PysaurusCollection(AbstractDatabase):
                 video.video_id
                 for source in view.sources
                 for video in self.get_videos(
-                    include=(), where={flag: True for flag in source}
+                    include=["video_id"], where={flag: True for flag in source}
                 )
             }
         )
         return output
 
+    def resolve_view_columns(
+        self,
+        view: ViewContext,
+        columns: Sequence[str],
+        selector: Selector | None = None,
+    ) -> Iterable[tuple]:
+        return video_mega_columns(
+            self.db, columns, **self._get_view_filters(view, selector)
+        )
+
+    def explain_query_videos(
+        self, view: ViewContext, page_size: int, page_number: int
+    ) -> list[QueryPlan]:
+        """Return query plans of queries run by query_videos()."""
+        return explain_video_mega_group(
+            self.db, **self._get_view_arguments(view, page_size, page_number)
+        )
+
+    def set_sql_stats(self, enabled: bool) -> bool:
+        if not enabled:
+            self.db.disable_sql_stats()
+        elif self.db.sql_stats is None:
+            self.db.enable_sql_stats()
+        return True
+
+    def get_sql_stats_report(self) -> str | None:
+        stats = self.db.sql_stats
+        return None if stats is None else stats.report()
+
+    @classmethod
+    def _get_view_filters(
+        cls, view: ViewContext, selector: Selector | None = None
+    ) -> dict:
+        return {
+            "sources": view.sources,
+            "source_expression": view.source_expression,
+            "grouping": view.grouping,
+            "classifier": view.classifier,
+            "group": view.group,
+            "search": view.search,
+            "sorting": view.sorting,
+            "selector": selector,
+        }
+
+    @classmethod
+    def _get_view_arguments(
+        cls,
+        view: ViewContext,
+        page_size: int,
+        page_number: int,
+        selector: Selector | None = None,
+    ) -> dict:
+        return {
+            **cls._get_view_filters(view, selector),
+            "page_size": page_size,
+            "page_number": page_number,
+            "include": PAGE_FIELD_NAMES,
+            "with_moves": bool(view.grouping and view.grouping.field == "move_id"),
+        }
+
+    @contextmanager
+    def batch(self) -> Iterator[Self]:
+        """Run all writes of the block in one SQL transaction.
+
+        FTS properties are flushed once, just before commit.
+        """
+        with self.db.batch():
+            yield self
+
     def _set_date(self, date: Date):
         self.db.modify("UPDATE collection SET date_updated = ?", [date.time])
 
@@ -148,19 +219,20 @@ class PysaurusCollection(AbstractDatabase):
     ) -> dict[int, list[PropUnitType]]:
         (pt,) = self.get_prop_types(name=name)
         output = {}
+        where = "p.name = ?"
+        parameters = [name]
+        if indices:
+            in_query, in_parameters = sql_in("pv.video_id", indices)
+            where += f" AND {in_query}"
+            parameters += in_parameters
         with self.db:
             for row in self.db.query(
                 "SELECT pv.video_id, pv.property_value "
                 "FROM video_property_value AS pv "
                 "JOIN property AS p "
                 "ON pv.property_id = p.property_id "
-                "WHERE p.name = ?"
-                + (
-                    f" AND pv.video_id IN ({sql_placeholders(len(indices))})"
-                    if indices
-                    else ""
-                ),
-                [name] + list(indices),
+                f"WHERE {where}",
+                parameters,
             ):
                 output.setdefault(row[0], []).append(pt.from_string(row[1]))
         return output
@@ -177,82 +249,80 @@ class PysaurusCollection(AbstractDatabase):
         (pt,) = self.get_prop_types(name=name)
         video_ids = list(updates.keys())
         if len(video_ids) == 1 and video_ids[0] is None:
-            placeholders_string = None
+            in_query = None
         else:
             if not all(isinstance(video_id, int) for video_id in video_ids):
                 raise TypeError("All video_ids must be integers")
-            placeholders_string = sql_placeholders(len(video_ids))
+            in_query, in_parameters = sql_in("video_id", video_ids)
         for video_id in video_ids:
             updates[video_id] = pt.instantiate(updates[video_id])
 
         property_id = pt.property_id
 
-        if placeholders_string is None:
-            values = updates[None]
-            # Update all video
-            if action == Change.REMOVE:
-                self.db.modify_many(
-                    "DELETE FROM video_property_value "
-                    "WHERE property_id = ? "
-                    "AND property_value = ?",
-                    [(property_id, value) for value in values],
-                )
-            else:
-                all_video_ids = [
-                    row["video_id"]
-                    for row in self.db.query_all("SELECT video_id FROM video")
-                ]
-                if action == Change.REPLACE:
-                    self.db.modify(
-                        "DELETE FROM video_property_value WHERE property_id = ?",
-                        [property_id],
+        with self.batch():
+            if in_query is None:
+                values = updates[None]
+                # Update all video
+                if action == Change.REMOVE:
+                    self.db.modify_many(
+                        "DELETE FROM video_property_value "
+                        "WHERE property_id = ? "
+                        "AND property_value = ?",
+                        [(property_id, value) for value in values],
+                    )
+                else:
+                    all_video_ids = [
+                        row["video_id"]
+                        for row in self.db.query_all("SELECT video_id FROM video")
+                    ]
+                    if action == Change.REPLACE:
+                        self.db.modify(
+                            "DELETE FROM video_property_value WHERE property_id = ?",
+                            [property_id],
+                        )
+                    self.db.modify_many(
+                        "INSERT OR IGNORE INTO video_property_value "
+                        "(video_id, property_id, property_value) VALUES (?, ?, ?)",
+                        (
+                            (video_id, property_id, value)
+                            for video_id in all_video_ids
+                            for value in values
+                        ),
                     )
-                self.db.modify_many(
-                    "INSERT OR IGNORE INTO video_property_value "
-                    "(video_id, property_id, property_value) VALUES (?, ?, ?)",
-                    (
-                        (video_id, property_id, value)
-                        for video_id in all_video_ids
-                        for value in values
-                    ),
-                )
-        else:
-            # Update only video indices present in `updates`
-            if action == Change.REMOVE:
-                self.db.modify_many(
-                    "DELETE FROM video_property_value "
-                    "WHERE video_id = ? "
-                    "AND property_id = ? "
-                    "AND property_value = ? ",
-                    [
-                        (video_id, property_id, value)
-                        for video_id, values in updates.items()
-                        for value in values
-                    ],
-                )
             else:
-                if action == Change.REPLACE:
-                    self.db.modify(
-                        f"DELETE FROM video_property_value "
-                        f"WHERE property_id = ? "
-                        f"AND video_id IN ({placeholders_string})",
-                        [property_id] + video_ids,
+                # Update only video indices present in `updates`
+                if action == Change.REMOVE:
+                    self.db.modify_many(
+                        "DELETE FROM video_property_value "
+                        "WHERE video_id = ? "
+                        "AND property_id = ? "
+                        "AND property_value = ? ",
+                        [
+                            (video_id, property_id, value)
+                            for video_id, values in updates.items()
+                            for value in values
+                        ],
+                    )
+                else:
+                    if action == Change.REPLACE:
+                        self.db.modify(
+                            f"DELETE FROM video_property_value "
+                            f"WHERE property_id = ? AND {in_query}",
+                            [property_id] + in_parameters,
+                        )
+                    self.db.modify_many(
+                        "INSERT OR IGNORE INTO video_property_value "
+                        "(video_id, property_id, property_value) VALUES (?, ?, ?)",
+                        (
+                            (video_id, property_id, value)
+                            for video_id, values in updates.items()
+                            for value in values
+                        ),
                     )
-                self.db.modify_many(
-                    "INSERT OR IGNORE INTO video_property_value "
-                    "(video_id, property_id, property_value) VALUES (?, ?, ?)",
-                    (
-                        (video_id, property_id, value)
-                        for video_id, values in updates.items()
-                        for value in values
-                    ),
-                )
 
-        # 3. Update FTS5 properties column if property is string type
-        if pt.type == "str":
-            self._update_fts_properties(
-                None if placeholders_string is None else video_ids
-            )
+            # 3. Update FTS5 properties column if property is string type
+            if pt.type == "str":
+                self.db.before_commit(self._flush_fts_properties)
 
     def video_entry_set_tags(
         self, video_id: int, properties: dict, merge=False
@@ -290,7 +360,7 @@ class PysaurusCollection(AbstractDatabase):
             ),
         )
         if string_properties:
-            self._update_fts_properties([video_id])
+            self.db.before_commit(self._flush_fts_properties)
         self._notify_fields_modified(list(properties.keys()), is_property=True)
 
     def get_prop_types(
@@ -321,29 +391,20 @@ class PysaurusCollection(AbstractDatabase):
             "VALUES (?, ?, ?)",
             [(property_id, value, rank) for rank, value in enumerate(enum_values)],
         )
+        self.db.prop_types.invalidate()
 
     def prop_type_del(self, name: str):
-        video_ids = []
-        pt = self.db.query_one(
-            "SELECT property_id, type FROM property WHERE name = ?", [name]
-        )
+        pt = self.db.prop_types.get(name)
         if pt is None:
             raise ValueError(f"Property not found: {name}")
-        if pt["type"] == "str":
-            with self.db:
-                video_ids = [
-                    row[0]
-                    for row in self.db.query(
-                        "SELECT DISTINCT video_id FROM video_property_value "
-                        "WHERE property_id = ?",
-                        [pt["property_id"]],
-                    )
-                ]
 
+        # Property values are deleted by cascade,
+        # and marked for FTS update by triggers.
         self.db.modify("DELETE FROM property WHERE name = ?", [name])
+        self.db.prop_types.invalidate()
 
-        if video_ids:
-            self._update_fts_properties(video_ids)
+        if pt.type == "str":
+            self.db.before_commit(self._flush_fts_properties)
         self._notify_fields_modified([name], is_property=True)
 
     def prop_type_set_name(self, old_name, new_name):
@@ -353,6 +414,7 @@ class PysaurusCollection(AbstractDatabase):
             self.db.modify(
                 "UPDATE property SET name = ? WHERE name = ?", [new_name, old_name]
             )
+            self.db.prop_types.invalidate()
 
     def prop_type_set_multiple(self, name: str, multiple: bool) -> None:
         props = self.get_prop_types(name=name)
@@ -369,12 +431,13 @@ class PysaurusCollection(AbstractDatabase):
                     "GROUP BY p.video_id ORDER BY nb DESC LIMIT 1",
                     [pt.property_id],
                 )
-                if res["nb"] > 1:
+                if res is not None and res["nb"] > 1:
                     raise exceptions.PropertyToUniqueError(name, res["filename"])
             self.db.modify(
                 "UPDATE property SET multiple = ? WHERE name = ?",
                 [int(bool(multiple)), name],
             )
+            self.db.prop_types.invalidate()
 
     def get_videos(
         self,
@@ -388,8 +451,27 @@ class PysaurusCollection(AbstractDatabase):
         )
 
     def count_videos(self, *, where: dict | None = None) -> int:
+        if VideoStatusCounts.accepts(where):
+            # Only status flags: read maintained counters.
+            return self.get_status_counts().count(**(where or {}))
         return video_mega_count(self.db, where=where)
 
+    def get_status_counts(self) -> VideoStatusCounts:
+        return VideoStatusCounts(
+            {
+                (
+                    bool(row["discarded"]),
+                    bool(row["unreadable"]),
+                    bool(row["is_file"]),
+                    bool(row["with_thumbnails"]),
+                ): row["count"]
+                for row in self.db.query_all(
+                    "SELECT discarded, unreadable, is_file, with_thumbnails, count "
+                    "FROM video_status_count"
+                )
+            }
+        )
+
     def has_videos(self, *, where: dict | None = None) -> bool:
         return video_mega_exists(self.db, where=where)
 
@@ -446,6 +528,7 @@ class PysaurusCollection(AbstractDatabase):
 
     def video_entry_del(self, video_id: int) -> None:
         self.db.modify("DELETE FROM video WHERE video_id = ?", [video_id])
+        self.thumbnails.invalidate([video_id])
         self._notify_fields_modified(["move_id"])
 
     def videos_set_field(self, field: str, changes: dict[int, Any]):
@@ -459,11 +542,12 @@ class PysaurusCollection(AbstractDatabase):
         video_entries: list[VideoEntry],
         runtime_info: dict[AbsolutePath, VideoRuntimeInfo],
     ) -> None:
-        self._map_filenames_to_video_ids(video_entries)
-        old_entries = [entry for entry in video_entries if entry.video_id is not None]
-        new_entries = [entry for entry in video_entries if entry.video_id is None]
-        self._update_video_entries(old_entries, runtime_info)
-        self._add_pure_new_entries(new_entries, runtime_info)
+        with self.batch():
+            self._map_filenames_to_video_ids(video_entries)
+            old_entries = [e for e in video_entries if e.video_id is not None]
+            new_entries = [e for e in video_entries if e.video_id is None]
+            self._update_video_entries(old_entries, runtime_info)
+            self._add_pure_new_entries(new_entries, runtime_info)
         unreadable = {
             entry.filename: entry.errors for entry in video_entries if entry.unreadable
         }
@@ -505,13 +589,10 @@ class PysaurusCollection(AbstractDatabase):
         # Consolidate DELETEs with IN clause for better performance
         video_ids = [entry.video_id for entry in entries]
         if video_ids:
-            placeholders = sql_placeholders(len(video_ids))
+            in_query, in_parameters = sql_in("video_id", video_ids)
+            self.db.modify(f"DELETE FROM video_error WHERE {in_query}", in_parameters)
             self.db.modify(
-                f"DELETE FROM video_error WHERE video_id IN ({placeholders})", video_ids
-            )
-            self.db.modify(
-                f"DELETE FROM video_language WHERE video_id IN ({placeholders})",
-                video_ids,
+                f"DELETE FROM video_language WHERE {in_query}", in_parameters
             )
         self.db.modify_many(
             "INSERT INTO video_error (video_id, error) VALUES (?, ?)", to_add_errors
@@ -534,11 +615,31 @@ class PysaurusCollection(AbstractDatabase):
             for entry in entries
         ]
         fields = list(dicts[0].keys())
+        # Compute FTS text in Python for whole batch, then stage it
+        # for on_video_insert trigger (see database.sql).
+        fts_texts = texts_to_fts(
+            text for row in dicts for text in (row["filename"], row["meta_title"])
+        )
         self.db.modify_many(
-            f"INSERT INTO video ({','.join(fields)}) "
-            f"VALUES ({','.join(f':{field}' for field in fields)})",
-            dicts,
+            "INSERT OR REPLACE INTO video_text_staging "
+            "(filename, filename_fts, meta_title_fts) VALUES (?, ?, ?)",
+            (
+                (
+                    row["filename"],
+                    fts_texts[row["filename"]],
+                    fts_texts[row["meta_title"]],
+                )
+                for row in dicts
+            ),
         )
+        try:
+            self.db.modify_many(
+                f"INSERT INTO video ({','.join(fields)}) "
+                f"VALUES ({','.join(f':{field}' for field in fields)})",
+                dicts,
+            )
+        finally:
+            self.db.modify("DELETE FROM video_text_staging")
         self._map_filenames_to_video_ids(entries, strict=True)
         errors = [
             (entry.video_id, error) for entry in entries for error in entry.errors
@@ -569,13 +670,11 @@ class PysaurusCollection(AbstractDatabase):
         entry_map = {entry.filename: entry for entry in entries}
         if len(entry_map) != len(entries):
             raise ValueError("Duplicate filenames in entries")
-        filenames = list(entry_map.keys())
+        in_query, in_parameters = sql_in("filename", entry_map.keys())
         nb_matched = 0
         with db:
             for row in db.query(
-                f"SELECT filename, video_id FROM video "
-                f"WHERE filename IN ({sql_placeholders(len(filenames))})",
-                filenames,
+                f"SELECT filename, video_id FROM video WHERE {in_query}", in_parameters
             ):
                 entry_map[row[0]].video_id = row[1]
                 nb_matched += 1
@@ -583,39 +682,48 @@ class PysaurusCollection(AbstractDatabase):
             raise RuntimeError(f"Expected {len(entries)} video IDs, got {nb_matched}")
         return entry_map
 
-    def _update_fts_properties(self, video_ids=None):
+    def _flush_fts_properties(self) -> None:
         """Update the `properties` column in FTS5 video_text table.
 
-        Rebuilds properties from video_property_text view.
+        Also update raw `properties` column in video_phrase table.
+
+        Only videos recorded in video_text_dirty (by triggers on
+        video_property_value) are recomputed. Their string property values
+        are read in one query and converted to FTS text in Python in one
+        batch, so cost is proportional to what changed.
         Filename and meta_title are handled by triggers.
 
-        For small sets, uses modify_many with per-row subquery.
-        For large sets (>half the table), falls back to full table UPDATE...FROM
-        which is faster due to single-pass optimization.
+        Rows are updated one by one with modify_many.
         Avoids WHERE rowid IN(...) which is extremely slow on FTS5.
         """
-        if video_ids is not None:
-            total = self.db.query_one("SELECT COUNT(*) FROM video_text")[0]
-            if len(video_ids) > total // 2:
-                video_ids = None
-        if video_ids is None:
-            self.db.modify(
-                "UPDATE video_text SET properties = ("
-                "SELECT pysaurus_text_to_fts(property_text) "
-                "FROM video_property_text WHERE video_id = video_text.rowid"
-                ")"
-            )
-        else:
-            self.db.modify_many(
-                "UPDATE video_text SET properties = ("
-                "SELECT pysaurus_text_to_fts(property_text) "
-                "FROM video_property_text WHERE video_id = ?"
-                ") WHERE rowid = ?",
-                [(vid, vid) for vid in video_ids],
-            )
+        rows = self.db.query_all(
+            "SELECT d.video_id, GROUP_CONCAT(pv.property_value, ';') "
+            "FROM video_text_dirty AS d "
+            "LEFT JOIN video_property_value AS pv ON pv.video_id = d.video_id "
+            "AND pv.property_id IN (SELECT property_id FROM property WHERE type = 'str') "
+            "GROUP BY d.video_id"
+        )
+        if not rows:
+            return
+        fts_texts = texts_to_fts(row[1] for row in rows)
+        self.db.modify_many(
+            "UPDATE video_text SET properties = ? WHERE rowid = ?",
+            [(fts_texts[row[1]], row[0]) for row in rows],
+        )
+        self.db.modify_many(
+            "UPDATE video_phrase SET properties = ? WHERE rowid = ?",
+            [(row[1], row[0]) for row in rows],
+        )
+        self.db.modify_many(
+            "DELETE FROM video_text_dirty WHERE video_id = ?",
+            [(row[0],) for row in rows],
+        )
 
     def repair_fts(self):
-        """Rebuild FTS5 video_text table and triggers from scratch."""
+        """Rebuild FTS5 video_text table and triggers from scratch.
+
+        Also refill video_phrase table used for exact search.
+        """
         # Drop all triggers and table
         self.db.modify("DROP TRIGGER IF EXISTS on_video_insert")
         self.db.modify("DROP TRIGGER IF EXISTS on_video_update_filename")
@@ -630,18 +738,24 @@ class PysaurusCollection(AbstractDatabase):
         self.db.modify(
             "CREATE TRIGGER on_video_insert AFTER INSERT ON video BEGIN "
             "INSERT INTO video_text (rowid, filename, meta_title) "
-            "VALUES (NEW.video_id, pysaurus_text_to_fts(NEW.filename), "
-            "pysaurus_text_to_fts(NEW.meta_title)); END"
+            "VALUES (NEW.video_id, "
+            "COALESCE((SELECT filename_fts FROM video_text_staging "
+            "WHERE filename = NEW.filename), pysaurus_text_to_fts(NEW.filename)), "
+            "COALESCE((SELECT meta_title_fts FROM video_text_staging "
+            "WHERE filename = NEW.filename), pysaurus_text_to_fts(NEW.meta_title))); "
+            "END"
         )
         self.db.modify(
             "CREATE TRIGGER on_video_update_filename "
-            "AFTER UPDATE OF filename ON video BEGIN "
+            "AFTER UPDATE OF filename ON video "
+            "WHEN OLD.filename IS NOT NEW.filename BEGIN "
             "UPDATE video_text SET filename = pysaurus_text_to_fts(NEW.filename) "
             "WHERE rowid = OLD.video_id; END"
         )
         self.db.modify(
             "CREATE TRIGGER on_video_update_meta_title "
-            "AFTER UPDATE OF meta_title ON video BEGIN "
+            "AFTER UPDATE OF meta_title ON video "
+            "WHEN OLD.meta_title IS NOT NEW.meta_title BEGIN "
             "UPDATE video_text SET meta_title = pysaurus_text_to_fts(NEW.meta_title) "
             "WHERE rowid = OLD.video_id; END"
         )
@@ -657,15 +771,24 @@ class PysaurusCollection(AbstractDatabase):
             "FROM video AS v LEFT JOIN video_property_text AS t "
             "ON v.video_id = t.video_id"
         )
+        self.db.modify("DELETE FROM video_text_dirty")
+        # Rebuild raw text index for exact search
+        self.db.modify("DELETE FROM video_phrase")
+        self.db.modify(
+            "INSERT INTO video_phrase (rowid, filename, meta_title, properties) "
+            "SELECT v.video_id, v.filename, v.meta_title, t.property_text "
+            "FROM video AS v LEFT JOIN video_property_text AS t "
+            "ON v.video_id = t.video_id"
+        )
 
     def _thumbnails_add(self, filename_to_thumb_name: dict[str, str]) -> None:
+        in_query, in_parameters = sql_in("filename", filename_to_thumb_name.keys())
         with self.db:
             filename_to_video_id = {
                 row[0]: row[1]
                 for row in self.db.query(
-                    f"SELECT filename, video_id FROM video "
-                    f"WHERE filename IN ({sql_placeholders(len(filename_to_thumb_name))})",
-                    list(filename_to_thumb_name.keys()),
+                    f"SELECT filename, video_id FROM video WHERE {in_query}",
+                    in_parameters,
                 )
             }
         if len(filename_to_video_id) != len(filename_to_thumb_name):
@@ -683,3 +806,4 @@ class PysaurusCollection(AbstractDatabase):
                 for filename, thumb_path in filename_to_thumb_name.items()
             ),
         )
+        self.thumbnails.invalidate(filename_to_video_id.values())
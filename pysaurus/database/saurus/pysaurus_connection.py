@@ -1,22 +1,54 @@
 import inspect
 import os
-from typing import Iterable
+import sqlite3
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Self
 
-from skullite import Skullite, SkulliteFunction
+from skullite import DbID, Skullite, SkulliteFunction
 
 from pysaurus.database.saurus import sql_functions
+from pysaurus.database.saurus.connection_pool import ConnectionPool
 from pysaurus.database.saurus.migrations import LATEST_VERSION, MIGRATIONS
+from pysaurus.database.saurus.prop_type_registry import PropTypeRegistry
+from pysaurus.database.saurus.sql_stats import SqlStats
+
+
+class _Batch:
+    """Unit of work of one thread: write cursor and pre-commit callbacks."""
+
+    __slots__ = ("cursor", "callbacks")
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self.cursor = cursor
+        self.callbacks: list[Callable[[], None]] = []
 
 
 class PysaurusConnection(Skullite):
-    __slots__ = ()
+    """Collection database.
+
+    On disk, once opened, queries go through a connection pool
+    (see connection_pool): writes use the writer connection,
+    reads use a read-only connection lent for the call, or for the
+    whole `with db:` block. In a batch, everything uses the writer.
+    In memory, connections are managed by Skullite.
+
+    Statement statistics are recorded in `sql_stats` once enabled
+    with `enable_sql_stats()`.
+    """
+
+    __slots__ = ("prop_types", "sql_stats", "_pool", "__weakref__")
 
     _SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "database.sql")
 
     def __init__(self, db_path: str | None):
+        self._pool: ConnectionPool | None = None
+        self.sql_stats: SqlStats | None = None
         super().__init__(
             db_path, functions=self.register_pysaurus_functions(), persistent=False
         )
+        self.prop_types = PropTypeRegistry(self)
         if self._is_fresh_db():
             # Brand new database: schema.sql creates everything at the
             # latest version, then we record the version.
@@ -31,6 +63,219 @@ class PysaurusConnection(Skullite):
             # use IF NOT EXISTS, so this is a no-op when nothing changed.
             self._migrate()
             self._run_schema_script()
+            self._analyze_if_needed()
+        if db_path is not None:
+            pool = self._pool = ConnectionPool(db_path, self._functions)
+            weakref.finalize(self, pool.close)
+
+    def close(self) -> None:
+        """Close pooled connections. Next queries open temporary ones."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self) -> Self:
+        """Bind a connection to current thread. Re-entrant in a same thread."""
+        local = self._thread_local
+        depth = getattr(local, "depth", 0)
+        if not depth:
+            if self._pool is None:
+                super().__enter__()
+            else:
+                local.lease = self._pool.reader()
+                self._persistent = local.lease.__enter__()
+        local.depth = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        local = self._thread_local
+        local.depth -= 1
+        if not local.depth:
+            if getattr(local, "lease", None) is None:
+                super().__exit__(exc_type, exc_val, exc_tb)
+            else:
+                self._persistent = None
+                lease, local.lease = local.lease, None
+                lease.__exit__(exc_type, exc_val, exc_tb)
+
+    def connect(self):
+        connection = self._persistent
+        if connection is not None:
+            return connection
+        if self._pool is None:
+            return super().connect()
+        return self._pool.reader()
+
+    @contextmanager
+    def _writer(self):
+        """Lend writer connection.
+
+        Without pool, use connection bound to current thread,
+        or bind one for the block.
+        """
+        if self._pool is not None:
+            with self._pool.writer() as connection:
+                yield connection
+        elif self._persistent is not None:
+            yield self._persistent
+        else:
+            with self:
+                yield self._persistent
+
+    @property
+    def _batch(self) -> _Batch | None:
+        return getattr(self._thread_local, "batch", None)
+
+    def in_batch(self) -> bool:
+        return self._batch is not None
+
+    @contextmanager
+    def batch(self) -> Iterator[Self]:
+        """Run all writes of the block in one transaction.
+
+        Writes use one connection (so its statement cache is reused),
+        locked for current thread, and are committed once when leaving
+        the block, or rolled back if an exception is raised. Callbacks
+        registered with `before_commit()` are run just before commit.
+
+        A batch opened inside another batch of the same thread just
+        joins it.
+        """
+        if self.in_batch():
+            yield self
+            return
+        local = self._thread_local
+        with self._writer() as writer:
+            previous, self._persistent = self._persistent, writer
+            # Bound like in `with db:`, so that nested blocks keep writer.
+            local.depth = getattr(local, "depth", 0) + 1
+            connection = writer.connection
+            batch = local.batch = _Batch(connection.cursor())
+            try:
+                batch.cursor.execute("BEGIN")
+                yield self
+                while batch.callbacks:
+                    batch.callbacks.pop(0)()
+            except BaseException:
+                connection.rollback()
+                raise
+            else:
+                connection.commit()
+            finally:
+                local.batch = None
+                local.depth -= 1
+                self._persistent = previous
+
+    def before_commit(self, callback: Callable[[], None]) -> None:
+        """Defer callback until current batch is about to be committed.
+
+        A callback registered many times in a batch is run once.
+        Outside a batch, callback is run immediately.
+        """
+        batch = self._batch
+        if batch is None:
+            callback()
+        elif callback not in batch.callbacks:
+            batch.callbacks.append(callback)
+
+    def modify(self, query, parameters=(), many=False) -> DbID | None:
+        if self.sql_stats is None:
+            return self._modify(query, parameters, many)[0]
+        start = time.perf_counter_ns()
+        last_id, rows = self._modify(query, parameters, many)
+        elapsed = time.perf_counter_ns() - start
+        self._record(query, "<many>" if many else parameters, elapsed, rows)
+        return last_id
+
+    def _modify(self, query, parameters, many) -> tuple[DbID | None, int]:
+        """Run a modification query. Return last row ID and changed row count."""
+        batch = self._batch
+        if batch is None:
+            if self._pool is None:
+                last_id = super().modify(query, parameters, many)
+                persistent = self._persistent
+                return last_id, persistent.cursor.rowcount if persistent else -1
+            with self._pool.writer() as connection:
+                last_id = connection.modify(query, parameters, many)
+                return last_id, connection.cursor.rowcount
+        # In a batch: no commit, see batch().
+        if many:
+            batch.cursor.executemany(query, parameters)
+        else:
+            batch.cursor.execute(query, parameters)
+        last_id = batch.cursor.lastrowid
+        return last_id if last_id is None else DbID(last_id), batch.cursor.rowcount
+
+    def query(self, query, parameters=()) -> Iterator[sqlite3.Row]:
+        rows = super().query(query, parameters)
+        if self.sql_stats is None:
+            return rows
+        return self._timed_rows(query, parameters, rows)
+
+    def query_one(self, query, parameters=()) -> sqlite3.Row:
+        if self.sql_stats is None:
+            return super().query_one(query, parameters)
+        start = time.perf_counter_ns()
+        row = super().query_one(query, parameters)
+        elapsed = time.perf_counter_ns() - start
+        self._record(query, parameters, elapsed, int(row is not None))
+        return row
+
+    def query_all(self, query, parameters=()) -> list[sqlite3.Row]:
+        if self.sql_stats is None:
+            return super().query_all(query, parameters)
+        start = time.perf_counter_ns()
+        rows = super().query_all(query, parameters)
+        self._record(query, parameters, time.perf_counter_ns() - start, len(rows))
+        return rows
+
+    def enable_sql_stats(self, slow_ms: float = 50.0) -> SqlStats:
+        """Start recording statement statistics (replacing previous ones)."""
+        self.sql_stats = SqlStats(slow_ms)
+        return self.sql_stats
+
+    def disable_sql_stats(self) -> SqlStats | None:
+        """Stop recording statement statistics and return them."""
+        stats, self.sql_stats = self.sql_stats, None
+        return stats
+
+    def _timed_rows(self, query, parameters, rows) -> Iterator[sqlite3.Row]:
+        # Only time spent fetching rows is measured, not time spent by caller.
+        elapsed = 0
+        nb_rows = 0
+        try:
+            while True:
+                start = time.perf_counter_ns()
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    break
+                finally:
+                    elapsed += time.perf_counter_ns() - start
+                nb_rows += 1
+                yield row
+        finally:
+            self._record(query, parameters, elapsed, nb_rows)
+
+    def _record(self, query, parameters, elapsed_ns: int, rows: int) -> None:
+        stats = self.sql_stats
+        local = self._thread_local
+        if stats is None or getattr(local, "explaining", False):
+            return
+        slow = stats.record(query, parameters, elapsed_ns, rows)
+        if slow is not None and slow.plan is None:
+            # Capture plan of first slow execution of this statement template.
+            from pysaurus.database.saurus.query_plan import QueryPlan
+
+            plan_parameters = () if isinstance(parameters, str) else parameters
+            local.explaining = True
+            try:
+                details = QueryPlan.explain(self, query, plan_parameters).details
+            except sqlite3.Error as exc:
+                details = [f"(no plan: {exc})"]
+            finally:
+                local.explaining = False
+            stats.set_plan(slow, details)
 
     def _is_fresh_db(self) -> bool:
         """Return True if the database has no video table yet.
@@ -49,6 +294,28 @@ class PysaurusConnection(Skullite):
         with self.connect() as connection:
             connection.script(script)
 
+    def _analyze_if_needed(self) -> None:
+        """Collect planner statistics if video table has none yet.
+
+        Without statistics, SQLite cannot tell selective indexes
+        from others (e.g. move detection index from source flags index).
+        Statistics are collected once, when collection is first opened
+        with videos (or after a migration dropped indexes).
+        """
+        if not self.query_one("SELECT EXISTS (SELECT 1 FROM video)")[0]:
+            return
+        has_stats = (
+            self.query_one(
+                "SELECT EXISTS "
+                "(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1')"
+            )[0]
+            and self.query_one(
+                "SELECT EXISTS (SELECT 1 FROM sqlite_stat1 WHERE tbl = 'video')"
+            )[0]
+        )
+        if not has_stats:
+            self.modify("ANALYZE")
+
     def _migrate(self) -> None:
         """Apply versioned migrations to bring the database up to date.
 
@@ -0,0 +1,108 @@
+"""
+EXPLAIN QUERY PLAN report for queries generated by video_mega_group().
+
+video_mega_group() is run once through a recording connection, so that
+each generated query is captured with its parameters, then each query
+is explained on the real connection. Full table scans are flagged.
+"""
+
+from typing import Any, Sequence
+
+from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+from pysaurus.database.saurus.video_mega_group import video_mega_group
+
+
+class QueryPlan:
+    __slots__ = ("query", "parameters", "details")
+
+    def __init__(self, query: str, parameters: Sequence, details: list[str]):
+        self.query = query
+        self.parameters = parameters
+        # Plan lines, indented by depth.
+        self.details = details
+
+    @property
+    def full_scans(self) -> list[str]:
+        return full_scans(self.details)
+
+    @classmethod
+    def explain(
+        cls, db: PysaurusConnection, query: str, parameters: Sequence = ()
+    ) -> "QueryPlan":
+        depths = {0: -1}
+        details = []
+        for row in db.query_all(f"EXPLAIN QUERY PLAN {query}", parameters):
+            node_id, parent_id, _, detail = row
+            depth = depths[node_id] = depths.get(parent_id, -1) + 1
+            details.append("  " * depth + detail)
+        return cls(query, parameters, details)
+
+
+def full_scans(details: Sequence[str]) -> list[str]:
+    """Return plan lines reading a whole table.
+
+    `SCAN x USING [COVERING] INDEX` walks an index (e.g. for sorting),
+    so it is not flagged, nor are scans of virtual tables, of constant
+    rows and of subquery results (CTE, co-routines).
+    """
+    details = [detail.strip() for detail in details]
+    subqueries = {
+        detail.split()[1]
+        for detail in details
+        if detail.startswith(("MATERIALIZE ", "CO-ROUTINE "))
+    }
+    return [
+        detail
+        for detail in details
+        if detail.startswith("SCAN ")
+        and "USING " not in detail
+        and "VIRTUAL TABLE" not in detail
+        and "(subquery" not in detail
+        and detail != "SCAN CONSTANT ROW"
+        and detail.split()[1] not in subqueries
+    ]
+
+
+class _QueryRecorder:
+    """Connection proxy recording SELECT queries before running them."""
+
+    __slots__ = ("db", "queries")
+
+    def __init__(self, db: PysaurusConnection):
+        self.db = db
+        self.queries: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.db, name)
+
+    def __enter__(self):
+        self.db.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self.db.__exit__(exc_type, exc_val, exc_tb)
+
+    def _record(self, query: str, parameters: Sequence):
+        self.queries.append((query, tuple(parameters)))
+
+    def query(self, query, parameters=()):
+        self._record(query, parameters)
+        return self.db.query(query, parameters)
+
+    def query_one(self, query, parameters=()):
+        self._record(query, parameters)
+        return self.db.query_one(query, parameters)
+
+    def query_all(self, query, parameters=()):
+        self._record(query, parameters)
+        return self.db.query_all(query, parameters)
+
+
+def explain_video_mega_group(db: PysaurusConnection, **kwargs) -> list[QueryPlan]:
+    """Run video_mega_group(db, **kwargs) and explain each query it runs."""
+    recorder = _QueryRecorder(db)
+    video_mega_group(recorder, **kwargs)  # type: ignore[arg-type]
+    return [
+        QueryPlan.explain(db, query, parameters)
+        for query, parameters in recorder.queries
+    ]
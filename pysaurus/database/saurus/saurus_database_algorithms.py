@@ -1,5 +1,7 @@
+import json
 from typing import Collection, cast
 
+from pysaurus.application import exceptions
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.database.database_algorithms import DatabaseAlgorithms
 from pysaurus.video.video_runtime_info import VideoRuntimeInfo
@@ -19,6 +21,137 @@ class SaurusDatabaseAlgorithms(DatabaseAlgorithms):
                 ((p.path,) for p in existing_paths),
             )
 
+    def move_video_entries(self, moves: list[tuple[int, int]]):
+        """Move multiple video entries from not-found to found videos.
+
+        Merge is done with a few set-based queries on a temporary table
+        of moves, then source entries are deleted in one query.
+        """
+        from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
+
+        if not moves:
+            return
+        collection = cast(PysaurusCollection, self.db)
+        # Batch keeps one connection, where temporary table exists.
+        db = collection.db
+        with db.batch():
+            db.modify(
+                "CREATE TEMP TABLE IF NOT EXISTS video_move "
+                "(from_id INTEGER PRIMARY KEY, to_id INTEGER NOT NULL)"
+            )
+            db.modify("DELETE FROM temp.video_move")
+            db.modify_many(
+                "INSERT INTO temp.video_move (from_id, to_id) VALUES (?, ?)", moves
+            )
+            # Raising here rolls back batch, so a refused move writes nothing.
+            self._check_video_moves_table(collection)
+            # Add source property values to destination.
+            # Conflicts on unique properties were refused above.
+            db.modify(
+                "INSERT OR IGNORE INTO video_property_value "
+                "(video_id, property_id, property_value) "
+                "SELECT m.to_id, pv.property_id, pv.property_value "
+                "FROM temp.video_move AS m "
+                "JOIN video_property_value AS pv ON pv.video_id = m.from_id"
+            )
+            db.modify(
+                "UPDATE video SET "
+                "similarity_id = f.similarity_id, "
+                "similarity_id_reencoded = f.similarity_id_reencoded, "
+                "date_entry_modified = f.date_entry_modified_not_null, "
+                "date_entry_opened = f.date_entry_opened_not_null "
+                "FROM temp.video_move AS m "
+                "JOIN video AS f ON f.video_id = m.from_id "
+                "WHERE video.video_id = m.to_id"
+            )
+            db.modify(
+                "DELETE FROM video "
+                "WHERE video_id IN (SELECT from_id FROM temp.video_move)"
+            )
+            db.modify("DROP TABLE temp.video_move")
+            db.before_commit(collection._flush_fts_properties)
+        collection.thumbnails.invalidate([from_id for from_id, _ in moves])
+        collection._notify_fields_modified(["move_id"])
+
+    @classmethod
+    def _check_video_moves_table(cls, collection) -> None:
+        """Check moves loaded in temp.video_move.
+
+        Same checks as DatabaseAlgorithms._check_video_moves(), done in SQL,
+        so that only invalid moves and conflicts are loaded in Python.
+        """
+        db = collection.db
+        (nb_invalid,) = db.query_one(
+            "SELECT COUNT(*) FROM temp.video_move AS m "
+            "LEFT JOIN video AS f ON f.video_id = m.from_id AND f.is_file = 0 "
+            "LEFT JOIN video AS t ON t.video_id = m.to_id AND t.is_file = 1 "
+            "WHERE f.video_id IS NULL OR t.video_id IS NULL"
+        )
+        assert not nb_invalid, f"{nb_invalid} invalid move(s)"
+        shared = [
+            row[0]
+            for row in db.query_all(
+                "SELECT to_id FROM temp.video_move "
+                "GROUP BY to_id HAVING COUNT(*) > 1 ORDER BY to_id"
+            )
+        ]
+        if shared:
+            raise exceptions.SharedMoveDestination(shared)
+        # Unique properties with values on both sides, where a value on one
+        # side is missing on the other, i.e. where value sets differ.
+        conflicts = [
+            (row["from_id"], row["to_id"], row["name"], row["dst"], row["src"])
+            for row in db.query_all(
+                """
+                WITH conflict AS (
+                    SELECT DISTINCT m.from_id, m.to_id, s.property_id
+                    FROM temp.video_move AS m
+                    JOIN video_property_value AS s ON s.video_id = m.from_id
+                    JOIN property AS p
+                    ON p.property_id = s.property_id AND p.multiple = 0
+                    JOIN video_property_value AS d
+                    ON d.video_id = m.to_id AND d.property_id = s.property_id
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM video_property_value AS x
+                        WHERE x.video_id = m.to_id
+                        AND x.property_id = s.property_id
+                        AND x.property_value = s.property_value
+                    ) OR NOT EXISTS (
+                        SELECT 1 FROM video_property_value AS x
+                        WHERE x.video_id = m.from_id
+                        AND x.property_id = s.property_id
+                        AND x.property_value = d.property_value
+                    )
+                )
+                SELECT c.from_id, c.to_id, p.name,
+                (SELECT json_group_array(x.property_value)
+                FROM video_property_value AS x
+                WHERE x.video_id = c.to_id AND x.property_id = c.property_id) AS dst,
+                (SELECT json_group_array(x.property_value)
+                FROM video_property_value AS x
+                WHERE x.video_id = c.from_id AND x.property_id = c.property_id) AS src
+                FROM conflict AS c
+                JOIN property AS p ON p.property_id = c.property_id
+                ORDER BY c.from_id, p.name
+                """
+            )
+        ]
+        if conflicts:
+            raise exceptions.UniquePropertyMergeConflict(
+                [
+                    (from_id, to_id, name, *cls._prop_values(db, name, dst, src))
+                    for from_id, to_id, name, dst, src in conflicts
+                ]
+            )
+
+    @staticmethod
+    def _prop_values(db, name: str, *json_arrays: str) -> list[list]:
+        prop_type = db.prop_types.get(name)
+        return [
+            sorted(prop_type.from_string(value) for value in json.loads(json_array))
+            for json_array in json_arrays
+        ]
+
     def _find_video_paths_for_update(
         self, file_paths: dict[AbsolutePath, VideoRuntimeInfo]
     ) -> list[AbsolutePath]:
@@ -1,8 +1,7 @@
+import re
 from typing import Any, Iterable, Self
 
 from pysaurus.core import functions
-from pysaurus.database.saurus.sql_utils import FieldQuery
-from pysaurus.database.saurus.video_parser import VideoFieldQueryParser
 from pysaurus.dbview.view_tools import SearchDef
 
 
@@ -30,28 +29,30 @@ def convert_dict_series_to_sql(dicts: Iterable[dict]) -> tuple[str, list]:
 
 def search_to_sql(search: SearchDef) -> tuple[str, list[str]]:
     assert search.text is not None
-    terms = []
-    for piece in functions.string_to_pieces(search.text):
-        if piece in ("and", "or"):
-            piece = f'"{piece}"'
-        terms.append(piece)
     if search.cond == "exact":
-        # FTS5 pre-filter with adjacency (+), then LIKE on raw data for
-        # precision.  Last term gets prefix * so partial-word matches work
-        # (e.g. "Some.Val" finds "Some.Value").  LIKE eliminates false
-        # positives (e.g. "Some Valentine").
-        exact_phrase = search.text.lower()
-        terms[-1] = terms[-1] + "*"
-        query = (
-            "SELECT vt.rowid FROM video_text AS vt "
-            "JOIN video AS v ON v.video_id = vt.rowid "
-            "LEFT JOIN video_property_text AS pt ON pt.video_id = v.video_id "
-            "WHERE vt.video_text MATCH ? "
-            "AND LOWER(v.filename || ' ' || v.meta_title || ' ' || COALESCE(pt.property_text, '')) LIKE ?"
-        )
-        where = [" + ".join(terms), f"%{exact_phrase}%"]
+        # Substring search (case-insensitive) in raw filename, meta title
+        # or string properties, using trigram index in video_phrase.
+        phrase = search.text
+        if len(phrase) >= 3:
+            query = "SELECT rowid FROM video_phrase WHERE video_phrase MATCH ?"
+            where = ['"' + phrase.replace('"', '""') + '"']
+        else:
+            # Trigram index cannot match less than 3 characters:
+            # scan video_phrase only (no join).
+            pattern = "%" + re.sub(r"([%_\\])", r"\\\1", phrase) + "%"
+            query = (
+                "SELECT rowid FROM video_phrase "
+                "WHERE filename LIKE ? ESCAPE '\\' "
+                "OR meta_title LIKE ? ESCAPE '\\' "
+                "OR properties LIKE ? ESCAPE '\\'"
+            )
+            where = [pattern] * 3
     else:
-        terms = [f"{piece}*" for piece in terms]
+        terms = []
+        for piece in functions.string_to_pieces(search.text):
+            if piece in ("and", "or"):
+                piece = f'"{piece}"'
+            terms.append(f"{piece}*")
         if search.cond == "and":
             query = "SELECT rowid FROM video_text WHERE video_text MATCH ?"
             where = [" ".join(terms)]
@@ -90,11 +91,3 @@ class GroupCount:
     @classmethod
     def keyof(cls, group_count: Self) -> Any:
         return group_count.get_value()
-
-
-class ProviderVideoParser(VideoFieldQueryParser):
-    def without_thumbnails(self, value) -> FieldQuery:
-        return FieldQuery("IIF(LENGTH(vt.thumbnail), 1, 0)", [int(not value)])
-
-    def with_thumbnails(self, value) -> FieldQuery:
-        return FieldQuery("IIF(LENGTH(vt.thumbnail), 1, 0)", [int(value)])
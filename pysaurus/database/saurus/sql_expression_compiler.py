@@ -4,8 +4,8 @@ The compiler walks the IR tree produced by ExpressionParser and generates
 a (sql_where, params) tuple that can be injected into a QueryMaker via
 where_builder.append_query(sql_where, *params).
 
-All SQL expressions assume the video table is aliased as ``v`` and the
-thumbnail table as ``vt`` (both set up by video_mega_group's QueryMaker).
+All SQL expressions assume the video table is aliased as ``v``
+(set up by video_mega_group's QueryMaker).
 """
 
 from __future__ import annotations
@@ -89,8 +89,8 @@ ATTRIBUTE_SQL_MAP: dict[str, str] = {
     "date": "v.mtime",
     "date_entry_modified": "v.date_entry_modified_not_null",
     "date_entry_opened": "v.date_entry_opened_not_null",
-    # Requires LEFT JOIN video_thumbnail (already present in video_mega_group)
-    "with_thumbnails": "IIF(LENGTH(vt.thumbnail), 1, 0)",
+    # Flag maintained by triggers on video_thumbnail (no join needed)
+    "with_thumbnails": "v.has_thumbnail",
 }
 
 # Set attributes: stored in separate tables
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.functions import string_to_pieces
 from pysaurus.core.semantic_text import pad_numbers_in_string
@@ -30,5 +32,14 @@ def pysaurus_text_to_fts(text: str) -> str | None:
     return " ".join(pieces)
 
 
+def texts_to_fts(texts: Iterable[str | None]) -> dict[str | None, str | None]:
+    """Convert many texts with `pysaurus_text_to_fts` in Python, in one batch.
+
+    Each distinct text is converted only once (bulk edits often set
+    the same value on many videos). Not registered as a SQL function.
+    """
+    return {text: pysaurus_text_to_fts(text) for text in set(texts)}
+
+
 def pysaurus_text_with_numbers(text: str, padding: int) -> str:
     return pad_numbers_in_string(text, padding)
@@ -0,0 +1,144 @@
+"""
+SQL statement statistics, recorded by PysaurusConnection when enabled.
+
+Statements are grouped by template (query text with whitespace collapsed
+and placeholder lists shortened), with call count, row count and timing.
+Executions slower than a threshold are kept in a bounded slow-query log,
+with the query plan captured once per template.
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Sequence
+
+_REGEX_SPACES = re.compile(r"\s+")
+_REGEX_PLACEHOLDERS = re.compile(r"\?(\s*,\s*\?)+")
+
+
+def statement_template(query: str) -> str:
+    """Return statement template, e.g. `a IN (?, ?, ?)` => `a IN (?, ...)`."""
+    return _REGEX_PLACEHOLDERS.sub("?, ...", _REGEX_SPACES.sub(" ", query).strip())
+
+
+def _short_repr(value, size=200) -> str:
+    text = repr(value)
+    return text if len(text) <= size else f"{text[:size]}..."
+
+
+class StatementStats:
+    __slots__ = ("template", "calls", "rows", "total_ns", "max_ns")
+
+    def __init__(self, template: str):
+        self.template = template
+        self.calls = 0
+        self.rows = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1e6
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_ns / 1e6
+
+
+class SlowQuery:
+    __slots__ = ("template", "query", "parameters", "ms", "plan")
+
+    def __init__(self, template: str, query: str, parameters: str, ms: float):
+        self.template = template
+        self.query = query
+        self.parameters = parameters
+        self.ms = ms
+        # Query plan lines, or None if not captured yet.
+        self.plan: list[str] | None = None
+
+
+class SqlStats:
+    __slots__ = ("slow_ms", "statements", "slow_queries", "_plans", "_lock")
+
+    def __init__(self, slow_ms: float = 50.0, max_slow_queries: int = 100):
+        self.slow_ms = slow_ms
+        self.statements: dict[str, StatementStats] = {}
+        self.slow_queries: deque[SlowQuery] = deque(maxlen=max_slow_queries)
+        # template => query plan
+        self._plans: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, query: str, parameters, elapsed_ns: int, rows: int
+    ) -> SlowQuery | None:
+        """Record an execution. Return a slow-query entry if execution is slow.
+
+        Returned entry has no plan if none was captured for its template yet:
+        caller may then capture it with `set_plan()`.
+        """
+        template = statement_template(query)
+        with self._lock:
+            stats = self.statements.get(template)
+            if stats is None:
+                stats = self.statements[template] = StatementStats(template)
+            stats.calls += 1
+            stats.rows += rows
+            stats.total_ns += elapsed_ns
+            stats.max_ns = max(stats.max_ns, elapsed_ns)
+            ms = elapsed_ns / 1e6
+            if ms < self.slow_ms:
+                return None
+            slow = SlowQuery(template, query, _short_repr(parameters), ms)
+            slow.plan = self._plans.get(template)
+            self.slow_queries.append(slow)
+            return slow
+
+    def set_plan(self, slow: SlowQuery, plan: list[str]) -> None:
+        with self._lock:
+            slow.plan = self._plans[slow.template] = plan
+
+    def reset(self) -> None:
+        with self._lock:
+            self.statements.clear()
+            self.slow_queries.clear()
+            self._plans.clear()
+
+    def top(self, limit: int | None = None, key="total") -> list[StatementStats]:
+        """Return statements sorted by decreasing total, mean, max or calls."""
+        attribute = {
+            "total": "total_ns",
+            "mean": "mean_ms",
+            "max": "max_ns",
+            "calls": "calls",
+            "rows": "rows",
+        }[key]
+        with self._lock:
+            statements = list(self.statements.values())
+        statements.sort(key=lambda stats: getattr(stats, attribute), reverse=True)
+        return statements[:limit]
+
+    def report(self, limit: int | None = 20, key="total") -> str:
+        lines = [
+            f"{len(self.statements)} statement template(s), "
+            f"{sum(stats.calls for stats in self.statements.values())} call(s)",
+            f"{'calls':>8} {'rows':>10} {'total ms':>10} {'mean ms':>9} "
+            f"{'max ms':>9}  statement",
+        ]
+        lines.extend(
+            f"{stats.calls:>8} {stats.rows:>10} {stats.total_ms:>10.3f} "
+            f"{stats.mean_ms:>9.3f} {stats.max_ms:>9.3f}  {stats.template}"
+            for stats in self.top(limit, key)
+        )
+        with self._lock:
+            slow_queries: Sequence[SlowQuery] = list(self.slow_queries)
+        lines.append("")
+        lines.append(f"{len(slow_queries)} slow query(ies) (>= {self.slow_ms} ms)")
+        for slow in slow_queries:
+            lines.append(f"[{slow.ms:.3f} ms] {slow.template}")
+            lines.append(f"    parameters: {slow.parameters}")
+            lines.extend(f"    {detail}" for detail in slow.plan or ())
+        return "\n".join(lines)
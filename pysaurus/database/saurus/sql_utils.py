@@ -1,3 +1,4 @@
+import json
 from copy import deepcopy
 from typing import Any, Iterable, Self, Sequence
 
@@ -6,6 +7,20 @@ def sql_placeholders(count: int) -> str:
     return ",".join(["?"] * count)
 
 
+def sql_in(field: str, values: Iterable, *, negate=False) -> tuple[str, list]:
+    """Return SQL condition `field [NOT] IN values`, and its parameters.
+
+    Values are passed as one JSON array parameter read with `json_each`,
+    so any number of values can be used without hitting SQLite limit
+    on number of parameters, and query text does not grow with values.
+    """
+    operator = "NOT IN" if negate else "IN"
+    return (
+        f"{field} {operator} (SELECT value FROM json_each(?))",
+        [json.dumps(list(values))],
+    )
+
+
 class FieldQuery:
     __slots__ = ("table", "field", "values")
 
@@ -19,16 +34,16 @@ class FieldQuery:
         self.table = prefix
 
     def __str__(self):
-        return (
-            f"{self.table}{'.' if self.table else ''}{self.field} "
-            f"{'=' if len(self.values) == 1 else 'IN'} "
-            f"{'' if len(self.values) == 1 else '('}"
-            f"{sql_placeholders(len(self.values))}"
-            f"{'' if len(self.values) == 1 else ')'}"
-        )
+        return self.to_sql()[0]
 
     __repr__ = __str__
 
+    def to_sql(self) -> tuple[str, list]:
+        column = f"{self.table}{'.' if self.table else ''}{self.field}"
+        if len(self.values) == 1:
+            return f"{column} = ?", list(self.values)
+        return sql_in(column, self.values)
+
 
 class SQLWhereBuilder:
     __slots__ = ("_where", "_parameters", "_condition")
@@ -54,7 +69,8 @@ class SQLWhereBuilder:
         self._parameters.extend(values)
 
     def append_field_query(self, field_query: FieldQuery):
-        self.append_query(str(field_query), *field_query.values)
+        query, parameters = field_query.to_sql()
+        self.append_query(query, *parameters)
 
     def append_query_builder(self, builder: Self) -> None:
         self.append_query(builder.get_clause(), *builder.get_parameters())
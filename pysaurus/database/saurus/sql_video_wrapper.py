@@ -1,9 +1,10 @@
 import sqlite3
-from typing import Iterable
+from typing import Iterable, Self, Sequence
 
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.classes import StringedTuple
 from pysaurus.core.datestring import Date
+from pysaurus.database.db_thumbnails import ThumbnailService
 from pysaurus.properties.properties import PropUnitType
 from pysaurus.video.video_pattern import MoveType, VideoPattern
 
@@ -62,6 +63,122 @@ FORMATTED_VIDEO_TABLE_FIELDS = ", ".join(
     f"v.{field} AS {field}" for field in VIDEO_TABLE_FIELD_NAMES
 )
 
+# Special fields: thumbnail blob (from video_thumbnail table),
+# and thumbnail flag (video.has_thumbnail column, maintained by triggers).
+THUMBNAIL_FIELD_NAMES = ("thumbnail", "with_thumbnails")
+
+# Video attributes loaded with extra queries, not from video table row.
+EXTRA_FIELD_NAMES = frozenset(
+    {"errors", "audio_languages", "subtitle_languages", "properties", "moves"}
+)
+
+# Derived video attributes, mapped to columns needed to compute them.
+DERIVED_FIELD_COLUMNS: dict[str, tuple[str, ...]] = {
+    "audio_bit_rate_formatted": ("audio_bit_rate",),
+    "byte_rate": ("file_size", "duration", "duration_time_base"),
+    "date": ("mtime",),
+    "date_entry_modified": ("date_entry_modified", "mtime"),
+    "date_entry_opened": ("date_entry_opened", "mtime"),
+    "day": ("mtime",),
+    "disk": ("driver_id",),
+    "extension": ("filename",),
+    "file_title": ("filename",),
+    "file_title_numeric": ("filename",),
+    "filename_length": ("filename",),
+    "filename_numeric": ("filename",),
+    "found": ("is_file",),
+    "frame_rate": ("frame_rate_num", "frame_rate_den"),
+    "length": ("duration", "duration_time_base"),
+    "meta_title_numeric": ("meta_title",),
+    "move_id": ("file_size", "duration", "duration_time_base"),
+    "not_found": ("is_file",),
+    "raw_microseconds": ("duration", "duration_time_base"),
+    "readable": ("unreadable",),
+    "similarity": ("similarity_id",),
+    "similarity_reencoded": ("similarity_id_reencoded",),
+    "size": ("file_size",),
+    "size_length": ("file_size", "duration", "duration_time_base"),
+    "thumbnail_base64": ("thumbnail",),
+    "thumbnail_path": ("thumbnail",),
+    "title": ("meta_title", "filename"),
+    "title_numeric": ("meta_title", "filename"),
+    "without_thumbnails": ("with_thumbnails",),
+    "year": ("mtime",),
+}
+
+
+class VideoProjection:
+    """Columns selected by a video query, and their positions in result rows.
+
+    Built from the `include` argument of video queries:
+    - None: all video table columns plus thumbnail fields.
+    - no column named (e.g. `()` or `["properties"]`): all video table columns.
+    - otherwise: only named columns (and columns needed by named derived
+      attributes), plus video_id, which is always needed to load extra data.
+    """
+
+    __slots__ = ("columns", "positions")
+
+    def __init__(self, columns: Iterable[str]):
+        self.columns: tuple[str, ...] = tuple(
+            sorted(set(columns), key=lambda column: getattr(F, column))
+        )
+        self.positions: list[int | None] = [None] * (F.with_thumbnails + 1)
+        for position, column in enumerate(self.columns):
+            self.positions[getattr(F, column)] = position
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    @property
+    def with_thumbnail_join(self) -> bool:
+        return "thumbnail" in self.columns
+
+    @classmethod
+    def from_include(cls, include: Sequence[str] | None) -> Self:
+        if include is None:
+            return cls((*VIDEO_TABLE_FIELD_NAMES, *THUMBNAIL_FIELD_NAMES))
+        columns = set()
+        for name in include:
+            if name in EXTRA_FIELD_NAMES:
+                continue
+            if name in DERIVED_FIELD_COLUMNS:
+                columns.update(DERIVED_FIELD_COLUMNS[name])
+            elif hasattr(F, name):
+                columns.add(name)
+            else:
+                raise ValueError(f"Unknown video field: {name}")
+        if not columns:
+            return cls(VIDEO_TABLE_FIELD_NAMES)
+        columns.add("video_id")
+        return cls(columns)
+
+    def get_select(self, video_alias="v", thumb_alias="t") -> str:
+        """Return SQL select list for projected columns."""
+        pieces = []
+        for column in self.columns:
+            if column == "thumbnail":
+                pieces.append(f"{thumb_alias}.thumbnail AS thumbnail")
+            elif column == "with_thumbnails":
+                pieces.append(f"{video_alias}.has_thumbnail AS with_thumbnails")
+            else:
+                pieces.append(f"{video_alias}.{column} AS {column}")
+        return ", ".join(pieces)
+
+    def get_field_name(self, field: int) -> str:
+        return next(name for name in dir(F) if getattr(F, name) == field)
+
+
+FULL_PROJECTION = VideoProjection.from_include(None)
+
+# Include for result pages: whole video, except thumbnail blob,
+# which is loaded out of band (see ThumbnailService).
+PAGE_FIELD_NAMES = (
+    *VIDEO_TABLE_FIELD_NAMES,
+    "with_thumbnails",
+    *sorted(EXTRA_FIELD_NAMES),
+)
+
 
 class SQLVideoWrapper(VideoPattern):
     __slots__ = (
@@ -71,6 +188,8 @@ class SQLVideoWrapper(VideoPattern):
         "_errors",
         "_properties",
         "_moves",
+        "_projection",
+        "_thumbnails",
     )
 
     def __init__(
@@ -81,66 +200,77 @@ class SQLVideoWrapper(VideoPattern):
         errors=(),
         json_properties: dict | None = None,
         moves=(),
+        projection: VideoProjection | None = None,
+        thumbnails: ThumbnailService | None = None,
     ):
-        # Data must contains key "with_thumbnails"
         self.data = data
+        self._projection = projection or FULL_PROJECTION
+        self._thumbnails = thumbnails
         self._audio_languages = audio_languages or []
         self._subtitle_languages = subtitle_languages or []
         self._errors = errors or []
         self._properties = json_properties or {}
         self._moves = moves or []  # list of dicts {video_id => int, filename => str}
 
+    def _get(self, field: int):
+        position = self._projection.positions[field]
+        if position is None:
+            raise AttributeError(
+                f"Video field not fetched: {self._projection.get_field_name(field)}"
+            )
+        return self.data[position]
+
     @property
     def filename(self) -> AbsolutePath:
-        return AbsolutePath(self.data[F.filename])
+        return AbsolutePath(self._get(F.filename))
 
     @property
     def video_id(self):
-        return self.data[F.video_id]
+        return self._get(F.video_id)
 
     @property
     def file_size(self):
-        return self.data[F.file_size]
+        return self._get(F.file_size)
 
     @property
     def unreadable(self) -> bool:
-        return bool(self.data[F.unreadable])
+        return bool(self._get(F.unreadable))
 
     @property
     def audio_bit_rate(self):
-        return self.data[F.audio_bit_rate]
+        return self._get(F.audio_bit_rate)
 
     @property
     def audio_bits(self):
-        return self.data[F.audio_bits]
+        return self._get(F.audio_bits)
 
     @property
     def audio_codec(self):
-        return self.data[F.audio_codec]
+        return self._get(F.audio_codec)
 
     @property
     def audio_codec_description(self):
-        return self.data[F.audio_codec_description]
+        return self._get(F.audio_codec_description)
 
     @property
     def bit_depth(self):
-        return self.data[F.bit_depth]
+        return self._get(F.bit_depth)
 
     @property
     def channels(self):
-        return self.data[F.channels]
+        return self._get(F.channels)
 
     @property
     def container_format(self):
-        return self.data[F.container_format]
+        return self._get(F.container_format)
 
     @property
     def device_name(self):
-        return self.data[F.device_name]
+        return self._get(F.device_name)
 
     @property
     def duration(self) -> int | float:
-        value: float = abs(self.data[F.duration])
+        value: float = abs(self._get(F.duration))
         return (
             value
             if isinstance(value, int)
@@ -149,39 +279,39 @@ class SQLVideoWrapper(VideoPattern):
 
     @property
     def duration_time_base(self):
-        return self.data[F.duration_time_base] or 1
+        return self._get(F.duration_time_base) or 1
 
     @property
     def frame_rate_den(self):
-        return self.data[F.frame_rate_den] or 1
+        return self._get(F.frame_rate_den) or 1
 
     @property
     def frame_rate_num(self):
-        return self.data[F.frame_rate_num]
+        return self._get(F.frame_rate_num)
 
     @property
     def height(self):
-        return self.data[F.height]
+        return self._get(F.height)
 
     @property
     def meta_title(self):
-        return self.data[F.meta_title]
+        return self._get(F.meta_title)
 
     @property
     def sample_rate(self):
-        return self.data[F.sample_rate]
+        return self._get(F.sample_rate)
 
     @property
     def video_codec(self):
-        return self.data[F.video_codec]
+        return self._get(F.video_codec)
 
     @property
     def video_codec_description(self):
-        return self.data[F.video_codec_description]
+        return self._get(F.video_codec_description)
 
     @property
     def width(self):
-        return self.data[F.width]
+        return self._get(F.width)
 
     @property
     def errors(self) -> list[str]:
@@ -205,51 +335,54 @@ class SQLVideoWrapper(VideoPattern):
 
     @property
     def thumbnail(self) -> bytes:
-        return self.data[F.thumbnail]
+        if self._thumbnails is not None and "thumbnail" not in self._projection:
+            # Blob not selected in row: load it out of band.
+            return self._thumbnails.get(self._get(F.video_id)) or b""
+        return self._get(F.thumbnail)
 
     @property
     def mtime(self):
-        return self.data[F.mtime]
+        return self._get(F.mtime)
 
     @property
     def driver_id(self):
-        return self.data[F.driver_id]
+        return self._get(F.driver_id)
 
     @property
     def discarded(self) -> bool:
-        return bool(self.data[F.discarded])
+        return bool(self._get(F.discarded))
 
     @property
     def date_entry_modified(self) -> Date:
-        value = self.data[F.date_entry_modified]
+        value = self._get(F.date_entry_modified)
         return Date(value if value is not None else self.mtime)
 
     @property
     def date_entry_opened(self) -> Date:
-        value = self.data[F.date_entry_opened]
+        value = self._get(F.date_entry_opened)
         return Date(value if value is not None else self.mtime)
 
     @property
     def similarity_id(self):
-        return self.data[F.similarity_id]
+        return self._get(F.similarity_id)
 
     @property
     def similarity_id_reencoded(self):
-        return self.data[F.similarity_id_reencoded]
+        return self._get(F.similarity_id_reencoded)
 
     @property
     def watched(self) -> bool:
-        return bool(self.data[F.watched])
+        return bool(self._get(F.watched))
 
     # derived
 
     @property
     def found(self) -> bool:
-        return bool(self.data[F.is_file])
+        return bool(self._get(F.is_file))
 
     @property
     def with_thumbnails(self) -> bool:
-        return bool(self.data[F.with_thumbnails])
+        return bool(self._get(F.with_thumbnails))
 
     @property
     def move_id(self) -> StringedTuple | None:
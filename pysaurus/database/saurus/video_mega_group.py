@@ -1,18 +1,19 @@
-from typing import Any, Callable, Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from searchexp import ExpressionParser
 
+from pysaurus.core import tracing
 from pysaurus.core.classes import Selector, StringedTuple
 from pysaurus.core.datestring import Date
 from pysaurus.core.duration import Duration
 from pysaurus.core.file_size import FileSize
 from pysaurus.core.functions import compute_nb_pages
 from pysaurus.core.lookup_array import LookupArray
+from pysaurus.database.db_thumbnails import ThumbnailService
 from pysaurus.database.saurus.grouping_utils import SqlFieldFactory
 from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
 from pysaurus.database.saurus.saurus_provider_utils import (
     GroupCount,
-    ProviderVideoParser,
     convert_dict_to_sql,
     search_to_sql,
 )
@@ -26,10 +27,11 @@ from pysaurus.database.saurus.sql_utils import (
     QueryMaker,
     SQLWhereBuilder,
     TableDef,
-    sql_placeholders,
+    sql_in,
 )
-from pysaurus.database.saurus.sql_video_wrapper import VIDEO_TABLE_FIELD_NAMES
+from pysaurus.database.saurus.sql_video_wrapper import VideoProjection
 from pysaurus.database.saurus.video_mega_utils import _get_videos
+from pysaurus.database.saurus.video_parser import VideoFieldQueryParser
 from pysaurus.dbview.view_tools import GroupDef, SearchDef
 from pysaurus.video.video_constants import SIMILARITY_FIELDS as _SIMILARITY_FIELDS
 from pysaurus.video.video_search_context import VideoSearchContext
@@ -51,6 +53,7 @@ def video_mega_group(
     page_number: int = 0,
     include: Sequence[str] | None = None,
     with_moves=False,
+    thumbnails: ThumbnailService | None = None,
 ) -> VideoSearchContext:
     output_groups = LookupArray[GroupCount](GroupCount, (), GroupCount.keyof)
     output = VideoSearchContext(
@@ -66,17 +69,82 @@ def video_mega_group(
         with_moves=with_moves,
         result_groups=output_groups,
     )
+    with tracing.span("video_mega_group"):
+        query_maker = _get_view_query(sql_db, output, source_expression)
+        _compute_results_and_stats(
+            sql_db, output, query_maker, include=include, thumbnails=thumbnails
+        )
+        tracing.count("rows fetched", len(output.result))
+    return output
+
+
+def video_mega_columns(
+    sql_db: PysaurusConnection,
+    columns: Sequence[str],
+    *,
+    sources: Sequence[list[str]] = (),
+    source_expression: str | None = None,
+    grouping: GroupDef = GroupDef(),
+    classifier: Sequence[str] = (),
+    group=0,
+    search: SearchDef = SearchDef(),
+    sorting: Sequence[str] = (),
+    selector: Selector | None = None,
+) -> Iterator[tuple]:
+    """Yield given video table columns for each video of view, in view order.
+
+    View is resolved as in video_mega_group(), but videos are not
+    loaded: only requested columns are read, with one query.
+    """
+    for column in columns:
+        VideoFieldQueryParser.assert_video_table_field(column)
+    output = VideoSearchContext(
+        sources=sources,
+        grouping=grouping,
+        classifier=classifier,
+        group_id=group,
+        search=search,
+        sorting=sorting,
+        result_groups=LookupArray[GroupCount](GroupCount, (), GroupCount.keyof),
+    )
+    query_maker = _get_view_query(sql_db, output, source_expression)
+    if selector is not None:
+        field_video_id = query_maker.get_main_table().get_alias_field("video_id")
+        select_query, select_params = selector.to_sql(field_video_id)
+        query_maker.where.append_query(select_query, *select_params)
+    query_maker.set_fields(f"v.{column}" for column in columns)
+    nb_rows = 0
+    try:
+        with sql_db:
+            for row in sql_db.query(*query_maker.to_sql()):
+                nb_rows += 1
+                yield tuple(row)
+    finally:
+        tracing.count("rows fetched", nb_rows)
+
+
+def _get_view_query(
+    sql_db: PysaurusConnection,
+    output: VideoSearchContext,
+    source_expression: str | None,
+) -> QueryMaker:
+    """Return query selecting video IDs of view described in output.
+
+    Also fill output groups, and clamp output group ID.
+    """
+    sources = output.sources
+    grouping = output.grouping
+    classifier = output.classifier
+    search = output.search
+    output_groups = output.result_groups
 
     query_maker = QueryMaker("video", "v")
     field_video_id = query_maker.get_main_table().get_alias_field("video_id")
     query_maker.add_field(field_video_id)
-    video_thumbnail_table = TableDef("video_thumbnail", "vt")
-    query_maker.add_left_join(video_thumbnail_table, "video_id")
 
     if search and search.text is not None and search.cond == "id":
         query_maker.where.append_field(field_video_id, int(search.text))
-        _compute_results_and_stats(sql_db, output, query_maker, include=include)
-        return output
+        return query_maker
 
     field_factory = SqlFieldFactory(sql_db)
     if source_expression:
@@ -84,7 +152,7 @@ def video_mega_group(
             sql_db, source_expression
         )
     else:
-        parser = ProviderVideoParser()
+        parser = VideoFieldQueryParser()
         source_query_builder = SQLWhereBuilder.combine(
             [
                 SQLWhereBuilder.build(parser.parse(flag, True) for flag in source)
@@ -142,8 +210,7 @@ def video_mega_group(
         if not output_groups:
             # Make sure to find nothing
             query_maker.where.append_query("0")
-            _compute_results_and_stats(sql_db, output, query_maker, include=include)
-            return output
+            return query_maker
 
         output.group_id = min(max(0, output.group_id), len(output_groups) - 1)
         group = output_groups[output.group_id]
@@ -172,13 +239,15 @@ def video_mega_group(
 
     sql_sorting = [
         field_factory.get_sorting(field, reverse)
-        for field, reverse in VideoSorting(sorting)
+        for field, reverse in VideoSorting(output.sorting)
     ]
 
-    for sorting in sql_sorting:
-        query_maker.order_by_complex(sorting)
-    _compute_results_and_stats(sql_db, output, query_maker, include=include)
-    return output
+    for sql_order in sql_sorting:
+        query_maker.order_by_complex(sql_order)
+    # Break ties, so that view order does not depend on query plan
+    # (e.g. a page queried by IDs is in same order as whole view).
+    query_maker.order_by_complex(f"{field_video_id} ASC")
+    return query_maker
 
 
 def _compute_results_and_stats(
@@ -186,6 +255,7 @@ def _compute_results_and_stats(
     context: VideoSearchContext,
     query_maker: QueryMaker,
     include: Sequence[str] | None = None,
+    thumbnails: ThumbnailService | None = None,
 ):
     query_maker_count = query_maker.copy()
     query_maker_select = query_maker.copy()
@@ -228,27 +298,34 @@ def _compute_results_and_stats(
             start = context.page_size * context.page_number
             end = min(start + context.page_size, context.selection_count)
             page_view = view_indices[start:end]
+            if thumbnails is not None:
+                # Load thumbnails of this page and next one in one batch,
+                # so that next page does not wait for blobs either.
+                thumbnails.prefetch(view_indices[start : end + context.page_size])
 
             query_maker_page.where.clear()
-            query_maker_page.where.append_query(
-                f"{field_video_id} IN ({sql_placeholders(len(page_view))})", *page_view
-            )
+            page_query, page_params = sql_in(field_video_id, page_view)
+            query_maker_page.where.append_query(page_query, *page_params)
 
-    thumb_table = query_maker_page.find_table("video_thumbnail")
-    field_thumbnail = thumb_table.get_alias_field("thumbnail")
-    query_maker_page.set_fields(
-        [
-            f"{query_maker_page.get_main_table().get_alias_field(field)} AS {field}"
-            for field in VIDEO_TABLE_FIELD_NAMES
-        ]
-        + [
-            f"{field_thumbnail} AS thumbnail",
-            f"IIF(LENGTH({field_thumbnail}), 1, 0) AS with_thumbnails",
-        ]
+    projection = VideoProjection.from_include(include)
+    # Thumbnail blobs table is only joined to fetch blobs:
+    # thumbnail flag is read from video table.
+    video_thumbnail_table = TableDef("video_thumbnail", "vt")
+    if projection.with_thumbnail_join:
+        query_maker_page.add_left_join(video_thumbnail_table, "video_id")
+    query_maker_page.set_field(
+        projection.get_select(
+            query_maker_page.get_main_table().alias, video_thumbnail_table.alias
+        )
     )
 
     context.result = _get_videos(
-        db, *query_maker_page.to_sql(), include=include, with_moves=context.with_moves
+        db,
+        *query_maker_page.to_sql(),
+        include=include,
+        with_moves=context.with_moves,
+        projection=projection,
+        thumbnails=thumbnails,
     )
 
     # Compute similarity diff fields now that result is populated.
@@ -267,13 +344,6 @@ def _compute_results_and_stats(
         context.file_title_diffs = VideoFeatures.get_file_title_diffs(context.result)
 
 
-def _thumbnail_join_if_needed(source_query: str) -> str:
-    """Return LEFT JOIN video_thumbnail clause if source_query references vt."""
-    if "vt." in source_query:
-        return "LEFT JOIN video_thumbnail AS vt ON v.video_id = vt.video_id"
-    return ""
-
-
 def _get_property_order_field(grouping: GroupDef, order_direction: str) -> str:
     if grouping.sorting == grouping.FIELD:
         return f"value {order_direction}"
@@ -299,11 +369,9 @@ def _query_property_groups_with_classifier(
 ) -> Sequence[Sequence]:
     prop_id, _, _ = prop_meta
     placeholders = ["?"] * len(classifier)
-    vt_join = _thumbnail_join_if_needed(source_query)
     query = f"""
     SELECT v.video_id
     FROM video AS v
-    {vt_join}
     JOIN video_property_value AS vv
         ON v.video_id = vv.video_id AND vv.property_id = ?
     WHERE v.discarded = 0 AND {source_query}
@@ -318,7 +386,6 @@ def _query_property_groups_with_classifier(
     FROM
     (SELECT v.video_id AS video_id
     FROM video AS v
-    {vt_join}
     JOIN video_property_value AS vv
         ON v.video_id = vv.video_id AND vv.property_id = ?
     WHERE v.discarded = 0 AND {source_query}
@@ -346,14 +413,12 @@ def _query_property_groups_without_classifier(
     prop_meta: tuple[int, bool, str | None],
 ) -> Sequence[Sequence]:
     prop_id, is_multiple, default_value = prop_meta
-    vt_join = _thumbnail_join_if_needed(source_query)
 
     if is_multiple:
         query = f"""
         SELECT pv.property_value AS value, COUNT(DISTINCT v.video_id) AS size
         FROM video AS v
-        {vt_join}
-        LEFT JOIN video_property_value AS pv
+            LEFT JOIN video_property_value AS pv
             ON v.video_id = pv.video_id AND pv.property_id = ?
         WHERE v.discarded = 0 AND {source_query}
         GROUP BY value {without_singletons}
@@ -366,8 +431,7 @@ def _query_property_groups_without_classifier(
             COALESCE(pv.property_value, ?) AS value,
             COUNT(v.video_id) AS size
         FROM video AS v
-        {vt_join}
-        LEFT JOIN video_property_value AS pv
+            LEFT JOIN video_property_value AS pv
             ON v.video_id = pv.video_id AND pv.property_id = ?
         WHERE v.discarded = 0 AND {source_query}
         GROUP BY value {without_singletons}
@@ -416,7 +480,6 @@ def _query_field_groups(
     return sql_db.query_all(
         f"SELECT {field}, COUNT(v.video_id) AS size "
         f"FROM video AS v "
-        f"LEFT JOIN video_thumbnail AS vt ON v.video_id = vt.video_id "
         f"WHERE v.discarded = 0 AND {source_query} {where_similarity_id} "
         f"GROUP BY {field} {without_singletons} "
         f"ORDER BY {order_field}",
@@ -434,30 +497,18 @@ def _query_move_id_groups(
     """Query move_id groups matching JSON behavior.
 
     Videos with potential moves (same file_size/duration/time_base
-    with both found and not-found entries) get (file_size, length).
+    with both found and not-found entries, i.e. move signature listed
+    in move_candidates) get (file_size, length).
     Videos without moves get NULL, forming one group.
     """
     length_expr = "(v.duration * 1.0 / COALESCE(NULLIF(v.duration_time_base, 0), 1))"
     query = f"""
-    WITH move_candidates AS (
-        SELECT file_size, duration, duration_time_base_not_null
-        FROM video
-        WHERE unreadable = 0 AND discarded = 0
-        GROUP BY file_size, duration, duration_time_base_not_null
-        HAVING COUNT(*) > 1
-            AND SUM(is_file) > 0
-            AND SUM(is_file) < COUNT(*)
-    )
     SELECT
-        IIF(mc.file_size IS NOT NULL, v.file_size, NULL) AS move_file_size,
-        IIF(mc.file_size IS NOT NULL, {length_expr}, NULL) AS move_length,
+        IIF(mc.move_signature IS NOT NULL, v.file_size, NULL) AS move_file_size,
+        IIF(mc.move_signature IS NOT NULL, {length_expr}, NULL) AS move_length,
         COUNT(v.video_id) AS size
     FROM video AS v
-    LEFT JOIN video_thumbnail AS vt ON v.video_id = vt.video_id
-    LEFT JOIN move_candidates AS mc
-        ON v.file_size = mc.file_size
-        AND v.duration = mc.duration
-        AND v.duration_time_base_not_null = mc.duration_time_base_not_null
+    LEFT JOIN move_candidates AS mc ON v.move_signature = mc.move_signature
     WHERE v.discarded = 0 AND {source_query}
     GROUP BY move_file_size, move_length {without_singletons}
     ORDER BY move_file_size {order_direction}, move_length {order_direction}
@@ -559,22 +610,8 @@ def _filter_by_selected_property_group(
 def _filter_by_no_moves() -> tuple[str, list]:
     """Filter for videos that have no potential moves."""
     query = """
-    v.video_id NOT IN (
-        SELECT v2.video_id FROM video AS v2
-        JOIN (
-            SELECT file_size, duration, duration_time_base_not_null
-            FROM video
-            WHERE unreadable = 0 AND discarded = 0
-            GROUP BY file_size, duration, duration_time_base_not_null
-            HAVING COUNT(*) > 1
-                AND SUM(is_file) > 0
-                AND SUM(is_file) < COUNT(*)
-        ) AS mc
-        ON v2.file_size = mc.file_size
-        AND v2.duration = mc.duration
-        AND v2.duration_time_base_not_null = mc.duration_time_base_not_null
-        WHERE v2.unreadable = 0 AND v2.discarded = 0
-    )
+    (v.move_signature IS NULL
+    OR v.move_signature NOT IN (SELECT move_signature FROM move_candidates))
     """
     return query, []
 
@@ -606,9 +643,8 @@ def _get_property_value_converter(
     """Return a converter function for property values from SQL (TEXT) to Python types."""
     from pysaurus.properties.properties import PROP_UNIT_CONVERTER
 
-    row = sql_db.query_one("SELECT type FROM property WHERE name = ?", [property_name])
-    prop_type = row["type"] if row else "str"
-    return PROP_UNIT_CONVERTER[prop_type]
+    pt = sql_db.prop_types.get(property_name)
+    return PROP_UNIT_CONVERTER[pt.type if pt else "str"]
 
 
 def _get_property_metadata(
@@ -634,10 +670,9 @@ def _compile_source_expression(
 ) -> tuple[str, tuple]:
     """Parse and compile a searchexp expression to a SQL WHERE fragment."""
     # Load property metadata from the database
-    prop_rows = sql_db.query_all("SELECT name, type, multiple FROM property")
     properties = {
-        row["name"]: PropertyMeta(type=row["type"], multiple=bool(row["multiple"]))
-        for row in prop_rows
+        pt.name: PropertyMeta(type=pt.type, multiple=pt.multiple)
+        for pt in sql_db.prop_types.all()
     }
     # Parse expression
     parser = ExpressionParser(
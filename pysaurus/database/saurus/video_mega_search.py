@@ -2,14 +2,11 @@ from typing import Sequence
 
 from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
 from pysaurus.database.saurus.sql_utils import SQLWhereBuilder
-from pysaurus.database.saurus.sql_video_wrapper import FORMATTED_VIDEO_TABLE_FIELDS
+from pysaurus.database.saurus.sql_video_wrapper import VideoProjection
 from pysaurus.database.saurus.video_mega_utils import _get_videos
 from pysaurus.database.saurus.video_parser import VideoFieldQueryParser
 from pysaurus.video.video_pattern import VideoPattern
 
-# Fields that require joining video_thumbnail table
-_THUMBNAIL_FIELDS = frozenset({"thumbnail", "with_thumbnails"})
-
 
 def _build_where_clause(where: dict | None) -> SQLWhereBuilder:
     """Build WHERE clause from dict."""
@@ -32,34 +29,13 @@ def _build_where_clause(where: dict | None) -> SQLWhereBuilder:
     return where_builder
 
 
-def _needs_thumbnail_join(include: Sequence[str] | None, where: dict | None) -> bool:
-    """Check if we need to JOIN video_thumbnail table."""
-    if include is None:
-        return True
-    if set(include) & _THUMBNAIL_FIELDS:
-        return True
-    # Check if where clause references thumbnail fields
-    if where:
-        if "with_thumbnails" in where or "without_thumbnails" in where:
-            return True
-    return False
-
-
 def video_mega_exists(db: PysaurusConnection, *, where: dict | None = None) -> bool:
     """Check if any video matches the given filters."""
     where_builder = _build_where_clause(where)
     where_clause = where_builder.get_where_clause()
     params = where_builder.get_parameters()
 
-    needs_thumbnail = _needs_thumbnail_join(None, where)
-    if needs_thumbnail:
-        query = f"""
-        SELECT 1 FROM video AS v
-        LEFT JOIN video_thumbnail AS t ON v.video_id = t.video_id
-        {where_clause} LIMIT 1
-        """
-    else:
-        query = f"SELECT 1 FROM video AS v {where_clause} LIMIT 1"
+    query = f"SELECT 1 FROM video AS v {where_clause} LIMIT 1"
     result = db.query_one(query, params)
     return result is not None
 
@@ -70,15 +46,7 @@ def video_mega_count(db: PysaurusConnection, *, where: dict | None = None) -> in
     where_clause = where_builder.get_where_clause()
     params = where_builder.get_parameters()
 
-    needs_thumbnail = _needs_thumbnail_join(None, where)
-    if needs_thumbnail:
-        query = f"""
-        SELECT COUNT(v.video_id) FROM video AS v
-        LEFT JOIN video_thumbnail AS t ON v.video_id = t.video_id
-        {where_clause}
-        """
-    else:
-        query = f"SELECT COUNT(v.video_id) FROM video AS v {where_clause}"
+    query = f"SELECT COUNT(v.video_id) FROM video AS v {where_clause}"
     result = db.query_one(query, params)
     return result[0] if result else 0
 
@@ -90,31 +58,26 @@ def video_mega_search(
     with_moves: bool = False,
     where: dict | None = None,
 ) -> list[VideoPattern]:
-    """Search for videos, returning full VideoPattern objects."""
+    """Search for videos, returning VideoPattern objects.
+
+    Only columns required by `include` are selected
+    (see VideoProjection.from_include).
+    """
     where_builder = _build_where_clause(where)
     where_clause = where_builder.get_where_clause()
     params = where_builder.get_parameters()
 
-    needs_thumbnail = _needs_thumbnail_join(include, where)
-
-    if needs_thumbnail:
+    projection = VideoProjection.from_include(include)
+    if projection.with_thumbnail_join:
         query = f"""
-        SELECT
-            {FORMATTED_VIDEO_TABLE_FIELDS},
-            t.thumbnail AS thumbnail,
-            IIF(LENGTH(t.thumbnail), 1, 0) AS with_thumbnails
+        SELECT {projection.get_select()}
         FROM video AS v LEFT JOIN video_thumbnail AS t
         ON v.video_id = t.video_id
         {where_clause}
         """
     else:
-        query = f"""
-        SELECT
-            {FORMATTED_VIDEO_TABLE_FIELDS},
-            NULL AS thumbnail,
-            0 AS with_thumbnails
-        FROM video AS v
-        {where_clause}
-        """
+        query = f"SELECT {projection.get_select()} FROM video AS v {where_clause}"
 
-    return _get_videos(db, query, params, include=include, with_moves=with_moves)
+    return _get_videos(
+        db, query, params, include=include, with_moves=with_moves, projection=projection
+    )
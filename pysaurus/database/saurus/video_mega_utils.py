@@ -2,10 +2,10 @@ from collections import defaultdict
 from typing import Iterable, Sequence, cast
 
 from pysaurus.core.absolute_path import AbsolutePath
-from pysaurus.database.saurus.prop_type_search import prop_type_search
+from pysaurus.database.db_thumbnails import ThumbnailService
 from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
 from pysaurus.database.saurus.sql_utils import sql_placeholders
-from pysaurus.database.saurus.sql_video_wrapper import SQLVideoWrapper
+from pysaurus.database.saurus.sql_video_wrapper import SQLVideoWrapper, VideoProjection
 from pysaurus.properties.properties import PropType
 from pysaurus.video.video_pattern import VideoPattern
 
@@ -25,9 +25,17 @@ def _get_videos(
     *,
     include: Sequence[str] | None = None,
     with_moves: bool = False,
+    projection: VideoProjection | None = None,
+    thumbnails: ThumbnailService | None = None,
 ) -> list[VideoPattern]:
+    # Query must select columns from projection, in projection order.
+    if projection is None:
+        projection = VideoProjection.from_include(include)
     with db:
-        videos = [SQLVideoWrapper(row) for row in db.query(query, parameters)]
+        videos = [
+            SQLVideoWrapper(row, projection=projection, thumbnails=thumbnails)
+            for row in db.query(query, parameters)
+        ]
 
     # Early return if no videos or minimal include (no extra data needed)
     if not videos:
@@ -79,7 +87,7 @@ def _get_videos(
                     languages[row[0]][row[1]].append(row[2])
     if with_properties:
         prop_types: dict[int | None, PropType] = {
-            pt.property_id: pt for pt in prop_type_search(db)
+            pt.property_id: pt for pt in db.prop_types.all()
         }
         with db:
             for chunk in _chunk_ids(video_ids):
@@ -114,7 +122,8 @@ def _get_videos(
             video.properties = json_properties.get(video.video_id, {})
     if with_moves:
         moves = {
-            video_id: video_moves for video_id, video_moves in _get_video_moves(db)
+            video_id: video_moves
+            for video_id, video_moves in _get_video_moves(db, video_ids)
         }
         for video in videos:
             video.moves = moves.get(video.video_id, [])
@@ -122,69 +131,84 @@ def _get_videos(
     return cast(list[VideoPattern], videos)
 
 
-def _get_video_moves(db: PysaurusConnection) -> Iterable[tuple[int, list[dict]]]:
-    # Optimized: avoids GROUP_CONCAT which can produce multi-MB strings.
-    # Uses a structured query with window functions instead.
+def _get_video_moves(
+    db: PysaurusConnection, video_ids: Sequence[int] | None = None
+) -> Iterable[tuple[int, list[dict]]]:
+    """Yield (not found video ID, found videos) for each potential move.
+
+    Potential moves are groups of videos sharing a move signature listed
+    in `move_candidates` (maintained by triggers), so only these groups are
+    read, through move signature index. If `video_ids` is given, only groups
+    containing one of these videos are read.
+    """
+    query = (
+        "SELECT v.video_id, v.is_file, v.filename, v.move_signature "
+        "FROM move_candidates AS mc "
+        "JOIN video AS v ON v.move_signature = mc.move_signature "
+        "{where}"
+        "ORDER BY v.file_size, v.duration, v.duration_time_base_not_null, "
+        "v.move_signature, v.is_file DESC"
+    )
+    if video_ids is None:
+        queries = [(query.format(where=""), ())]
+    else:
+        with db:
+            signatures = sorted(
+                {
+                    row[0]
+                    for chunk in _chunk_ids(video_ids)
+                    for row in db.query(
+                        f"SELECT v.move_signature FROM video AS v "
+                        f"JOIN move_candidates AS mc "
+                        f"ON v.move_signature = mc.move_signature "
+                        f"WHERE v.video_id IN ({sql_placeholders(len(chunk))})",
+                        chunk,
+                    )
+                }
+            )
+        # Each chunk contains whole groups.
+        queries = [
+            (
+                query.format(
+                    where=f"WHERE mc.move_signature "
+                    f"IN ({sql_placeholders(len(chunk))}) "
+                ),
+                chunk,
+            )
+            for chunk in _chunk_ids(signatures)
+        ]
     with db:
-        current_group = None
-        not_found = []
-        found = []
-
-        for row in db.query(
-            """
-            WITH move_groups AS (
-                SELECT
-                    video_id,
-                    is_file,
-                    filename,
-                    file_size,
-                    duration,
-                    duration_time_base_not_null,
-                    COUNT(*) OVER (PARTITION BY file_size, duration, duration_time_base_not_null) as group_count,
-                    SUM(is_file) OVER (PARTITION BY file_size, duration, duration_time_base_not_null) as found_count
-                FROM video
-                WHERE unreadable = 0 AND discarded = 0
+        for chunk_query, parameters in queries:
+            yield from _group_video_moves(db.query(chunk_query, parameters))
+
+
+def _group_video_moves(rows: Iterable) -> Iterable[tuple[int, list[dict]]]:
+    # Rows are sorted by move signature, found videos first in each group.
+    current_group = None
+    not_found = []
+    found = []
+    for video_id, is_file, filename, move_signature in rows:
+        # New group detected
+        if current_group != move_signature:
+            # Emit previous group if it exists
+            if current_group is not None and not_found and found:
+                for id_not_found in not_found:
+                    yield id_not_found, found
+
+            # Reset for new group
+            current_group = move_signature
+            not_found = []
+            found = []
+
+        # Accumulate videos for current group
+        if is_file:
+            found.append(
+                {"video_id": video_id, "filename": AbsolutePath(filename).standard_path}
             )
-            SELECT video_id, is_file, filename, file_size, duration, duration_time_base_not_null
-            FROM move_groups
-            WHERE group_count > 1 AND found_count > 0 AND found_count < group_count
-            ORDER BY file_size, duration, duration_time_base_not_null, is_file DESC
-            """
-        ):
-            group_key = (
-                row[3],
-                row[4],
-                row[5],
-            )  # file_size, duration, duration_time_base_not_null
-
-            # New group detected
-            if current_group != group_key:
-                # Emit previous group if it exists
-                if current_group is not None and not_found and found:
-                    for id_not_found in not_found:
-                        yield id_not_found, found
-
-                # Reset for new group
-                current_group = group_key
-                not_found = []
-                found = []
-
-            # Accumulate videos for current group
-            video_id = row[0]
-            is_file = row[1]
-            filename = row[2]
-
-            if is_file:
-                found.append(
-                    {
-                        "video_id": video_id,
-                        "filename": AbsolutePath(filename).standard_path,
-                    }
-                )
-            else:
-                not_found.append(video_id)
+        else:
+            not_found.append(video_id)
 
-        # Emit last group
-        if current_group is not None and not_found and found:
-            for id_not_found in not_found:
-                yield id_not_found, found
+    # Emit last group
+    if current_group is not None and not_found and found:
+        for id_not_found in not_found:
+            yield id_not_found, found
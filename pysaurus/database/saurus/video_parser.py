@@ -14,7 +14,7 @@ class VideoFieldQueryParser:
         if hasattr(self, field):
             return getattr(self, field)(value)
         else:
-            self._assert_video_table_field(field)
+            self.assert_video_table_field(field)
             return self._video_query(field, value)
 
     def _video_query(self, field, *values):
@@ -24,7 +24,7 @@ class VideoFieldQueryParser:
         return FieldQuery(field, values, self.thumb_prefix)
 
     @classmethod
-    def _assert_video_table_field(cls, value: str) -> str:
+    def assert_video_table_field(cls, value: str) -> str:
         if not hasattr(F, value):
             raise ValueError(f"Unknown video field: {value}")
         return value
@@ -56,11 +56,10 @@ class VideoFieldQueryParser:
         return self._video_query("is_file", int(not value))
 
     def with_thumbnails(self, value) -> FieldQuery:
-        # Use computed expression that works with or without alias
-        return FieldQuery("IIF(LENGTH(t.thumbnail), 1, 0)", [int(value)])
+        return self._video_query("has_thumbnail", int(value))
 
     def without_thumbnails(self, value) -> FieldQuery:
-        return FieldQuery("IIF(LENGTH(t.thumbnail), 1, 0)", [int(not value)])
+        return self._video_query("has_thumbnail", int(not value))
 
     def driver_id(self, value) -> FieldQuery:
         return self._video_query("driver_id", value)
@@ -2,27 +2,32 @@ import inspect
 from types import FunctionType
 from typing import Any, Callable
 
-import filedial
-
 
 class ProxyFeature:
     __slots__ = ("proxy",)
 
-    def __init__(self, getter: Callable[[], Any], method: FunctionType, returns=False):
+    def __init__(
+        self, getter: Callable[[], Any], method: FunctionType | str, returns=False
+    ):
+        # Method may be given by name, to be looked up in getter result
+        # only when needed (e.g. to not import a module before first call).
         self.proxy = (getter, method, returns)
 
     def __call__(self, *args):
         getter, method, returns = self.proxy
-        ret = getattr(getter(), method.__name__)(*args)
+        name = method if isinstance(method, str) else method.__name__
+        ret = getattr(getter(), name)(*args)
         return ret if returns else None
 
     def __str__(self):
-        _, method, returns = self.proxy
-        return self.info_signature(method, returns)
+        return self.info_signature(self.get_method(), self.proxy[2])
+
+    def get_method(self) -> FunctionType:
+        getter, method, _ = self.proxy
+        return getattr(getter(), method) if isinstance(method, str) else method
 
     def get_signature(self) -> inspect.Signature:
-        _, method, returns = self.proxy
-        return inspect.signature(method)
+        return inspect.signature(self.get_method())
 
     @classmethod
     def info_signature(cls, method, returns) -> str:
@@ -55,20 +60,30 @@ class FromApp(ProxyFeature):
         super().__init__(getter=lambda: api.application, method=method, returns=returns)
 
 
+def _filedial():
+    import filedial
+
+    return filedial
+
+
+def _pyperclip():
+    import pyperclip
+
+    return pyperclip
+
+
 class FromTk(ProxyFeature):
     __slots__ = ()
 
-    def __init__(self, method, returns=False):
-        super().__init__(getter=lambda: filedial, method=method, returns=returns)
+    def __init__(self, method: str, returns=False):
+        super().__init__(getter=_filedial, method=method, returns=returns)
 
 
 class FromPyperclip(ProxyFeature):
     __slots__ = ()
 
-    def __init__(self, method, returns=False):
-        import pyperclip
-
-        super().__init__(getter=lambda: pyperclip, method=method, returns=returns)
+    def __init__(self, method: str, returns=False):
+        super().__init__(getter=_pyperclip, method=method, returns=returns)
 
 
 class FromOps(ProxyFeature):
@@ -5,10 +5,11 @@ from typing import Any
 from pysaurus.application import exceptions
 from pysaurus.application.application import Application
 from pysaurus.application.language.default_language import language_to_dict
-from pysaurus.core import functions
+from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.classes import Selector, StringPrinter
 from pysaurus.core.constants import PYTHON_DEFAULT_SOURCES
-from pysaurus.core.file_utils import create_xspf_playlist
+from pysaurus.core.file_utils import write_playlist
+from pysaurus.core.functions import generate_temporary_file
 from pysaurus.core.profiling import Profiler
 from pysaurus.database.abstract_database import AbstractDatabase as Db
 from pysaurus.database.database_algorithms import DatabaseAlgorithms as Algo
@@ -150,16 +151,18 @@ class FeatureAPI:
 
     def apply_on_view(self, selector, db_fn_name, *db_fn_args):
         assert self.database is not None
-        result = self.database.query_videos(self.view, 0, 0)
-        view_indices = [v.video_id for v in result.result]
+        if selector["all"]:
+            video_indices = self.database.resolve_view_ids(
+                self.view, Selector.parse_dict(selector)
+            )
+        else:
+            video_indices = selector["include"]
         ops = Ops(self.database)
         callable_methods = {
             "count_property_values": ops.count_property_for_videos,
             "edit_property_for_videos": ops.update_property_for_videos,
         }
-        return callable_methods[db_fn_name](
-            functions.apply_selector_to_data(selector, view_indices), *db_fn_args
-        )
+        return callable_methods[db_fn_name](video_indices, *db_fn_args)
 
     def open_random_video(self, open_video=True) -> str:
         assert self.database is not None
@@ -205,8 +208,13 @@ class FeatureAPI:
             folders=sorted(self.database.get_folders()),
             prop_types=self.database.get_prop_types(),
             view=context,
+            thumbnail_url=self._get_thumbnail_url(),
         )
 
+    def _get_thumbnail_url(self) -> str | None:
+        """Return URL template for thumbnails, or None to inline them."""
+        return None
+
     # cannot make proxy ?
     def classifier_concatenate_path(self, to_property) -> None:
         path = list(self.view.classifier)
@@ -220,12 +228,22 @@ class FeatureAPI:
     def playlist(self) -> str:
         db = self.database
         assert db is not None
-        ops = Ops(db)
-        result = db.query_videos(self.view, 0, 0)
-        view_indices = [v.video_id for v in result.result]
-        return str(
-            create_xspf_playlist(map(ops.get_video_filename, view_indices)).open()
-        )
+        entries = Ops(db).iter_playlist_entries(self.view)
+        return str(write_playlist(entries).open())
+
+    def set_sql_stats(self, enabled: bool) -> bool:
+        assert self.database is not None
+        return self.database.set_sql_stats(enabled)
+
+    def dump_sql_stats(self) -> str:
+        assert self.database is not None
+        report = self.database.get_sql_stats_report()
+        if report is None:
+            raise exceptions.PysaurusError("SQL statistics are not enabled.")
+        path = generate_temporary_file(basename="sql_stats", suffix=".txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(report)
+        return str(AbsolutePath(path).open())
 
     def set_similarities_reencoded(
         self, video_indices: list[int], similarities: list[int | None]
@@ -4,10 +4,7 @@ import subprocess
 import threading
 from abc import abstractmethod
 from types import FunctionType
-from typing import Sequence
-
-import filedial
-import pyperclip
+from typing import Any, Sequence
 
 from pysaurus.application import exceptions
 from pysaurus.core.absolute_path import AbsolutePath
@@ -57,39 +54,42 @@ class GuiAPI(FeatureAPI):
         super().__init__(notifier=Information.notifier())
         self.launched_thread: threading.Thread | None = None
         self.copy_work: FileCopier | None = None
-        self.server = ServerLauncher(lambda: self.database)
+        self.server = ServerLauncher(lambda: self.database, lambda: self.view)
         self._closed = False
         self._last_scan_result = None
 
         Information.handle_with(self._notification_callback)
 
-        self.server.start()
         # TODO Check runtime VLC for other operating systems ?
-        self._constants.update(
-            {
-                "PYTHON_HAS_RUNTIME_VLC": PYTHON_HAS_RUNTIME_VLC,
-                "PYTHON_SERVER_HOSTNAME": self.server.server_thread.hostname,
-                "PYTHON_SERVER_PORT": self.server.server_thread.port,
-            }
-        )
+        self._constants["PYTHON_HAS_RUNTIME_VLC"] = PYTHON_HAS_RUNTIME_VLC
         self._proxies.update(
             {
-                "clipboard": FromPyperclip(pyperclip.copy),
-                "select_directory": FromTk(filedial.select_directory, True),
-                "select_file": FromTk(filedial.select_file_to_open, True),
+                "clipboard": FromPyperclip("copy"),
+                "select_directory": FromTk("select_directory", True),
+                "select_file": FromTk("select_file_to_open", True),
             }
         )
 
+    def get_constants(self) -> dict[str, Any]:
+        # Server constants are added on first call, so that
+        # server is not started before it is needed.
+        if "PYTHON_SERVER_PORT" not in self._constants:
+            server_thread = self.server.server_thread
+            self._constants["PYTHON_SERVER_HOSTNAME"] = server_thread.hostname
+            self._constants["PYTHON_SERVER_PORT"] = server_thread.port
+        return self._constants
+
     def open_from_server(self, video_id) -> str:
         assert self.database is not None
-        hostname = self.server.server_thread.hostname
-        port = self.server.server_thread.port
-        url = f"http://{hostname}:{port}/video/{video_id}"
+        url = self.server.url(f"/video/{video_id}")
         logger.debug(f"Running {VLC_PATH} {url}")
         self._run_thread(subprocess.run, [VLC_PATH, url])
         self.database.ops.mark_as_watched(video_id)
         return url
 
+    def _get_thumbnail_url(self) -> str | None:
+        return self.server.url("/thumbnail/{video_id}")
+
     def cancel_copy(self) -> None:
         # TODO Rethink Move/Copy feature
         assert self.database is not None
@@ -9,6 +9,7 @@ from pathlib import Path
 import fire
 import yaml
 
+from pysaurus.core import tracing
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.fs_utils import is_fat_filesystem
 from pysaurus.core.informer import Information
@@ -30,6 +31,11 @@ def main():
     parser.add_argument(
         "--home", default=defaults.get("home"), help="Home directory (default: ~)"
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record a performance trace (Chrome trace-event JSON) into FILE",
+    )
     args, remaining = parser.parse_known_args()
 
     if not args.db:
@@ -37,6 +43,8 @@ def main():
 
     db = _open_database(args.db, args.home)
     api = BenchmarkAPI(db)
+    if args.trace:
+        tracing.start(perf_log=db.get_perf_log_path())
 
     with Information():
         if remaining:
@@ -44,6 +52,9 @@ def main():
         else:
             _repl(api)
 
+    if args.trace:
+        print(f"Trace saved in: {tracing.stop().save(args.trace)}")
+
     print("Done.")
 
 
@@ -222,8 +233,7 @@ class BenchmarkAPI:
         text = str(text)
         with PerfCounter() as t:
             self._view.set_search(text)
-            result = self._db.query_videos(self._view, 0, 0)
-            indices = [v.video_id for v in result.result]
+            indices = self._db.resolve_view_ids(self._view)
         print(f"({t.microseconds / 1000:.3f} ms)")
         output = [f"{len(indices)} result(s)"] + [
             str(video_id) for video_id in indices[:10]
@@ -278,8 +288,7 @@ class BenchmarkAPI:
         sorting = fields.split(",") if fields else []
         with PerfCounter() as t:
             self._view.set_sort(sorting)
-            result = self._db.query_videos(self._view, 0, 0)
-            indices = [v.video_id for v in result.result]
+            indices = self._db.resolve_view_ids(self._view)
         print(f"({t.microseconds / 1000:.3f} ms)")
         return f"{len(indices)} result(s)"
 
@@ -316,6 +325,52 @@ class BenchmarkAPI:
         print(f"({t.microseconds / 1000:.3f} ms)")
         return f"video_text: {before} -> {after} rows (video table: {total_videos})"
 
+    def explain(self, page_size: int = 20, page_number: int = 0):
+        """Show query plans of current view queries and flag full table scans (SQL backend only)."""
+        if not isinstance(self._db, PysaurusCollection):
+            return "Only available for SQL backend."
+        with PerfCounter() as t:
+            plans = self._db.explain_query_videos(self._view, page_size, page_number)
+        print(f"({t.microseconds / 1000:.3f} ms)")
+        nb_full_scans = 0
+        for i, plan in enumerate(plans, 1):
+            full_scans = plan.full_scans
+            nb_full_scans += bool(full_scans)
+            print(f"[{i}] {'FULL SCAN' if full_scans else 'ok'}")
+            print(f"    {' '.join(plan.query.split())}")
+            if plan.parameters:
+                print(f"    parameters: {list(plan.parameters)}")
+            for detail in plan.details:
+                flag = "!!" if detail.strip() in full_scans else "  "
+                print(f"  {flag} {detail}")
+        return f"{len(plans)} query(ies), {nb_full_scans} with full table scan"
+
+    def sqlstats(self, action: str = "report", limit: int = 20, sort: str = "total"):
+        """SQL statement statistics (SQL backend only).
+
+        Actions: on (start recording), off (stop recording),
+        reset (clear statistics), report (show statistics,
+        top statements sorted by total, mean, max, calls or rows).
+        """
+        if not isinstance(self._db, PysaurusCollection):
+            return "Only available for SQL backend."
+        connection = self._db.db
+        if action == "on":
+            connection.enable_sql_stats()
+            return "SQL statistics enabled."
+        if action == "off":
+            connection.disable_sql_stats()
+            return "SQL statistics disabled."
+        stats = connection.sql_stats
+        if stats is None:
+            return "SQL statistics are not enabled (use: sqlstats on)."
+        if action == "reset":
+            stats.reset()
+            return "SQL statistics cleared."
+        if action == "report":
+            return stats.report(limit, sort)
+        return f"Unknown action: {action}"
+
     def should_update(self, limit: int = 20):
         """Dry run: show what an update would add or re-process, without modifying the DB.
 
@@ -281,6 +281,18 @@ class AppContext(QObject):
         self._view.group = result.group_id
         return result
 
+    def get_view_video_ids(self, selector=None) -> list[int]:
+        """Return IDs of videos in view (or in selection), in view order."""
+        if not self._database:
+            return []
+        return self._database.resolve_view_ids(self._view, selector)
+
+    def get_videos_by_ids(self, video_ids: list[int]) -> list[VideoPattern]:
+        """Return videos with given IDs (in any order)."""
+        if not self._database or not video_ids:
+            return []
+        return self._database.get_videos(where={"video_id": video_ids})
+
     def close_database(self) -> None:
         """Close the database."""
         self._api.close_database()
@@ -647,6 +659,14 @@ class AppContext(QObject):
         """Generate and open a playlist. Returns the filename."""
         return self._api.playlist()
 
+    def set_sql_stats(self, enabled: bool) -> bool:
+        """Enable or disable SQL statistics. Returns False if not supported."""
+        return self._api.set_sql_stats(enabled)
+
+    def dump_sql_stats(self) -> str:
+        """Write and open SQL statistics report. Returns the filename."""
+        return self._api.dump_sql_stats()
+
     def open_from_server(self, video_id) -> None:
         """Open a video in VLC via server."""
         self._api.open_from_server(video_id)
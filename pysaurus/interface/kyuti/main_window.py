@@ -25,7 +25,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from pysaurus.core.notifications import End
+from pysaurus.core.notifications import DatabaseReady, End
 from pysaurus.interface.kyuti.app_context import AppContext
 from pysaurus.interface.kyuti.dialogs import EditFoldersDialog, RenameDialog
 from pysaurus.interface.kyuti.pages import (
@@ -35,6 +35,7 @@ from pysaurus.interface.kyuti.pages import (
     VideosPage,
 )
 from pysaurus.interface.kyuti.pages.process_page import ProcessPage
+from pysaurus.interface.kyuti.utils.thumbnail_cache import get_thumbnail_cache
 
 
 class SessionLogDialog(QDialog):
@@ -138,6 +139,16 @@ class MainWindow(QMainWindow):
             "Find Re-&encoded Videos", self.videos_page._on_find_reencoded
         )
         self.database_menu.addSeparator()
+        self._action_sql_stats = self.database_menu.addAction("Record S&QL Statistics")
+        self._action_sql_stats.setCheckable(True)
+        self._action_sql_stats.setToolTip(
+            "Record call count and time of SQL statements run on this database"
+        )
+        self._action_sql_stats.triggered.connect(self._on_sql_stats_changed)
+        self._action_dump_sql_stats = self.database_menu.addAction(
+            "Show SQL S&tatistics...", self._on_dump_sql_stats
+        )
+        self.database_menu.addSeparator()
         self._action_close_db = self.database_menu.addAction(
             "&Close Database", self._on_close_database
         )
@@ -200,6 +211,14 @@ class MainWindow(QMainWindow):
             self._page_size_actions[size] = action
         self._page_size_group.triggered.connect(self._on_page_size_action)
 
+        # Continuous scroll: whole view in one virtualized list, no pages
+        self._action_scroll_mode = self.options_menu.addAction("&Continuous Scroll")
+        self._action_scroll_mode.setCheckable(True)
+        self._action_scroll_mode.setToolTip(
+            "Show all videos of the view in one scrollable list, loaded on demand"
+        )
+        self._action_scroll_mode.triggered.connect(self._on_scroll_mode_changed)
+
         self.options_menu.addSeparator()
 
         # Confirm deletion for entries not found
@@ -321,7 +340,9 @@ class MainWindow(QMainWindow):
 
     def _on_notification(self, notification):
         """Handle generic notifications (logged separately, not displayed in status bar)."""
-        pass
+        if isinstance(notification, DatabaseReady):
+            # Thumbnails may have changed (e.g. after an update).
+            get_thumbnail_cache().clear()
 
     def _on_state_changed(self):
         """Refresh the active page when backend state changes."""
@@ -478,13 +499,22 @@ class MainWindow(QMainWindow):
         self._action_find_reencoded.setEnabled(has_db)
         self._action_close_db.setEnabled(has_db)
         self._action_session_log.setEnabled(has_db)
+        # SQL statistics are recorded per opened database
+        if not self.ctx.has_database():
+            self._action_sql_stats.setChecked(False)
+        self._action_sql_stats.setEnabled(has_db)
+        self._action_dump_sql_stats.setEnabled(
+            has_db and self._action_sql_stats.isChecked()
+        )
 
         # View menu: enabled when on videos page
         self.view_menu.setEnabled(has_db and on_videos_page)
 
         # Options menu: only relevant when a database is open
         self.options_menu.setEnabled(has_db)
-        self.page_size_menu.setEnabled(on_videos_page)
+        self.page_size_menu.setEnabled(
+            on_videos_page and not self._action_scroll_mode.isChecked()
+        )
 
         # Page selector radio buttons: hidden during processing
         self._page_selector.setVisible(has_db)
@@ -566,6 +596,36 @@ class MainWindow(QMainWindow):
                         self, "Update Failed", f"Failed to update folders:\n{e}"
                     )
 
+    def _on_sql_stats_changed(self, checked: bool):
+        """Handle SQL statistics toggle."""
+        if not self.ctx.has_database():
+            return
+
+        if self.ctx.set_sql_stats(checked):
+            state = "enabled" if checked else "disabled"
+            self.status_bar.showMessage(f"SQL statistics {state}", 3000)
+        else:
+            self._action_sql_stats.setChecked(False)
+            QMessageBox.information(
+                self,
+                "SQL Statistics",
+                "SQL statistics are not available for this database.",
+            )
+        self._update_menu_state()
+
+    def _on_dump_sql_stats(self):
+        """Write SQL statistics report to a file and open it."""
+        if not self.ctx.has_database():
+            return
+
+        try:
+            filename = self.ctx.dump_sql_stats()
+            self.status_bar.showMessage(f"SQL statistics opened: {filename}", 5000)
+        except Exception as e:
+            QMessageBox.critical(
+                self, "SQL Statistics", f"Failed to write SQL statistics:\n{e}"
+            )
+
     def _on_close_database(self):
         """Handle close database action."""
         if not self.ctx.has_database():
@@ -645,6 +705,11 @@ class MainWindow(QMainWindow):
         """Handle page size selection from menu."""
         self.videos_page._on_page_size_changed(str(action.data()))
 
+    def _on_scroll_mode_changed(self, checked: bool):
+        """Handle continuous scroll toggle."""
+        self.videos_page.set_scroll_mode(checked)
+        self.page_size_menu.setEnabled(not checked)
+
     def _on_confirm_not_found_changed(self, checked: bool):
         """Handle confirm deletion setting change."""
         # Store the setting in videos_page
@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -38,8 +39,14 @@ from pysaurus.interface.kyuti.dialogs import (
     VideoPropertiesDialog,
 )
 from pysaurus.interface.kyuti.dialogs.video_confirm_dialog import VideoConfirmDialog
+from pysaurus.interface.kyuti.utils.thumbnail_cache import get_thumbnail_cache
 from pysaurus.interface.kyuti.widgets.left_click_menu import LeftClickMenu
 from pysaurus.interface.kyuti.widgets.video_list_item import VideoListItem
+from pysaurus.interface.kyuti.widgets.video_list_model import (
+    VideoItemDelegate,
+    VideoListModel,
+    VideoRole,
+)
 from pysaurus.properties.properties import PropType
 from pysaurus.video.video_pattern import VideoPattern
 from pysaurus.video.video_search_context import VideoSearchContext
@@ -96,6 +103,7 @@ class VideosPage(QWidget):
         self._view_count: int = 0  # Total videos in current view (for selector size)
         self._search_mode: str = "and"  # Current search mode
         self._active_search_text: str = ""  # Text of the currently active search
+        self._scroll_mode: bool = False  # Continuous (virtualized) list, no pages
         self._setup_ui()
         self._setup_shortcuts()
 
@@ -120,8 +128,8 @@ class VideosPage(QWidget):
         splitter.setSizes([150, 850])
 
         # Bottom bar with stats and pagination
-        bottom_bar = self._create_bottom_bar()
-        layout.addWidget(bottom_bar)
+        self.bottom_bar = self._create_bottom_bar()
+        layout.addWidget(self.bottom_bar)
 
     def _setup_shortcuts(self):
         """Set up keyboard shortcuts."""
@@ -302,6 +310,8 @@ class VideosPage(QWidget):
 
         for item in self._video_list_items:
             item.selected = self._selector.contains(item.video.video_id)
+        if self._scroll_mode:
+            self.list_view.viewport().update()
 
         # Update selection indicator and batch action buttons
         # Use selector size for total selection count
@@ -798,6 +808,32 @@ class VideosPage(QWidget):
         self.list_widget.verticalScrollBar().setSingleStep(20)
         layout.addWidget(self.list_widget)
 
+        # Continuous scroll mode: virtualized view over the whole selection.
+        # Rows are fetched lazily by windows and painted by a delegate,
+        # so view size does not matter.
+        self.video_model = VideoListModel(
+            self._fetch_video_window, is_selected=self._selector_contains
+        )
+        self.list_view = QListView()
+        self.list_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.list_view.setModel(self.video_model)
+        self.list_view.setItemDelegate(VideoItemDelegate(self.list_view))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setVerticalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.list_view.verticalScrollBar().setSingleStep(20)
+        self.list_view.clicked.connect(self._on_list_view_clicked)
+        self.list_view.doubleClicked.connect(self._on_list_view_double_clicked)
+        self.list_view.customContextMenuRequested.connect(
+            self._on_list_view_context_menu
+        )
+        self.list_view.setVisible(False)
+        layout.addWidget(self.list_view)
+
         # Stats bar (at bottom)
         self.stats_label = QLabel("0 videos | 0 B | 0:00:00")
         self.stats_label.setStyleSheet("font-size: 12px; padding: 5px;")
@@ -865,8 +901,9 @@ class VideosPage(QWidget):
         selector = self._selector if self._show_only_selected else None
 
         # Get videos from provider
+        page_size, page_number = self._get_page_request()
         context: VideoSearchContext = self.ctx.get_videos(
-            self.page_size, self.page_number, selector
+            page_size, page_number, selector
         )
 
         # Store view count for selector size calculation
@@ -911,7 +948,7 @@ class VideosPage(QWidget):
             if context.group_id is None and context.classifier_stats:
                 self.ctx.set_group(0)
                 # Re-fetch videos with the selected group
-                context = self.ctx.get_videos(self.page_size, self.page_number)
+                context = self.ctx.get_videos(*self._get_page_request())
                 self._current_group_index = 0
 
             # Extract differing fields from common_fields (for similarity groups)
@@ -943,7 +980,14 @@ class VideosPage(QWidget):
             self.classifier_section.setVisible(False)
 
         # Display videos
-        self._display_videos(context.result)
+        if self._scroll_mode:
+            self._videos = []
+            # Resolve whole view once: model then fetches rows by IDs.
+            self.video_model.reset(
+                self.ctx.get_view_video_ids(selector), context.result
+            )
+        else:
+            self._display_videos(context.result)
 
     def _update_group_bar(self, context: VideoSearchContext):
         """Update the groups panel in the sidebar."""
@@ -1244,6 +1288,61 @@ class VideosPage(QWidget):
         self._similarity_field = grouping.field if self._grouped_by_similarity else None
         self.btn_confirm_unique_moves.setVisible(self._grouped_by_moves)
 
+    def set_scroll_mode(self, enabled: bool):
+        """Switch between paged list and continuous (virtualized) list."""
+        self._scroll_mode = enabled
+        self.page_number = 0
+        self.list_widget.setVisible(not enabled)
+        self.list_view.setVisible(enabled)
+        self.bottom_bar.setVisible(not enabled)
+        if enabled:
+            # Release paged widgets, they are not shown anymore.
+            self._display_list_view([])
+        else:
+            self.video_model.reset()
+        self.refresh()
+
+    def _get_page_request(self) -> tuple[int, int]:
+        """Return (page_size, page_number) to query.
+
+        In scroll mode, first window of the model is queried.
+        """
+        if self._scroll_mode:
+            return self.video_model.window_size, 0
+        return self.page_size, self.page_number
+
+    def _fetch_video_window(self, video_ids: list[int]) -> list[VideoPattern]:
+        """Fetch videos of a window of continuous list."""
+        return self.ctx.get_videos_by_ids(video_ids)
+
+    def _selector_contains(self, video_id: int) -> bool:
+        return self._selector.contains(video_id)
+
+    def _on_list_view_clicked(self, index):
+        """Click selects video; Ctrl+Click toggles its selection."""
+        video = index.data(VideoRole)
+        if video is None:
+            return
+        modifiers = QApplication.keyboardModifiers()
+        if modifiers & Qt.KeyboardModifier.ControlModifier:
+            self._on_video_selection_changed(
+                video.video_id, not self._selector.contains(video.video_id)
+            )
+        else:
+            self._on_video_clicked(video.video_id, modifiers)
+
+    def _on_list_view_double_clicked(self, index):
+        video = index.data(VideoRole)
+        if video is not None:
+            self._on_video_double_clicked(video.video_id)
+
+    def _on_list_view_context_menu(self, pos):
+        video = self.list_view.indexAt(pos).data(VideoRole)
+        if video is not None:
+            self._on_video_context_menu(
+                video.video_id, self.list_view.viewport().mapToGlobal(pos)
+            )
+
     def _display_videos(self, videos: list[VideoPattern]):
         """Display the videos in the content area."""
         self._videos = videos
@@ -1268,6 +1367,9 @@ class VideosPage(QWidget):
         n_old = self.list_widget.count()
         n_new = len(videos)
 
+        # Thumbnails of previous page no longer need decoding.
+        get_thumbnail_cache().cancel_pending()
+
         # Replace existing slots: new widget on existing QListWidgetItem
         for i in range(min(n_old, n_new)):
             new_widget = self._make_video_list_item(videos[i], diff_fields)
@@ -1504,8 +1606,9 @@ class VideosPage(QWidget):
         self.ctx.open_containing_folder(video_id)
 
     def _get_video_by_id(self, video_id: int):
-        """Get video object by ID from current page."""
-        for video in self._videos:
+        """Get video object by ID from current page (or loaded rows in scroll mode)."""
+        videos = self.video_model.loaded_videos() if self._scroll_mode else self._videos
+        for video in videos:
             if video.video_id == video_id:
                 return video
         return None
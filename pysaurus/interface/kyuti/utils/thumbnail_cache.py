@@ -0,0 +1,151 @@
+"""
+Cache of decoded thumbnails for Qt widgets.
+
+Thumbnails are decoded and scaled in a QThreadPool, as QImage
+(QPixmap can only be used in GUI thread), then converted to QPixmap
+and cached in GUI thread. Widgets show a placeholder meanwhile and
+pass a callback to `request()` to swap it in. Callbacks are kept per
+thumbnail, so a decoded pixmap is only delivered to widgets waiting
+for it.
+"""
+
+from collections import OrderedDict
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPixmap
+
+ThumbnailKey = tuple[int, int, int]  # video_id, width, height
+# Called with decoded pixmap (null if thumbnail could not be decoded).
+PixmapCallback = Callable[[QPixmap], None]
+
+
+class _DecodeSignals(QObject):
+    decoded = Signal(object, object)  # ThumbnailKey, QImage | None
+
+
+class _DecodeTask(QRunnable):
+    """Decode and scale thumbnail data to a QImage."""
+
+    def __init__(self, key: ThumbnailKey, data: bytes, signals: _DecodeSignals):
+        super().__init__()
+        self.key = key
+        self.data = data
+        self.signals = signals
+
+    def run(self):
+        _, width, height = self.key
+        image = QImage.fromData(self.data)
+        if image.isNull():
+            image = None
+        else:
+            image = image.scaled(
+                width,
+                height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        self.signals.decoded.emit(self.key, image)
+
+
+class ThumbnailPixmapCache(QObject):
+    """
+    LRU cache of scaled thumbnail pixmaps, keyed by (video_id, width, height),
+    bounded by total pixmap memory.
+    """
+
+    # video_id, width, height, pixmap (null if thumbnail could not be decoded)
+    pixmap_ready = Signal(int, int, int, QPixmap)
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self._pixmaps: OrderedDict[ThumbnailKey, QPixmap] = OrderedDict()
+        self._nb_bytes = 0
+        self._pending: set[ThumbnailKey] = set()
+        self._callbacks: dict[ThumbnailKey, list[PixmapCallback]] = {}
+        self._pool = QThreadPool(self)
+        # Queued connection: decoded images are received in GUI thread.
+        self._signals = _DecodeSignals()
+        self._signals.decoded.connect(
+            self._on_decoded, Qt.ConnectionType.QueuedConnection
+        )
+
+    def get(self, video_id: int, width: int, height: int) -> QPixmap | None:
+        """Return cached pixmap (null if thumbnail is invalid), or None if unknown."""
+        key = (video_id, width, height)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def request(
+        self,
+        video_id: int,
+        data: bytes,
+        width: int,
+        height: int,
+        callback: PixmapCallback | None = None,
+    ) -> None:
+        """Decode thumbnail in background.
+
+        When done, `callback` is called with pixmap, then `pixmap_ready`
+        is emitted.
+        """
+        key = (video_id, width, height)
+        if callback is not None:
+            self._callbacks.setdefault(key, []).append(callback)
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        self._pool.start(_DecodeTask(key, data, self._signals))
+
+    def cancel_pending(self) -> None:
+        """Drop decoding requests not yet started and pending callbacks.
+
+        Called when widgets waiting for thumbnails are replaced
+        (e.g. on page change).
+        """
+        self._pool.clear()
+        self._pending.clear()
+        self._callbacks.clear()
+
+    def clear(self) -> None:
+        self.cancel_pending()
+        self._pixmaps.clear()
+        self._nb_bytes = 0
+
+    def _on_decoded(self, key: ThumbnailKey, image: QImage | None):
+        self._pending.discard(key)
+        # Invalid thumbnails are cached too, as null pixmaps,
+        # so that they are not decoded again.
+        pixmap = QPixmap() if image is None else QPixmap.fromImage(image)
+        self._put(key, pixmap)
+        for callback in self._callbacks.pop(key, ()):
+            callback(pixmap)
+        self.pixmap_ready.emit(*key, pixmap)
+
+    def _put(self, key: ThumbnailKey, pixmap: QPixmap):
+        previous = self._pixmaps.pop(key, None)
+        if previous is not None:
+            self._nb_bytes -= self._pixmap_size(previous)
+        self._pixmaps[key] = pixmap
+        self._nb_bytes += self._pixmap_size(pixmap)
+        while self._nb_bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._nb_bytes -= self._pixmap_size(evicted)
+
+    @classmethod
+    def _pixmap_size(cls, pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+_THUMBNAIL_CACHE: ThumbnailPixmapCache | None = None
+
+
+def get_thumbnail_cache() -> ThumbnailPixmapCache:
+    """Return application-wide thumbnail cache (created on first call)."""
+    global _THUMBNAIL_CACHE
+    if _THUMBNAIL_CACHE is None:
+        _THUMBNAIL_CACHE = ThumbnailPixmapCache()
+    return _THUMBNAIL_CACHE
@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pysaurus.interface.kyuti.utils.thumbnail_cache import get_thumbnail_cache
 from pysaurus.interface.kyuti.widgets.flow_layout import FlowLayout
 from pysaurus.video.video_pattern import VideoPattern
 
@@ -459,21 +460,43 @@ class VideoListItem(QFrame):
         main_layout.addLayout(details_layout, 1)
 
     def _load_thumbnail(self):
-        """Load the thumbnail image."""
+        """Load the thumbnail image.
+
+        Use cached pixmap if available, otherwise show a placeholder
+        while thumbnail is decoded in background.
+        """
+        cache = get_thumbnail_cache()
+        video_id = self.video.video_id
+        pixmap = cache.get(video_id, self._thumb_width, self._thumb_height)
+        if pixmap is not None:
+            if pixmap.isNull():
+                self._set_no_thumbnail()
+            else:
+                self.thumb_label.setPixmap(pixmap)
+            return
+
         thumb_data = self.video.thumbnail
         if thumb_data:
-            pixmap = QPixmap()
-            if pixmap.loadFromData(thumb_data):
-                scaled = pixmap.scaled(
-                    self._thumb_width,
-                    self._thumb_height,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self.thumb_label.setPixmap(scaled)
-                return
+            self.thumb_label.setText("...")
+            cache.request(
+                video_id,
+                thumb_data,
+                self._thumb_width,
+                self._thumb_height,
+                self._on_thumbnail_ready,
+            )
+            return
+
+        self._set_no_thumbnail()
+
+    def _on_thumbnail_ready(self, pixmap: QPixmap):
+        if pixmap.isNull():
+            self._set_no_thumbnail()
+        else:
+            self.thumb_label.setPixmap(pixmap)
 
-        # No thumbnail - show placeholder
+    def _set_no_thumbnail(self):
+        """Show no-thumbnail placeholder."""
         self.thumb_label.setText("No thumbnail")
         self.thumb_label.setStyleSheet(
             "background-color: #e0e0e0; color: #666666; border: 1px solid #ccc;"
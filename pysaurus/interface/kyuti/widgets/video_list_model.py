@@ -0,0 +1,275 @@
+"""
+Virtualized video list: lazy model and painting delegate.
+
+Unlike VideosPage paged list (one VideoListItem widget tree per video),
+the model only knows IDs of videos in view, resolved once per view, and
+fetches videos by windows of IDs when a row is first painted. Delegate
+paints rows directly with QPainter. Memory and first paint time do not
+depend on number of videos.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from pysaurus.interface.kyuti.utils.thumbnail_cache import get_thumbnail_cache
+from pysaurus.interface.kyuti.widgets.video_list_item import _get_scaled_size
+from pysaurus.video.video_pattern import VideoPattern
+
+# Role returning VideoPattern of a row.
+VideoRole = Qt.ItemDataRole.UserRole + 1
+
+# Fetch videos with given IDs (in any order, missing videos skipped).
+VideoFetcher = Callable[[list[int]], list[VideoPattern]]
+
+
+class VideoListModel(QAbstractListModel):
+    """List model fetching videos lazily, by windows of `window_size` rows.
+
+    Windows requested while painting are fetched later, from event loop,
+    and their rows are painted as placeholders meanwhile.
+    At most `max_windows` windows are kept in memory (LRU).
+    """
+
+    def __init__(
+        self,
+        fetch: VideoFetcher,
+        window_size: int = 100,
+        max_windows: int = 10,
+        is_selected: Callable[[int], bool] | None = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._fetch = fetch
+        self.window_size = window_size
+        self.max_windows = max_windows
+        self._is_selected = is_selected or (lambda video_id: False)
+        self._video_ids: list[int] = []
+        self._windows: OrderedDict[int, list[VideoPattern | None]] = OrderedDict()
+        # Windows to fetch on next event loop iteration.
+        self._pending: set[int] = set()
+
+    def reset(
+        self, video_ids: Sequence[int] = (), first_window: Sequence[VideoPattern] = ()
+    ):
+        """Reset model with IDs of videos in view, in view order.
+
+        `first_window` gives videos of window 0 if already fetched.
+        """
+        self.beginResetModel()
+        self._windows.clear()
+        self._pending.clear()
+        self._video_ids = list(video_ids)
+        if self._video_ids and first_window:
+            self._windows[0] = self._arrange(0, first_window)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._video_ids)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._video_ids):
+            return None
+        window_index, position = divmod(index.row(), self.window_size)
+        window = self._windows.get(window_index)
+        if window is None:
+            # Called while painting: do not query database here.
+            self._request(window_index)
+            return None
+        video = window[position]
+        if video is None:
+            return None
+        if role == VideoRole:
+            return video
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(video.file_title)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return str(video.filename)
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return (
+                Qt.CheckState.Checked
+                if self._is_selected(video.video_id)
+                else Qt.CheckState.Unchecked
+            )
+        return None
+
+    def video_at(self, row: int) -> VideoPattern | None:
+        """Return video at given row, fetching its window now if needed."""
+        if not 0 <= row < len(self._video_ids):
+            return None
+        window_index, position = divmod(row, self.window_size)
+        return self._get_window(window_index)[position]
+
+    def loaded_videos(self) -> list[VideoPattern]:
+        """Return videos currently in memory."""
+        return [
+            video
+            for window in self._windows.values()
+            for video in window
+            if video is not None
+        ]
+
+    def row_of(self, video_id: int) -> int | None:
+        """Return row of given video if loaded, else None."""
+        for window_index, window in self._windows.items():
+            for position, video in enumerate(window):
+                if video is not None and video.video_id == video_id:
+                    return window_index * self.window_size + position
+        return None
+
+    def _request(self, window_index: int):
+        if not self._pending:
+            QTimer.singleShot(0, self._fetch_pending)
+        self._pending.add(window_index)
+
+    def _fetch_pending(self):
+        pending, self._pending = self._pending, set()
+        for window_index in sorted(pending):
+            if window_index in self._windows:
+                continue
+            window = self._get_window(window_index)
+            first = window_index * self.window_size
+            self.dataChanged.emit(
+                self.index(first), self.index(first + len(window) - 1)
+            )
+
+    def _get_window(self, window_index: int) -> list[VideoPattern | None]:
+        window = self._windows.get(window_index)
+        if window is not None:
+            self._windows.move_to_end(window_index)
+            return window
+        start = window_index * self.window_size
+        video_ids = self._video_ids[start : start + self.window_size]
+        window = self._arrange(window_index, self._fetch(video_ids))
+        self._windows[window_index] = window
+        while len(self._windows) > self.max_windows:
+            self._windows.popitem(last=False)
+        return window
+
+    def _arrange(
+        self, window_index: int, videos: Sequence[VideoPattern]
+    ) -> list[VideoPattern | None]:
+        """Return videos in window order, None for missing videos."""
+        start = window_index * self.window_size
+        by_id = {video.video_id: video for video in videos}
+        return [
+            by_id.get(video_id)
+            for video_id in self._video_ids[start : start + self.window_size]
+        ]
+
+
+class VideoItemDelegate(QStyledItemDelegate):
+    """Paint a video row: thumbnail, title, filename and a summary line.
+
+    All rows have the same height, so view can use uniform item sizes.
+    """
+
+    BASE_THUMB_WIDTH = 180
+    BASE_THUMB_HEIGHT = 100
+    MARGIN = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thumb_width = _get_scaled_size(self.BASE_THUMB_WIDTH)
+        self._thumb_height = _get_scaled_size(self.BASE_THUMB_HEIGHT)
+        # Repaint view when a thumbnail decoded in background is ready.
+        get_thumbnail_cache().pixmap_ready.connect(self._on_pixmap_ready)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self._thumb_height + 2 * self.MARGIN)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        video: VideoPattern | None = index.data(VideoRole)
+        rect = option.rect
+        painter.save()
+        selected = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        if selected:
+            painter.fillRect(rect, QColor("#fff8c4"))
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, QColor("#f5f9ff"))
+        painter.setPen(QColor("#e0e0e0"))
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        thumb_rect = QRect(
+            rect.left() + self.MARGIN,
+            rect.top() + self.MARGIN,
+            self._thumb_width,
+            self._thumb_height,
+        )
+        if video is None:
+            painter.fillRect(thumb_rect, QColor("#e0e0e0"))
+            painter.restore()
+            return
+        self._paint_thumbnail(painter, thumb_rect, video)
+
+        text_left = thumb_rect.right() + 2 * self.MARGIN
+        text_width = max(0, rect.right() - self.MARGIN - text_left)
+        font = QFont(option.font)
+        metrics = QFontMetrics(font)
+        line_height = metrics.height() + 2
+        y = rect.top() + self.MARGIN
+
+        title_font = QFont(font)
+        title_font.setBold(True)
+        lines = [
+            (title_font, QColor("#000000"), str(video.file_title)),
+            (font, QColor("#666666"), str(video.meta_title or "")),
+            (
+                font,
+                QColor("#a0a0a0") if video.watched else QColor("#8c8cfa"),
+                str(video.filename),
+            ),
+            (font, QColor("#333333"), self._format_line(video)),
+            (font, QColor("#996600"), str(video.date)),
+        ]
+        for line_font, color, text in lines:
+            if not text:
+                continue
+            painter.setFont(line_font)
+            painter.setPen(color)
+            elided = QFontMetrics(line_font).elidedText(
+                text, Qt.TextElideMode.ElideMiddle, text_width
+            )
+            painter.drawText(
+                QRect(text_left, y, text_width, line_height),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                elided,
+            )
+            y += line_height
+        painter.restore()
+
+    def _paint_thumbnail(self, painter: QPainter, rect: QRect, video: VideoPattern):
+        cache = get_thumbnail_cache()
+        pixmap = cache.get(video.video_id, rect.width(), rect.height())
+        if pixmap is None:
+            painter.fillRect(rect, QColor("#e0e0e0"))
+            if video.with_thumbnails:
+                thumb_data = video.thumbnail
+                if thumb_data:
+                    cache.request(
+                        video.video_id, thumb_data, rect.width(), rect.height()
+                    )
+            return
+        if pixmap.isNull():
+            return
+        x = rect.left() + (rect.width() - pixmap.width()) // 2
+        y = rect.top() + (rect.height() - pixmap.height()) // 2
+        painter.drawPixmap(x, y, pixmap)
+
+    @classmethod
+    def _format_line(cls, video: VideoPattern) -> str:
+        ext = str(video.extension).upper() if video.extension else ""
+        frame_rate = round(video.frame_rate) if video.frame_rate else 0
+        return (
+            f"{ext} {video.size} | {video.length} | "
+            f"{video.width or 0} x {video.height or 0} @ {frame_rate} fps | "
+            f"{video.video_codec or ''}, {video.audio_codec or ''}"
+        )
+
+    def _on_pixmap_ready(self, video_id: int, width: int, height: int, pixmap):
+        view = self.parent()
+        if view is not None and hasattr(view, "viewport"):
+            view.viewport().update()
@@ -178,17 +178,25 @@ class VideroidApp:
 
     def _menu_database(self, has_db: bool = True):
         # Quit is always available (kyuti). Order mirrors kyuti (Rename, Edit,
-        # Update, Close, Quit); Find Similar/Re-encoded and Session Log are
-        # deferred features (not yet ported).
+        # Update, SQL statistics, Close, Quit); Find Similar/Re-encoded and
+        # Session Log are deferred features (not yet ported).
         if not has_db:
             return [("Quit", self._quit)]
-        return [
+        sql_stats = self.context.sql_stats_enabled()
+        actions = [
             ("Rename Database…", self._rename_db),
             ("Edit Folders…", self._edit_folders),
             ("Update Database", self._update_db),
-            ("Close Database", self._close_db),
-            ("Quit", self._quit),
+            (
+                f"{'☑ ' if sql_stats else '☐ '}Record SQL Statistics",
+                self._toggle_sql_stats,
+            ),
         ]
+        if sql_stats:
+            # No greyed items (G10): the dump action is shown only when recording.
+            actions.append(("Show SQL Statistics…", self._dump_sql_stats))
+        actions += [("Close Database", self._close_db), ("Quit", self._quit)]
+        return actions
 
     def _menu_view(self):
         return [("Refresh View", self._refresh_view)]
@@ -261,6 +269,20 @@ class VideroidApp:
                 "Folders updated — use Database ▸ Update Database to rescan."
             )
 
+    def _toggle_sql_stats(self) -> None:
+        enabled = not self.context.sql_stats_enabled()
+        if self.context.set_sql_stats(enabled):
+            self._set_status(f"SQL statistics {'enabled' if enabled else 'disabled'}.")
+        else:
+            self.window.alert(
+                "SQL statistics are not available for this database.", "SQL Statistics"
+            )
+        self._refresh_shell()
+
+    def _dump_sql_stats(self) -> None:
+        filename = self.context.dump_sql_stats()
+        self._set_status(f"SQL statistics opened: {filename}")
+
     def _close_db(self) -> None:
         self.window.confirm(
             "Close the current database?",
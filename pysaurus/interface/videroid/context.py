@@ -47,6 +47,8 @@ class VideroidContext:
 
     def __init__(self):
         self._api = _VideroidAPI()
+        # Database whose SQL statements are being recorded, if any.
+        self._sql_stats_database = None
 
     @property
     def api(self) -> _VideroidAPI:
@@ -84,13 +86,12 @@ class VideroidContext:
     def get_all_view_ids(self) -> list:
         """All video ids of the current view (every page), for whole-view
         selection actions. Mirrors how the backend resolves a selector over the
-        view: query_videos with page_size=0 returns the whole view (no paging,
+        view: resolve_view_ids reads only ids of the whole view (no paging,
         and no view.group side effect — we only want the ids)."""
         db = self._api.database
         if db is None:
             return []
-        result = db.query_videos(self._api.view, 0, 0)
-        return [video.video_id for video in result.result]
+        return db.resolve_view_ids(self._api.view)
 
     # --- actions (long ops are threaded by GuiAPI; they emit DatabaseReady) --
 
@@ -356,6 +357,23 @@ class VideroidContext:
         """Close the current database and reset the view."""
         self._api.close_database()
         self._api.view.reset()
+        self._sql_stats_database = None
+
+    def sql_stats_enabled(self) -> bool:
+        """True if SQL statistics are recorded for the current database."""
+        db = self._api.database
+        return db is not None and db is self._sql_stats_database
+
+    def set_sql_stats(self, enabled: bool) -> bool:
+        """Enable or disable SQL statistics. Returns False if not supported."""
+        if not self._api.set_sql_stats(enabled):
+            return False
+        self._sql_stats_database = self._api.database if enabled else None
+        return True
+
+    def dump_sql_stats(self) -> str:
+        """Write and open the SQL statistics report. Returns the filename."""
+        return self._api.dump_sql_stats()
 
     def rename_database(self, new_name: str) -> None:
         """Rename the current database and update the application registry."""
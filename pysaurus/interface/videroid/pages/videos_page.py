@@ -22,7 +22,11 @@ from pysaurus.interface.videroid.dialogs.grouping_dialog import GroupingDialog
 from pysaurus.interface.videroid.dialogs.sorting_dialog import SortingDialog
 from pysaurus.interface.videroid.dialogs.sources_dialog import SourcesDialog
 from pysaurus.interface.videroid.pages.base_page import Page
-from pysaurus.interface.videroid.widgets.video_card import VideoCard, _thumbnail
+from pysaurus.interface.videroid.widgets.video_card import (
+    LazyCardList,
+    VideoCardCache,
+    _thumbnail,
+)
 
 
 class VideosPage(Page):
@@ -46,7 +50,10 @@ class VideosPage(Page):
         self._selection_menu = None
         # Content widgets.
         self._status = videre.Text("")
-        self._cards = videre.Column([], space=0)
+        # Cards are built lazily, only when scrolled into view, and cached per
+        # video across reloads (shaping off-screen cards dominates first render).
+        self._cards = LazyCardList(weight=1)
+        self._card_cache = VideoCardCache()
         self._page_label = videre.Text("")
         # Sidebar widgets.
         self._sources_display = videre.Text("All readable")
@@ -98,7 +105,7 @@ class VideosPage(Page):
         content = videre.Column(
             [
                 videre.Container(self._status, padding=videre.Padding.all(4)),
-                videre.ScrollView(self._cards, wrap_horizontal=True, weight=1),
+                self._cards,
                 videre.Container(
                     pagination,
                     horizontal_alignment=videre.Alignment.CENTER,
@@ -287,7 +294,10 @@ class VideosPage(Page):
         )
         ctx = self._context
         if ctx is None:
-            self._cards.controls = [videre.Text("No database open.", italic=True)]
+            self._card_cache.clear()
+            self._cards.set_items(
+                0, empty=videre.Text("No database open.", italic=True)
+            )
             self._status.text = ""
             self._page_label.text = ""
             self._sidebar_column.controls = self._with_section_backgrounds(
@@ -299,10 +309,11 @@ class VideosPage(Page):
                 ]
             )
             return
-        self._cards.controls = [
-            VideoCard(video, index, self, self._selector.contains(video.video_id))
-            for index, video in enumerate(ctx.result)
-        ] or [videre.Text("(no video on this page)", italic=True)]
+        self._cards.set_items(
+            len(ctx.result),
+            self._build_card,
+            empty=videre.Text("(no video on this page)", italic=True),
+        )
         self._view_count = ctx.selection_count
         self._update_selection_counter()
         self._refresh_selection_menu()
@@ -331,6 +342,12 @@ class VideosPage(Page):
             sections.append(self._sec_classifier)
         self._sidebar_column.controls = self._with_section_backgrounds(sections)
 
+    def _build_card(self, index: int) -> Widget:
+        video = self._context.result[index]
+        return self._card_cache.get(
+            video, index, self, self._selector.contains(video.video_id)
+        )
+
     def _update_search(self, ctx) -> None:
         search = ctx.search
         if search is not None and getattr(search, "text", ""):
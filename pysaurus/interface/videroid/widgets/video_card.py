@@ -2,17 +2,25 @@
 
 Shows the thumbnail, metadata, a per-video actions menu (ContextButton) wired to
 methods on the page, and a selection checkbox.
+
+Also the lazy card list used by the Videos page: only cards intersecting the
+scroll viewport (plus a margin) are built, and built cards are cached per video
+so their shaped text is reused across reloads (videre gap G9 — the first render
+is mostly HarfBuzz shaping of off-screen cards, see `wip/videroid_perf/`).
 """
 
 from __future__ import annotations
 
 import io
+from collections import OrderedDict
+from typing import Callable
 
 import videre
 from PIL import Image
 from videre.widgets.widget import Widget
 
 from pysaurus.interface.videroid import theme
+from pysaurus.interface.videroid.widgets.virtual_scroll import VirtualScrollView
 from pysaurus.video.video_pattern import VideoPattern
 
 _THUMB_BOX = (180, 100)
@@ -190,13 +198,13 @@ def _attributes(
 
 class VideoCard(videre.Container):
     __wprops__ = {}
-    __slots__ = ()
+    __slots__ = ("checkbox",)
 
     def __init__(
         self, video: VideoPattern, index: int = 0, page=None, selected: bool = False
     ):
         menu = _menu(video, page) if page is not None else None
-        checkbox = (
+        self.checkbox = checkbox = (
             videre.Checkbox(
                 checked=selected, data=video.video_id, on_change=page._on_card_check
             )
@@ -221,3 +229,272 @@ class VideoCard(videre.Container):
             background_color=bg,
             border=border,
         )
+
+
+# Video attributes rendered by a card (see _attributes and _thumbnail), compared
+# by their displayed (string) value.
+_CARD_FIELDS = (
+    "filename",
+    "title",
+    "meta_title",
+    "file_title",
+    "found",
+    "readable",
+    "unreadable",
+    "watched",
+    "with_thumbnails",
+    "extension",
+    "size",
+    "container_format",
+    "video_codec",
+    "audio_codec",
+    "byte_rate",
+    "length",
+    "width",
+    "height",
+    "frame_rate",
+    "bit_depth",
+    "sample_rate",
+    "audio_bits",
+    "channels",
+    "audio_bit_rate_formatted",
+    "audio_languages",
+    "subtitle_languages",
+    "date",
+    "date_entry_modified",
+    "date_entry_opened",
+    "similarity_id",
+    "similarity",
+    "errors",
+)
+
+
+def _card_key(video: VideoPattern, selected: bool) -> tuple:
+    # Everything a card displays, so that a cached card is reused only while it
+    # is still accurate (e.g. toggling "watched" or re-probing a modified file
+    # must rebuild the card).
+    return (
+        video.video_id,
+        selected,
+        *(str(getattr(video, name)) for name in _CARD_FIELDS),
+        tuple(
+            (name, tuple(values)) for name, values in (video.properties or {}).items()
+        ),
+    )
+
+
+class VideoCardCache:
+    """LRU cache of built cards, keyed by what they display.
+
+    A reused card keeps its rendered surfaces and shaped text documents, so
+    going back to a page (or reloading after an action) does not shape
+    unchanged cards again.
+    """
+
+    __slots__ = ("max_size", "_cards")
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._cards: OrderedDict[tuple, VideoCard] = OrderedDict()
+
+    def __len__(self):
+        return len(self._cards)
+
+    def get(
+        self, video: VideoPattern, index: int = 0, page=None, selected: bool = False
+    ) -> VideoCard:
+        key = _card_key(video, selected)
+        card = self._cards.get(key)
+        if card is None:
+            card = VideoCard(video, index, page, selected)
+            self._cards[key] = card
+            while len(self._cards) > self.max_size:
+                self._cards.popitem(last=False)
+        else:
+            self._cards.move_to_end(key)
+            # Checkbox may have been toggled since the card was built.
+            if card.checkbox is not None:
+                card.checkbox.checked = selected
+        return card
+
+    def clear(self) -> None:
+        self._cards.clear()
+
+
+class LazyCardList(VirtualScrollView):
+    """Vertical scroll view building its cards on demand.
+
+    Only cards intersecting the viewport (plus `margin` pixels above and
+    below) are built and rendered. Scrolling is virtual: the scrollbar and the
+    scroll position use the height of the whole list, computed from the heights
+    of cards already rendered (or their average for never-rendered cards), so
+    no surface is ever allocated for off-screen cards (see VirtualScrollView).
+
+    Horizontal scrolling is not supported: cards wrap to the view width.
+    """
+
+    __wprops__ = {}
+    __slots__ = (
+        "margin",
+        "_column",
+        "_count",
+        "_build",
+        "_cards",
+        "_heights",
+        "_estimate",
+        "_layout_key",
+        "_width",
+        "_offset",
+    )
+
+    DEFAULT_CARD_HEIGHT = 160
+
+    def __init__(self, margin: int = 240, **kwargs):
+        self.margin = margin
+        self._column = videre.Column([], space=0)
+        self._count = 0
+        self._build: Callable[[int], Widget] | None = None
+        # index => built card, for the current items
+        self._cards: dict[int, Widget] = {}
+        # index => rendered height, for the current items
+        self._heights: dict[int, int] = {}
+        # running (total height, nb cards), across items, for estimates
+        self._estimate = (0, 0)
+        self._layout_key = None
+        self._width = None
+        # Virtual position of first built card.
+        self._offset = 0
+        super().__init__(self._column, wrap_horizontal=True, **kwargs)
+
+    @property
+    def controls(self) -> list[Widget]:
+        """Widgets currently in the list: built cards, or the empty widget."""
+        return self._column.controls
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def cards(self) -> list[Widget]:
+        """Cards currently built, in list order."""
+        return [self._cards[index] for index in sorted(self._cards)]
+
+    def set_items(
+        self,
+        count: int,
+        build: Callable[[int], Widget] | None = None,
+        empty: Widget | None = None,
+    ) -> None:
+        """Show `count` cards, the card at index `i` being built by `build(i)`.
+
+        If `count` is 0, show `empty` instead.
+        """
+        self._count = count if build is not None else 0
+        self._build = build
+        self._cards.clear()
+        self._heights.clear()
+        self._layout_key = None
+        self._column.controls = [] if self._count or empty is None else [empty]
+        self.update()
+
+    def on_jump_y(self, content_y: int):
+        if not self._count:
+            return super().on_jump_y(content_y)
+        if self.scroll_top != content_y:
+            self.scroll_top = content_y
+            self.update()
+
+    def handle_mouse_wheel(self, x: int, y: int, shift: bool):
+        if not self._count:
+            return super().handle_mouse_wheel(x, y, shift)
+        if x or shift or not y or not self.vertical_scroll:
+            return
+        bottom = self._total_height() - self.rendered_height
+        if (y > 0 and self.scroll_top > 0) or (y < 0 and self.scroll_top < bottom):
+            # Clamped on draw.
+            self.scroll_top -= self.SCROLL_STEP * y
+            self.update()
+
+    def draw(self, window, width: int = None, height: int = None):
+        if not self._count:
+            self.scroll_top = 0
+            return super().draw(window, width, height)
+        if width != self._width:
+            # Cards wrap text: heights depend on available width.
+            self._width = width
+            self._heights.clear()
+            self._layout_key = None
+
+        # Real heights may differ from estimates: lay out again, at most twice,
+        # until built cards cover the viewport.
+        content = None
+        for _ in range(3):
+            if height is not None:
+                bottom = self._total_height() - height
+                self.scroll_top = max(0, min(self.scroll_top, bottom))
+            if not self._layout(height) and content is not None:
+                break
+            content = self._column.render(window, width)
+            self._measure()
+
+        if height is None:
+            self.scroll_top = 0
+            return content
+        content_y = self._offset - self.scroll_top
+        self.place_content(0, content_y)
+        view = window.new_surface(width or content.get_width(), height)
+        view.blit(content, (0, content_y))
+        total = self._total_height()
+        if total > height and self.vertical_scroll:
+            self.draw_vertical_scrollbar(window, view, total)
+        return view
+
+    def _card_height(self, index: int) -> int:
+        height = self._heights.get(index)
+        if height is None:
+            total, nb = self._estimate
+            height = total // nb if nb else self.DEFAULT_CARD_HEIGHT
+        return height
+
+    def _total_height(self) -> int:
+        return sum(self._card_height(index) for index in range(self._count))
+
+    def _layout(self, height: int | None) -> bool:
+        """Build cards in visible range. Return True if list was changed."""
+        if height is None:
+            low, high = 0, float("inf")
+        else:
+            low = self.scroll_top - self.margin
+            high = self.scroll_top + height + self.margin
+        y = 0
+        offset = None
+        visible = []
+        for index in range(self._count):
+            card_height = self._card_height(index)
+            if y + card_height > low and y < high:
+                if offset is None:
+                    offset = y
+                visible.append(index)
+            y += card_height
+        self._offset = offset or 0
+
+        layout_key = (visible[0], visible[-1]) if visible else None
+        if layout_key == self._layout_key:
+            return False
+        self._layout_key = layout_key
+        # Cards out of range are dropped (they may live on in a card cache).
+        self._cards = {
+            index: self._cards.get(index) or self._build(index) for index in visible
+        }
+        self._column.controls = [self._cards[index] for index in visible]
+        return True
+
+    def _measure(self) -> None:
+        total, nb = self._estimate
+        for index, card in self._cards.items():
+            if index not in self._heights:
+                self._heights[index] = card.rendered_height
+                total += self._heights[index]
+                nb += 1
+        self._estimate = (total, nb)
@@ -0,0 +1,75 @@
+"""Scroll view with a virtual scroll position.
+
+videre's ScrollView scrolls a control it renders entirely, and has no public API
+to scroll a content taller than what is rendered (e.g. a list building only its
+visible items). VirtualScrollView keeps the scroll position itself, and is the
+only place touching the ScrollView internals this requires:
+
+- ``_content_x`` / ``_content_y``: position of the control in the view, which
+  videre uses to dispatch mouse events to the control's children;
+- ``_vscrollbar``: the vertical scrollbar, drawn with ``configure()``,
+  ``background`` and ``render()`` as ScrollView.draw() does.
+
+These names are listed in :data:`VIDERE_INTERNALS` and checked by the tests, so
+that a videre upgrade renaming them fails there rather than at draw time.
+"""
+
+from __future__ import annotations
+
+import videre
+from videre.core.pygame_utils import Surface
+from videre.widgets.widget import Widget
+
+# ScrollView internals used below, and the scrollbar members they rely on.
+VIDERE_INTERNALS = ("_content_x", "_content_y", "_vscrollbar")
+SCROLLBAR_INTERNALS = ("configure", "background", "render", "x", "y")
+
+
+class VirtualScrollView(videre.ScrollView):
+    """ScrollView whose subclasses draw the content at a virtual position.
+
+    Subclasses own the scroll logic: they update :attr:`scroll_top`, then, in
+    ``draw()``, place the rendered content with :meth:`place_content` and draw
+    the scrollbar for the virtual content with :meth:`draw_vertical_scrollbar`.
+    """
+
+    __wprops__ = {}
+    __slots__ = ("_scroll_top",)
+
+    # Pixels scrolled per mouse wheel step, as in videre.ScrollView.
+    SCROLL_STEP = 120
+
+    def __init__(self, control: Widget, **kwargs):
+        self._scroll_top = 0
+        super().__init__(control, **kwargs)
+
+    @property
+    def scroll_top(self) -> int:
+        """Virtual scroll position: content y shown at the top of the view."""
+        return self._scroll_top
+
+    @scroll_top.setter
+    def scroll_top(self, value: int):
+        self._scroll_top = value
+
+    def place_content(self, x: int, y: int) -> None:
+        """Set position of the control in the view."""
+        self._content_x = x
+        self._content_y = y
+
+    def draw_vertical_scrollbar(
+        self, window, view: Surface, content_length: int
+    ) -> None:
+        """Draw on `view` the scrollbar of a content of `content_length` pixels.
+
+        The scrollbar grip is placed at :attr:`scroll_top`.
+        """
+        width, height = view.get_width(), view.get_height()
+        scrollbar = self._vscrollbar
+        scrollbar.configure(
+            content_length, -self._scroll_top, False, self.scroll_thickness
+        )
+        view.blit(
+            scrollbar.background.render(window, width, height), scrollbar.background.pos
+        )
+        view.blit(scrollbar.render(window, width, height), (scrollbar.x, scrollbar.y))
@@ -11,6 +11,8 @@ class DatabaseContext:
     folders: list[AbsolutePath]
     prop_types: list[PropType]
     view: VideoSearchContext
+    # If set, videos reference thumbnails by URL (see VideoPattern.json()).
+    thumbnail_url: str | None = None
 
     def json(self):
         return {
@@ -19,5 +21,5 @@ class DatabaseContext:
                 "folders": [str(path) for path in self.folders],
             },
             "prop_types": [pt.to_dict() for pt in self.prop_types],
-            **self.view.json(),
+            **self.view.json(self.thumbnail_url),
         }
@@ -1,6 +1,6 @@
 import os
 
-from pysaurus.core import constants
+from pysaurus.core import constants, tracing
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.fs_utils import correct_mtime
 from pysaurus.core.modules import FileSystem
@@ -9,6 +9,7 @@ from pysaurus.video.video_runtime_info import VideoRuntimeInfo
 
 def _scan_folder_for_videos(folder: str, files: dict[AbsolutePath, VideoRuntimeInfo]):
     folder_mount_point = AbsolutePath(folder).get_mount_point()
+    nb_stats = 0
     stack = [folder]
     while stack:
         current_folder = stack.pop()
@@ -21,12 +22,14 @@ def _scan_folder_for_videos(folder: str, files: dict[AbsolutePath, VideoRuntimeI
             ):
                 entry_path = AbsolutePath(entry.path)
                 stat = os.stat(entry_path.path)
+                nb_stats += 1
                 files[entry_path] = VideoRuntimeInfo(
                     size=stat.st_size,
                     mtime=correct_mtime(stat.st_mtime, entry_path.path),
                     driver_id=folder_mount_point,
                     is_file=True,
                 )
+    tracing.count("files stat'ed", nb_stats)
 
 
 def scan_path_for_videos(
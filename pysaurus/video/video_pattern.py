@@ -234,6 +234,21 @@ class VideoPattern(ABC):
         thumbnail = self.thumbnail_base64
         return f"data:image/jpeg;base64,{thumbnail}" if thumbnail else None
 
+    def _thumbnail_json(self, thumbnail_url: str | None) -> dict:
+        if thumbnail_url is None:
+            return {
+                "thumbnail_path": self.thumbnail_path,
+                "thumbnail_base64": self.thumbnail_base64,
+            }
+        return {
+            "thumbnail_path": (
+                thumbnail_url.format(video_id=self.video_id)
+                if self.with_thumbnails
+                else None
+            ),
+            "thumbnail_base64": None,
+        }
+
     @property
     def readable(self) -> bool:
         return not self.unreadable
@@ -346,7 +361,11 @@ class VideoPattern(ABC):
     def size_length(self) -> StringedTuple:
         return StringedTuple((self.size, self.length))
 
-    def json(self, with_moves=False) -> dict:
+    def json(self, with_moves=False, thumbnail_url: str | None = None) -> dict:
+        """
+        If thumbnail_url is given (format string with `video_id` field),
+        thumbnail is referenced by URL instead of being inlined in base64.
+        """
         filename = self.filename
         standard_path = filename.standard_path
         file_title = filename.file_title
@@ -397,8 +416,7 @@ class VideoPattern(ABC):
             "size": str(self.size),
             # "size_length": str(self.size_length),
             "subtitle_languages": self.subtitle_languages,
-            "thumbnail_path": self.thumbnail_path,
-            "thumbnail_base64": self.thumbnail_base64,
+            **self._thumbnail_json(thumbnail_url),
             "title": title,
             # "title_numeric": title,
             "video_codec": str(self.video_codec),
@@ -64,7 +64,7 @@ class VideoSearchContext:
     def get_video_sorting(self) -> VideoSorting:
         return VideoSorting(self.sorting)
 
-    def json(self) -> dict:
+    def json(self, thumbnail_url: str | None = None) -> dict:
         grouping = self.grouping
         group_def = (
             grouping.to_dict(
@@ -79,7 +79,7 @@ class VideoSearchContext:
 
         with_moves = self.with_moves
         return {
-            "videos": [video.json(with_moves) for video in self.result],
+            "videos": [video.json(with_moves, thumbnail_url) for video in self.result],
             "pageSize": self.page_size,
             "pageNumber": self.page_number,
             "nbPages": self.nb_pages,
@@ -4,15 +4,18 @@ import traceback
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 
-import av
 from PIL import Image
 
+from pysaurus.core import tracing
 from pysaurus.core.absolute_path import AbsolutePath
 from pysaurus.core.fraction import Fraction
 from pysaurus.video.video_entry import VideoEntry
 
 logger = logging.getLogger(__name__)
 
+# FFmpeg AV_TIME_BASE, same as `av.time_base`.
+AV_TIME_BASE = 1_000_000
+
 ERROR_SAVE_THUMBNAIL = "ERROR_SAVE_THUMBNAIL"
 
 
@@ -56,6 +59,9 @@ class VideoTaskResult:
 
 
 def open_video(filename: str):
+    # PyAV is imported on first use, to keep application startup fast.
+    import av
+
     try:
         return av.open(filename)
     except UnicodeDecodeError:
@@ -72,20 +78,25 @@ class PythonVideoRaptor:
         ret = VideoTaskResult(task=task)
         container = None
         try:
-            container = open_video(filename.path)
+            with tracing.span("open video"):
+                container = open_video(filename.path)
         except Exception as exc:
             ret.error_info = cls._exc_to_err(exc)
         else:
             if task.need_info:
                 try:
-                    ret.info = cls._get_info_from_container(container, filename.path)
+                    with tracing.span("video info"):
+                        ret.info = cls._get_info_from_container(
+                            container, filename.path
+                        )
                 except Exception as exc:
                     ret.error_info = cls._exc_to_err(exc)
             if task.thumb_path and not ret.error_info:
                 try:
-                    ret.thumbnail = cls._thumb_from_container(
-                        container, task.thumb_path
-                    )
+                    with tracing.span("video thumbnail"):
+                        ret.thumbnail = cls._thumb_from_container(
+                            container, task.thumb_path
+                        )
                 except Exception as exc:
                     traceback.print_tb(exc.__traceback__)
                     print(f"{type(exc).__name__}:", exc, file=sys.stderr)
@@ -122,7 +133,7 @@ class PythonVideoRaptor:
         return VideoEntry(
             filename=filename,
             duration=container.duration,
-            duration_time_base=av.time_base,
+            duration_time_base=AV_TIME_BASE,
             file_size=container.size,
             width=video_stream.codec_context.width,
             height=video_stream.codec_context.height,
@@ -4,7 +4,7 @@ import pytest
 
 from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
 from tests.mocks.mock_database import MockDatabase
-from tests.utils import TEST_HOME_DIR, get_saurus_sql_database
+from tests.utils import TEST_HOME_DIR, copy_database_folder, get_saurus_sql_database
 
 EXAMPLE_DB_NAME = "example_db_in_pysaurus"
 EXAMPLE_DB_FOLDER = os.path.join(
@@ -30,9 +30,9 @@ def mem_saurus_database() -> PysaurusCollection:
 
 
 @pytest.fixture
-def example_saurus_database() -> PysaurusCollection:
-    """Saurus SQL database from example_db_in_pysaurus (read-only, on disk)."""
-    return PysaurusCollection(EXAMPLE_DB_FOLDER)
+def example_saurus_database(tmp_path) -> PysaurusCollection:
+    """Saurus SQL database from example_db_in_pysaurus (on disk, temporary copy)."""
+    return PysaurusCollection(copy_database_folder(EXAMPLE_DB_FOLDER, str(tmp_path)))
 
 
 @pytest.fixture
@@ -112,6 +112,44 @@ class TestFtsRowLifecycle:
         assert row["properties"] is None
         assert _fts_count(db) == count_before + 1
 
+    def test_videos_add_stages_fts_text(self, db):
+        """videos_add must insert FTS text computed in Python, then clear staging."""
+        from pysaurus.core.absolute_path import AbsolutePath
+        from pysaurus.video.video_entry import VideoEntry
+        from pysaurus.video.video_runtime_info import VideoRuntimeInfo
+
+        filenames = [AbsolutePath(f"/test/xyzBulkVideo{i}.mp4") for i in range(3)]
+        db.videos_add(
+            [
+                VideoEntry(filename=path.path, meta_title="Bulk Title")
+                for path in filenames
+            ],
+            {path: VideoRuntimeInfo(is_file=True) for path in filenames},
+        )
+        for path in filenames:
+            video_id = db.db.query_one(
+                "SELECT video_id FROM video WHERE filename = ?", [path.path]
+            )[0]
+            row = _fts_row(db, video_id)
+            assert row["filename"] == pysaurus_text_to_fts(path.path)
+            assert row["meta_title"] == pysaurus_text_to_fts("Bulk Title")
+        assert db.db.query_all("SELECT filename FROM video_text_staging") == []
+        assert _fts_count(db) == _video_count(db)
+
+    def test_video_insert_uses_staged_fts_text(self, db):
+        """Insert trigger must use staged FTS text instead of computing it."""
+        db.db.modify(
+            "INSERT INTO video_text_staging (filename, filename_fts, meta_title_fts) "
+            "VALUES (?, ?, ?)",
+            ["/test/staged.mp4", "xyzstagedfilename", "xyzstagedtitle"],
+        )
+        db.db.modify(
+            "INSERT INTO video (filename, meta_title) VALUES (?, ?)",
+            ["/test/staged.mp4", "Staged"],
+        )
+        assert _fts_match(db, "xyzstagedfilename") == _fts_match(db, "xyzstagedtitle")
+        assert len(_fts_match(db, "xyzstagedfilename")) == 1
+
     def test_video_delete_removes_fts_row(self, db):
         """DELETE FROM video must remove the video_text row via trigger."""
         video_id = db.db.query_one("SELECT video_id FROM video LIMIT 1")[0]
@@ -220,7 +258,7 @@ class TestFtsColumnUpdates:
 
 
 # =============================================================================
-# 3. Properties column update (_update_fts_properties)
+# 3. Properties column update (_flush_fts_properties)
 # =============================================================================
 
 
@@ -315,6 +353,41 @@ class TestFtsPropertiesUpdate:
         db.videos_tag_set("category", {196: []})
         assert _fts_count(db) == count_before
 
+    def test_only_dirty_videos_are_updated(self, db):
+        """Property changes must recompute FTS rows of changed videos only."""
+        other_id = db.db.query_one(
+            "SELECT video_id FROM video WHERE video_id != 196 LIMIT 1"
+        )[0]
+        db.db.modify(
+            "UPDATE video_text SET properties = 'xyzuntouched' WHERE rowid = ?",
+            [other_id],
+        )
+        db.videos_tag_set("category", {196: ["xyzdirtyonly"]})
+
+        assert _fts_match(db, "xyzdirtyonly*") == [196]
+        assert _fts_row(db, other_id)["properties"] == "xyzuntouched"
+        assert db.db.query_all("SELECT video_id FROM video_text_dirty") == []
+
+    def test_triggers_mark_string_properties_only(self, db):
+        """Only string property changes must mark videos as dirty."""
+        db.prop_type_add("rating", "int", 0, False)
+        db.db.modify(
+            "INSERT INTO video_property_value (video_id, property_id, property_value) "
+            "SELECT 196, property_id, '5' FROM property WHERE name = 'rating'"
+        )
+        assert db.db.query_all("SELECT video_id FROM video_text_dirty") == []
+
+        db.db.modify(
+            "INSERT INTO video_property_value (video_id, property_id, property_value) "
+            "SELECT 196, property_id, 'xyzrawinsert' FROM property "
+            "WHERE name = 'category'"
+        )
+        assert [
+            row[0] for row in db.db.query_all("SELECT video_id FROM video_text_dirty")
+        ] == [196]
+        db._flush_fts_properties()
+        assert 196 in _fts_match(db, "xyzrawinsert*")
+
 
 # =============================================================================
 # 4. prop_type_del and FTS
@@ -626,6 +699,43 @@ class TestFtsExactSearch:
         assert video_id in _search_via_provider(self.db, "AB.C", "exact")
         assert video_id in _search_via_provider(self.db, "Ab.C", "exact")
 
+    def test_exact_substring_inside_word(self):
+        """EXACT matches substrings, even inside words."""
+        assert 196 in _search_via_provider(self.db, "foo xyzb", "exact")
+        assert 114 not in _search_via_provider(self.db, "foo xyzb", "exact")
+
+    def test_exact_short_phrase(self):
+        """EXACT with less than 3 characters must still match (no trigram)."""
+        video_id = 196
+        self.db.db.modify(
+            "UPDATE video SET filename = ? WHERE video_id = ?",
+            ["/test/q%.mp4", video_id],
+        )
+        assert video_id in _search_via_provider(self.db, "Q%", "exact")
+        assert _search_via_provider(self.db, "%q", "exact") == []
+
+    def test_exact_phrase_with_quotes(self):
+        """EXACT must accept double quotes in phrase."""
+        video_id = 196
+        self.db.videos_tag_set("category", {video_id: ['say "xyzhello"']})
+        assert video_id in _search_via_provider(self.db, 'say "xyzhel', "exact")
+
+    def test_exact_follows_property_removal(self):
+        """EXACT must not match removed property values."""
+        self.db.videos_tag_set("category", {196: []})
+        assert 196 not in _search_via_provider(self.db, "xyzfoo xyzbar", "exact")
+
+    def test_exact_does_not_read_property_view(self):
+        """EXACT search must only query video_phrase."""
+        from pysaurus.database.saurus.saurus_provider_utils import search_to_sql
+        from pysaurus.dbview.view_tools import SearchDef
+
+        for text in ("xyzfoo xyzbar", "xy"):
+            query, _ = search_to_sql(SearchDef(text, "exact"))
+            assert "video_phrase" in query
+            assert "video_property_text" not in query
+            assert "JOIN" not in query
+
 
 # =============================================================================
 # 8. FTS integrity after complex workflows
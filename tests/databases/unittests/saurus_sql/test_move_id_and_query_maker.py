@@ -12,6 +12,10 @@ These tests cover:
 
 import pytest
 
+from pysaurus.application.exceptions import (
+    SharedMoveDestination,
+    UniquePropertyMergeConflict,
+)
 from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
 from pysaurus.dbview.view_context import ViewContext
 from tests.conftest import EXAMPLE_DB_FOLDER
@@ -279,3 +283,200 @@ class TestQueryMakerIndirect:
         # Videos should have thumbnail-related fields
         for video in state.result:
             assert hasattr(video, "with_thumbnails")
+
+
+class TestMoveCandidates:
+    """Tests for move_candidates table, maintained by triggers on video."""
+
+    def _expected_candidates(self, db_conn) -> set[str]:
+        return {
+            row[0]
+            for row in db_conn.query_all(
+                "SELECT file_size || ':' || duration || ':' || "
+                "duration_time_base_not_null FROM video "
+                "WHERE unreadable = 0 AND discarded = 0 "
+                "GROUP BY file_size, duration, duration_time_base_not_null "
+                "HAVING SUM(is_file) > 0 AND SUM(is_file) < COUNT(*)"
+            )
+        }
+
+    def _candidates(self, db_conn) -> set[str]:
+        return {row[0] for row in db_conn.query_all("SELECT * FROM move_candidates")}
+
+    def test_candidates_follow_video_changes(self, saurus_database):
+        db_conn = saurus_database.db
+        assert self._candidates(db_conn) == self._expected_candidates(db_conn) == set()
+        vid1, vid2, vid3 = db_conn.query_all(
+            "SELECT video_id, file_size, duration, duration_time_base "
+            "FROM video WHERE unreadable = 0 AND discarded = 0 AND is_file = 1 "
+            "LIMIT 3"
+        )
+        for vid in (vid2, vid3):
+            db_conn.modify(
+                "UPDATE video SET file_size = ?, duration = ?, duration_time_base = ? "
+                "WHERE video_id = ?",
+                [vid1[1], vid1[2], vid1[3], vid[0]],
+            )
+        # Same signature, but all found.
+        assert self._candidates(db_conn) == set()
+        db_conn.modify("UPDATE video SET is_file = 0 WHERE video_id = ?", [vid2[0]])
+        expected = self._expected_candidates(db_conn)
+        assert len(expected) == 1
+        assert self._candidates(db_conn) == expected
+        # Still a candidate with vid1 only as found video.
+        db_conn.modify("UPDATE video SET discarded = 1 WHERE video_id = ?", [vid3[0]])
+        assert self._candidates(db_conn) == expected
+        db_conn.modify("DELETE FROM video WHERE video_id = ?", [vid1[0]])
+        assert self._candidates(db_conn) == self._expected_candidates(db_conn) == set()
+        db_conn.modify("UPDATE video SET discarded = 0 WHERE video_id = ?", [vid3[0]])
+        assert self._candidates(db_conn) == expected
+
+    def test_get_moves_for_given_videos(self, saurus_database):
+        db_conn = saurus_database.db
+        vid1, vid2, vid3, vid4 = db_conn.query_all(
+            "SELECT video_id, file_size, duration, duration_time_base "
+            "FROM video WHERE unreadable = 0 AND discarded = 0 AND is_file = 1 "
+            "LIMIT 4"
+        )
+        for source, target in ((vid1, vid2), (vid3, vid4)):
+            db_conn.modify(
+                "UPDATE video SET file_size = ?, duration = ?, "
+                "duration_time_base = ?, is_file = 0 WHERE video_id = ?",
+                [source[1], source[2], source[3], target[0]],
+            )
+        all_moves = dict(saurus_database.videos_get_moves())
+        assert set(all_moves) == {vid2[0], vid4[0]}
+        assert [move["video_id"] for move in all_moves[vid2[0]]] == [vid1[0]]
+
+        from pysaurus.database.saurus.video_mega_utils import _get_video_moves
+
+        assert dict(_get_video_moves(db_conn, [vid1[0]])) == {
+            vid2[0]: all_moves[vid2[0]]
+        }
+        assert dict(_get_video_moves(db_conn, [vid4[0], vid2[0]])) == all_moves
+        assert dict(_get_video_moves(db_conn, [])) == {}
+
+
+class TestMoveVideoEntries:
+    """Tests for set-based SaurusDatabaseAlgorithms.move_video_entries()."""
+
+    def test_merge_and_delete_sources(self, saurus_database, monkeypatch):
+        db = saurus_database
+        (src1, dst1, src2, dst2) = [
+            video.video_id for video in db.get_videos(include=["video_id"])[:4]
+        ]
+        db.prop_type_add("note", "str", "", True)
+        db.videos_set_field("found", {src1: False, src2: False, dst1: True, dst2: True})
+        db.videos_tag_set("note", {src1: ["kept source"], dst1: ["own"]})
+        db.videos_tag_set("note", {src2: ["other source"]})
+        db.videos_set_field("similarity_id", {src1: 12, src2: None})
+        db.videos_set_field("date_entry_modified", {src1: 1000.0})
+        db.videos_set_field("date_entry_opened", {src2: 2000.0})
+        # Unset source date is copied as source mtime.
+        (src2_date_modified,) = db.db.query_one(
+            "SELECT date_entry_modified_not_null FROM video WHERE video_id = ?", [src2]
+        )
+
+        notified = []
+        notify = type(db)._notify_fields_modified
+
+        def spy(self, fields, **kwargs):
+            notified.append(list(fields))
+            return notify(self, fields, **kwargs)
+
+        monkeypatch.setattr(type(db), "_notify_fields_modified", spy)
+        db.algos.move_video_entries([(src1, dst1), (src2, dst2)])
+
+        assert notified == [["move_id"]]
+        assert not db.get_videos(include=["video_id"], where={"video_id": [src1, src2]})
+        assert sorted(db.videos_tag_get("note", indices=[dst1])[dst1]) == [
+            "kept source",
+            "own",
+        ]
+        assert db.videos_tag_get("note", indices=[dst2])[dst2] == ["other source"]
+        rows = {
+            row["video_id"]: row
+            for row in db.db.query_all(
+                "SELECT video_id, similarity_id, date_entry_modified, "
+                "date_entry_opened FROM video WHERE video_id IN (?, ?)",
+                [dst1, dst2],
+            )
+        }
+        assert rows[dst1]["similarity_id"] == 12
+        assert rows[dst1]["date_entry_modified"] == 1000.0
+        assert rows[dst2]["similarity_id"] is None
+        assert rows[dst2]["date_entry_opened"] == 2000.0
+        assert rows[dst2]["date_entry_modified"] == src2_date_modified
+        # Full-text properties of destinations were updated.
+        assert db.db.query_all("SELECT * FROM video_text_dirty") == []
+        (properties,) = db.db.query_one(
+            "SELECT properties FROM video_phrase WHERE rowid = ?", [dst1]
+        )
+        assert "kept source" in properties
+
+    def test_refuse_unique_conflicts_in_sql(self, saurus_database):
+        db = saurus_database
+        (src1, dst1, src2, dst2, src3, dst3) = [
+            video.video_id for video in db.get_videos(include=["video_id"])[:6]
+        ]
+        db.prop_type_add("rank", "int", 0, False)
+        db.prop_type_add("tags", "str", "", True)
+        db.videos_set_field("found", {src1: False, src2: False, src3: False})
+        db.videos_set_field("found", {dst1: True, dst2: True, dst3: True})
+        # Conflict: different unique values.
+        db.videos_tag_set("rank", {src1: [1], dst1: [2]})
+        # No conflict: same unique value, or only one side with a value.
+        db.videos_tag_set("rank", {src2: [3], dst2: [3], src3: [4]})
+        # No conflict: multiple property.
+        db.videos_tag_set("tags", {src2: ["a"], dst2: ["b"]})
+        moves = [(src1, dst1), (src2, dst2), (src3, dst3)]
+        with pytest.raises(UniquePropertyMergeConflict) as exc_info:
+            db.algos.move_video_entries(moves)
+        assert exc_info.value.args == ([(src1, dst1, "rank", [2], [1])],)
+        # Refused before any write.
+        assert db.videos_tag_get("rank", indices=[src1, dst3]) == {src1: [1]}
+        assert db.get_videos(include=["video_id"], where={"video_id": [src1]})
+
+    def test_refuse_shared_destination_in_sql(self, saurus_database):
+        db = saurus_database
+        (src1, src2, dst) = [
+            video.video_id for video in db.get_videos(include=["video_id"])[:3]
+        ]
+        db.prop_type_add("rank", "int", 0, False)
+        db.videos_set_field("found", {src1: False, src2: False, dst: True})
+        # No conflict with destination, but sources differ.
+        db.videos_tag_set("rank", {src1: [1], src2: [2]})
+        with pytest.raises(SharedMoveDestination) as exc_info:
+            db.algos.move_video_entries([(src1, dst), (src2, dst)])
+        assert exc_info.value.args == ([dst],)
+        # Refused before any write.
+        assert db.videos_tag_get("rank", indices=[dst]) == {}
+        assert (
+            len(db.get_videos(include=["video_id"], where={"video_id": [src1, src2]}))
+            == 2
+        )
+
+    def test_unique_moves_exclude_shared_destination(
+        self, saurus_database, monkeypatch
+    ):
+        db = saurus_database
+        moves = [(1, [{"video_id": 10}]), (2, [{"video_id": 10}])]
+        moves += [(3, [{"video_id": 11}]), (4, [{"video_id": 12}, {"video_id": 13}])]
+        monkeypatch.setattr(type(db), "videos_get_moves", lambda self: moves)
+        assert db.algos.get_unique_moves() == [(3, 11)]
+
+    def test_refuse_invalid_moves_in_sql(self, saurus_database):
+        db = saurus_database
+        (src, dst) = [
+            video.video_id for video in db.get_videos(include=["video_id"])[:2]
+        ]
+        db.videos_set_field("found", {src: False, dst: False})
+        with pytest.raises(AssertionError):
+            db.algos.move_video_entries([(src, dst)])
+        db.videos_set_field("found", {src: True, dst: True})
+        with pytest.raises(AssertionError):
+            db.algos.move_video_entries([(src, dst)])
+        assert (
+            len(db.get_videos(include=["video_id"], where={"video_id": [src, dst]}))
+            == 2
+        )
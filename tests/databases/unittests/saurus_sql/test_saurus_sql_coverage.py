@@ -85,6 +85,30 @@ class TestVideoMegaSearchOptimizations:
         assert hasattr(video_full, "audio_languages")
         assert hasattr(video_full, "properties")
 
+    def test_get_videos_with_column_projection(self, disk_database):
+        """Test include naming columns selects only those columns."""
+        (video,) = disk_database.get_videos(
+            include=["filename", "date_entry_modified"], where={"video_id": [196]}
+        )
+        assert video.video_id == 196
+        assert video.filename
+        # Derived attribute loads columns it depends on (mtime).
+        assert video.date_entry_modified
+        assert set(video.data.keys()) == {
+            "date_entry_modified",
+            "filename",
+            "mtime",
+            "video_id",
+        }
+        with pytest.raises(AttributeError):
+            video.file_size
+        with pytest.raises(AttributeError):
+            video.thumbnail
+
+    def test_get_videos_with_unknown_include(self, disk_database):
+        with pytest.raises(ValueError):
+            disk_database.get_videos(include=["not_a_field"])
+
     def test_get_videos_with_thumbnail_fields(self, disk_database):
         """Test fetching videos with thumbnail-related fields."""
         # Fetch videos requesting thumbnail fields (include=None gets all)
@@ -255,3 +279,593 @@ class TestDatabaseCRUDOperations:
         videos_by_filename = disk_database.get_videos(where={"filename": filename})
         assert len(videos_by_filename) == 1
         assert videos_by_filename[0].video_id == 196
+
+
+class TestThumbnailsOutOfBand:
+    """Tests for thumbnails loaded apart from page queries."""
+
+    def test_query_videos_page_without_blobs(self, disk_database):
+        context = disk_database.query_videos(ViewContext(), 10, 0)
+        video = context.result[0]
+        # Blob is not selected in page rows ...
+        assert "thumbnail" not in video.data.keys()
+        assert "with_thumbnails" in video.data.keys()
+        # ... but page and next page thumbnails are prefetched.
+        assert all(v.video_id in disk_database.thumbnails for v in context.result)
+        assert len(disk_database.thumbnails) == 20
+        (expected,) = disk_database.get_videos(
+            include=["thumbnail"], where={"video_id": video.video_id}
+        )
+        assert video.thumbnail == expected.thumbnail
+
+    def test_json_with_thumbnail_url(self, disk_database):
+        context = disk_database.query_videos(ViewContext(), 10, 0)
+        output = context.json("/thumbnail/{video_id}")
+        for video in output["videos"]:
+            assert video["thumbnail_base64"] is None
+            if video["with_thumbnails"]:
+                assert video["thumbnail_path"] == f"/thumbnail/{video['video_id']}"
+
+
+class TestVideoStatusCounts:
+    """Tests for status counters maintained by triggers."""
+
+    def _assert_counts_match(self, db):
+        from pysaurus.database.db_utils import VideoStatusCounts
+        from pysaurus.database.saurus.video_mega_search import video_mega_count
+
+        counts = db.get_status_counts()
+        for status in VideoStatusCounts.statuses():
+            where = dict(
+                zip(("discarded", "unreadable", "found", "with_thumbnails"), status)
+            )
+            assert counts.count(**where) == video_mega_count(db.db, where=where)
+
+    def test_counts_match_videos(self, disk_database):
+        self._assert_counts_match(disk_database)
+        assert disk_database.count_videos() == 99
+        assert disk_database.ops.count_videos("readable", "not_found") == 3
+        assert disk_database.ops.count_videos("found", "not_found") == 0
+
+    def test_counts_follow_modifications(self, memory_database):
+        db = memory_database
+        (with_thumb, other) = [
+            row[0]
+            for row in db.db.query_all(
+                "SELECT video_id FROM video_thumbnail ORDER BY video_id LIMIT 2"
+            )
+        ]
+        db.db.modify("DELETE FROM video WHERE video_id = ?", [with_thumb])
+        self._assert_counts_match(db)
+        db.db.modify("UPDATE video SET is_file = 0 WHERE video_id = ?", [other])
+        self._assert_counts_match(db)
+        db.db.modify(
+            "INSERT OR REPLACE INTO video_thumbnail (video_id, thumbnail) "
+            "VALUES (?, ?)",
+            [other, b""],
+        )
+        self._assert_counts_match(db)
+        db.db.modify("DELETE FROM video_thumbnail WHERE video_id = ?", [other])
+        self._assert_counts_match(db)
+
+    def test_database_saved_is_lazy_and_picklable(self, memory_database):
+        import pickle
+
+        from pysaurus.database.db_utils import DatabaseSaved
+
+        notification = DatabaseSaved(memory_database)
+        memory_database.video_entry_del(196)
+        # Counts are read when notification is first read.
+        assert notification.entries == 98
+        copy = pickle.loads(pickle.dumps(DatabaseSaved(memory_database)))
+        assert copy == notification
+        assert copy.readable_not_found == notification.readable_not_found == 2
+
+
+class TestPropTypeRegistry:
+    """Tests for the property schema cached per connection."""
+
+    def test_registry_matches_schema(self, memory_database):
+        registry = memory_database.db.prop_types
+        prop_types = memory_database.get_prop_types()
+        assert len(registry) == len(prop_types)
+        for pt in prop_types:
+            assert pt.name in registry
+            assert registry.get(pt.name) is pt
+            assert registry.get_by_id(pt.property_id) is pt
+        assert registry.get("unknown") is None
+        assert memory_database.get_prop_types(name="unknown") == []
+
+    def test_schema_is_loaded_once(self, memory_database, monkeypatch):
+        db = memory_database
+        (pt, *_) = db.get_prop_types()
+        queries = []
+        monkeypatch.setattr(
+            type(db.db), "query_all", lambda *args, **kwargs: queries.append(args)
+        )
+        for _ in range(10):
+            db.get_prop_types()
+            assert db.get_prop_types(name=pt.name) == [pt]
+        assert queries == []
+
+    def test_mutators_invalidate_registry(self, memory_database):
+        db = memory_database
+        db.prop_type_add("new_prop", "int", [3, 1, 2], True)
+        (pt,) = db.get_prop_types(name="new_prop")
+        assert pt.multiple
+        assert pt.enumeration == [3, 1, 2]
+        assert db.get_prop_types(name="new_prop", default=3) == [pt]
+        assert db.get_prop_types(name="new_prop", with_enum=[1, 2, 3]) == [pt]
+        assert db.db.prop_types.get_by_id(pt.property_id) is pt
+
+        db.prop_type_set_multiple("new_prop", False)
+        (pt,) = db.get_prop_types(name="new_prop")
+        assert not pt.multiple
+        assert pt.default == [3]
+
+        db.prop_type_set_name("new_prop", "renamed_prop")
+        assert db.get_prop_types(name="new_prop") == []
+        (renamed,) = db.get_prop_types(name="renamed_prop")
+        assert renamed.property_id == pt.property_id
+
+        db.prop_type_del("renamed_prop")
+        assert "renamed_prop" not in db.db.prop_types
+        assert db.db.prop_types.get_by_id(pt.property_id) is None
+
+
+class TestHasThumbnailFlag:
+    """Tests for video.has_thumbnail, maintained by triggers on video_thumbnail."""
+
+    def _assert_flag_matches(self, db):
+        assert (
+            db.db.query_all(
+                "SELECT v.video_id FROM video AS v "
+                "LEFT JOIN video_thumbnail AS vt ON v.video_id = vt.video_id "
+                "WHERE v.has_thumbnail != IIF(LENGTH(vt.thumbnail), 1, 0)"
+            )
+            == []
+        )
+
+    def test_flag_follows_thumbnail_changes(self, memory_database):
+        db = memory_database
+        self._assert_flag_matches(db)
+        (video_id,) = db.db.query_one(
+            "SELECT video_id FROM video WHERE has_thumbnail = 1 LIMIT 1"
+        )
+        db.db.modify("DELETE FROM video_thumbnail WHERE video_id = ?", [video_id])
+        self._assert_flag_matches(db)
+        db.db.modify(
+            "INSERT OR REPLACE INTO video_thumbnail (video_id, thumbnail) "
+            "VALUES (?, ?)",
+            [video_id, b"data"],
+        )
+        self._assert_flag_matches(db)
+        db.db.modify(
+            "UPDATE video_thumbnail SET thumbnail = ? WHERE video_id = ?",
+            [b"", video_id],
+        )
+        self._assert_flag_matches(db)
+        assert (
+            db.count_videos(where={"with_thumbnails": True})
+            == db.db.query_one(
+                "SELECT COUNT(*) FROM video_thumbnail WHERE LENGTH(thumbnail)"
+            )[0]
+        )
+
+    def test_source_filter_does_not_join_thumbnails(self, memory_database, monkeypatch):
+        from pysaurus.database.saurus.video_mega_group import video_mega_group
+        from pysaurus.database.saurus.video_mega_search import video_mega_count
+
+        db = memory_database
+        queries = []
+        for name in ("query", "query_all"):
+            method = getattr(type(db.db), name)
+
+            def spy(self, query, *args, _method=method, **kwargs):
+                queries.append(query)
+                return _method(self, query, *args, **kwargs)
+
+            monkeypatch.setattr(type(db.db), name, spy)
+
+        context = video_mega_group(
+            db.db,
+            sources=[["readable", "with_thumbnails"]],
+            include=["video_id", "with_thumbnails"],
+            page_size=10,
+            page_number=0,
+        )
+        assert context.result
+        assert all(video.with_thumbnails for video in context.result)
+        video_mega_count(db.db, where={"without_thumbnails": True})
+        assert queries
+        assert not any("video_thumbnail" in query for query in queries)
+
+
+class TestWorkloadIndexes:
+    """Tests for composite/partial video indexes and query plan report."""
+
+    def test_single_column_indexes_are_dropped(self, tmp_path):
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        path = str(tmp_path / "test.db")
+        db = PysaurusConnection(path)
+        db.modify("CREATE INDEX idx_video_audio_codec ON video(audio_codec)")
+        db.modify("CREATE INDEX idx_vpv_video_id ON video_property_value(video_id)")
+        db.modify("UPDATE collection SET version = 7")
+        db = PysaurusConnection(path)
+        indexes = {
+            row[0]
+            for row in db.query_all(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        }
+        assert "idx_video_audio_codec" not in indexes
+        assert "idx_vpv_video_id" not in indexes
+        assert {"idx_video_view_source", "idx_video_move_signature"} <= indexes
+
+    def test_full_scans(self):
+        from pysaurus.database.saurus.query_plan import full_scans
+
+        details = [
+            "MATERIALIZE mc",
+            "  SCAN video",
+            "SCAN v USING INDEX idx_video_view_mtime",
+            "SCAN mc",
+            "SCAN video_text VIRTUAL TABLE INDEX 0:M3",
+            "SCAN CONSTANT ROW",
+            "SEARCH v USING INTEGER PRIMARY KEY (rowid=?)",
+        ]
+        assert full_scans(details) == ["SCAN video"]
+
+    def test_explain_default_view(self, memory_database):
+        plans = memory_database.explain_query_videos(ViewContext(), 10, 0)
+        assert plans
+        assert all(plan.details for plan in plans)
+        # Tiny tables may still be scanned, but never whole video table in view.
+        assert not any("SCAN v" in plan.full_scans for plan in plans)
+
+    def test_explain_move_groups_use_move_candidates(self, memory_database):
+        view = ViewContext()
+        view.set_grouping("move_id")
+        plans = memory_database.explain_query_videos(view, 10, 0)
+        (plan,) = [plan for plan in plans if "LEFT JOIN move_candidates" in plan.query]
+        assert any("SEARCH mc USING PRIMARY KEY" in d for d in plan.details)
+        assert not plan.full_scans
+
+
+class TestBatch:
+    """Tests for writes grouped in one transaction with batch()."""
+
+    @staticmethod
+    def _names(path) -> list[str]:
+        # Read from a separate connection: only committed data is visible.
+        import sqlite3
+
+        with sqlite3.connect(path) as connection:
+            return [row[0] for row in connection.execute("SELECT name FROM collection")]
+
+    def test_commit_once_at_exit(self, tmp_path):
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        path = str(tmp_path / "test.db")
+        db = PysaurusConnection(path)
+        with db.batch():
+            db.modify("UPDATE collection SET name = ?", ["first"])
+            # Nested contexts join the batch.
+            with db.batch(), db:
+                db.modify("UPDATE collection SET name = ?", ["second"])
+            assert db.query_one("SELECT name FROM collection")[0] == "second"
+            assert self._names(path) == [""]
+        assert not db.in_batch()
+        assert self._names(path) == ["second"]
+
+    def test_rollback_on_error(self, tmp_path):
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        path = str(tmp_path / "test.db")
+        db = PysaurusConnection(path)
+        with pytest.raises(ValueError):
+            with db.batch():
+                db.modify("UPDATE collection SET name = ?", ["first"])
+                raise ValueError()
+        assert not db.in_batch()
+        assert self._names(path) == [""]
+
+    def test_before_commit(self, tmp_path):
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        db = PysaurusConnection(str(tmp_path / "test.db"))
+        calls = []
+        db.before_commit(lambda: calls.append("now"))
+        assert calls == ["now"]
+
+        def callback():
+            calls.append("deferred")
+
+        with db.batch():
+            db.before_commit(callback)
+            db.before_commit(callback)
+            assert calls == ["now"]
+        assert calls == ["now", "deferred"]
+
+    def test_to_save_runs_in_batch(self, memory_database):
+        with memory_database.to_save():
+            assert memory_database.db.in_batch()
+        assert not memory_database.db.in_batch()
+
+    def test_fts_flushed_at_commit(self, memory_database):
+        memory_database.prop_type_add("tag", "str", "", True)
+        video_id = memory_database.get_videos(include=["video_id"])[0].video_id
+        with memory_database.batch():
+            memory_database.videos_tag_set("tag", {video_id: ["zanzibar"]})
+            assert memory_database.db.query_all("SELECT * FROM video_text_dirty")
+        assert not memory_database.db.query_all("SELECT * FROM video_text_dirty")
+        rows = memory_database.db.query_all(
+            "SELECT rowid FROM video_text WHERE video_text MATCH ?", ["zanzibar"]
+        )
+        assert [row[0] for row in rows] == [video_id]
+
+
+class TestConnectionPool:
+    """Tests for pooled connections to on-disk collection database."""
+
+    def test_pragma_profile(self, tmp_path):
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        db = PysaurusConnection(str(tmp_path / "test.db"))
+        assert db.query_one("PRAGMA journal_mode")[0] == "wal"
+        assert db.query_one("PRAGMA temp_store")[0] == 2
+        with db._pool.writer() as writer:
+            assert writer.query_one("PRAGMA synchronous")[0] == 1
+            assert writer.query_one("PRAGMA foreign_keys")[0] == 1
+        db.close()
+
+    def test_readers_are_read_only(self, tmp_path):
+        import sqlite3
+
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        db = PysaurusConnection(str(tmp_path / "test.db"))
+        with db:
+            with pytest.raises(sqlite3.OperationalError):
+                db.connect().modify("UPDATE collection SET name = 'x'")
+            # Writes still go to writer.
+            db.modify("UPDATE collection SET name = 'x'")
+            assert db.query_one("SELECT name FROM collection")[0] == "x"
+        db.close()
+
+    def test_batch_uses_only_writer(self, tmp_path):
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        db = PysaurusConnection(str(tmp_path / "test.db"))
+        with db.batch():
+            db.modify("UPDATE collection SET name = 'x'")
+            with db:
+                # Nested block keeps writer, so it reads uncommitted data.
+                assert db.query_one("SELECT name FROM collection")[0] == "x"
+        # No reader was lent for the batch.
+        assert not db._pool._readers
+        with db:
+            with db.batch():
+                db.modify("UPDATE collection SET name = 'y'")
+            # Reader bound by the outer block is restored.
+            assert db.connect() is db._pool._readers[0]
+        assert db.query_one("SELECT name FROM collection")[0] == "y"
+        db.close()
+
+    def test_reads_not_blocked_by_batch(self, tmp_path):
+        import threading
+
+        from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
+
+        db = PysaurusConnection(str(tmp_path / "test.db"))
+        written = threading.Event()
+        release = threading.Event()
+
+        def update():
+            with db.batch():
+                db.modify("UPDATE collection SET name = 'updated'")
+                written.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=update)
+        thread.start()
+        try:
+            assert written.wait(5)
+            # Other threads read last committed data, with pysaurus_* functions.
+            row = db.query_one(
+                "SELECT name, pysaurus_get_extension('a.MP4') FROM collection"
+            )
+            assert tuple(row) == ("", "mp4")
+        finally:
+            release.set()
+            thread.join()
+        assert db.query_one("SELECT name FROM collection")[0] == "updated"
+        db.close()
+
+
+class TestLargeValueSets:
+    """Tests for value sets passed as one JSON parameter (sql_in)."""
+
+    def test_sql_in_beyond_variable_limit(self, memory_database):
+        from pysaurus.database.saurus.sql_utils import sql_in
+
+        video_ids = [v.video_id for v in memory_database.get_videos(include=())]
+        # Far more values than SQLite default limit on parameters.
+        values = video_ids + list(range(10**6, 10**6 + 40_000))
+        query, parameters = sql_in("video_id", values)
+        assert len(parameters) == 1
+        (count,) = memory_database.db.query_one(
+            f"SELECT COUNT(*) FROM video WHERE {query}", parameters
+        )
+        assert count == len(video_ids)
+        query, parameters = sql_in("video_id", video_ids[3:], negate=True)
+        (count,) = memory_database.db.query_one(
+            f"SELECT COUNT(*) FROM video WHERE {query}", parameters
+        )
+        assert count == 3
+
+    def test_select_all_except(self, memory_database):
+        from pysaurus.core.classes import Selector
+
+        view = ViewContext()
+        output = memory_database.query_videos(view, 10, 0)
+        excluded = {video.video_id for video in output.result[:3]}
+        output = memory_database.query_videos(view, 10, 0, Selector(True, excluded))
+        assert output.selection_count == output.view_count - 3
+        assert not excluded & {video.video_id for video in output.result}
+
+    def test_get_videos_by_many_ids(self, memory_database):
+        video_ids = [v.video_id for v in memory_database.get_videos(include=())]
+        videos = memory_database.get_videos(
+            include=["video_id"], where={"video_id": video_ids + [-1] * 40_000}
+        )
+        assert sorted(video.video_id for video in videos) == sorted(video_ids)
+
+
+class TestResolveView:
+    """Tests for id-only view resolution used by bulk actions."""
+
+    def test_ids_in_view_order(self, disk_database):
+        from pysaurus.core.classes import Selector
+
+        view = ViewContext()
+        view.set_sort(["-file_size"])
+        expected = [v.video_id for v in disk_database.query_videos(view, 0, 0).result]
+        assert disk_database.resolve_view_ids(view) == expected
+        selector = Selector(True, set(expected[:3]))
+        assert disk_database.resolve_view_ids(view, selector) == expected[3:]
+
+    def test_pages_are_slices_of_view(self, disk_database):
+        # Default sorting by date has ties: pages must still follow view order.
+        view = ViewContext()
+        video_ids = disk_database.resolve_view_ids(view)
+        for page_number in range(len(video_ids) // 7 + 1):
+            page = disk_database.query_videos(view, 7, page_number).result
+            assert [video.video_id for video in page] == video_ids[
+                page_number * 7 : (page_number + 1) * 7
+            ]
+
+    def test_columns(self, disk_database):
+        from pysaurus.core.absolute_path import AbsolutePath
+
+        view = ViewContext()
+        view.set_search("unknown_term_in_any_video_xyz", "and")
+        assert disk_database.resolve_view_ids(view) == []
+        view = ViewContext()
+        videos = disk_database.query_videos(view, 0, 0).result
+        rows = list(disk_database.resolve_view_columns(view, ["video_id", "filename"]))
+        assert [(row[0], AbsolutePath(row[1])) for row in rows] == [
+            (video.video_id, video.filename) for video in videos
+        ]
+
+    def test_unknown_column(self, disk_database):
+        with pytest.raises(ValueError):
+            list(disk_database.resolve_view_columns(ViewContext(), ["nope"]))
+
+
+class TestPlaylist:
+    """Tests for playlists streamed from view."""
+
+    def test_entries(self, disk_database):
+        view = ViewContext()
+        videos = disk_database.query_videos(view, 0, 0).result
+        entries = list(disk_database.ops.iter_playlist_entries(view))
+        assert [(path, title) for path, title, _ in entries] == [
+            (video.filename, video.title) for video in videos
+        ]
+        assert [duration for _, _, duration in entries] == pytest.approx(
+            [video.raw_microseconds / 1_000_000 for video in videos]
+        )
+
+    def test_formats(self, disk_database, tmp_path):
+        from pysaurus.core.file_utils import write_playlist
+
+        view = ViewContext()
+        nb_videos = len(disk_database.resolve_view_ids(view))
+        entries = disk_database.ops.iter_playlist_entries(view)
+        write_playlist(entries, tmp_path / "out.xspf")
+        xspf = (tmp_path / "out.xspf").read_text(encoding="utf-8")
+        assert xspf.startswith("<?xml") and xspf.endswith("</playlist>\n")
+        assert xspf.count("<track>") == nb_videos
+        entries = disk_database.ops.iter_playlist_entries(view)
+        write_playlist(entries, tmp_path / "out.m3u8", "m3u8")
+        m3u8 = (tmp_path / "out.m3u8").read_text(encoding="utf-8")
+        lines = m3u8.splitlines()
+        assert lines[0] == "#EXTM3U"
+        assert len(lines) == 1 + 2 * nb_videos
+        assert all(line.startswith("#EXTINF:") for line in lines[1::2])
+
+    def test_server(self, disk_database):
+        from pysaurus.core.absolute_path import AbsolutePath
+        from pysaurus.database.db_video_server import ServerLauncher
+
+        view = ViewContext()
+        view.set_sort(["-file_size"])
+        server = ServerLauncher(lambda: disk_database, lambda: view)
+        try:
+            client = server.application.test_client()
+            response = client.get("/playlist.m3u8")
+            assert response.status_code == 200
+            assert response.is_streamed
+            assert response.mimetype == "audio/x-mpegurl"
+            lines = response.get_data(as_text=True).splitlines()
+            expected = disk_database.resolve_view_columns(view, ["filename"])
+            assert lines[2::2] == [str(AbsolutePath(f)) for (f,) in expected]
+            assert client.get("/playlist.txt").status_code == 404
+        finally:
+            server.stop()
+
+
+class TestSqlStats:
+    """Tests for opt-in SQL statement statistics."""
+
+    def test_statement_template(self):
+        from pysaurus.database.saurus.sql_stats import statement_template
+
+        assert (
+            statement_template("SELECT a\n  FROM t WHERE b IN (?, ?,?) AND c = ?")
+            == "SELECT a FROM t WHERE b IN (?, ...) AND c = ?"
+        )
+
+    def test_disabled_by_default(self, disk_database):
+        assert disk_database.db.sql_stats is None
+        assert disk_database.get_sql_stats_report() is None
+
+    def test_reads(self, disk_database):
+        stats = disk_database.db.enable_sql_stats(slow_ms=float("inf"))
+        try:
+            view = ViewContext()
+            nb_videos = len(disk_database.resolve_view_ids(view))
+            (view_ids,) = [s for s in stats.statements.values() if s.rows == nb_videos]
+            assert view_ids.calls == 1
+            # Page queries read view IDs with same statement template.
+            disk_database.query_videos(view, 10, 0)
+            disk_database.query_videos(view, 10, 1)
+        finally:
+            disk_database.db.disable_sql_stats()
+        assert (view_ids.calls, view_ids.rows) == (3, 3 * nb_videos)
+        assert not stats.slow_queries
+        top = stats.top(key="calls")[0]
+        assert top.calls >= 3
+        assert top.total_ms >= top.max_ms > 0
+
+    def test_writes_and_slow_queries(self, memory_database):
+        db = memory_database.db
+        stats = db.enable_sql_stats(slow_ms=0)
+        (min_id,) = db.query_one("SELECT MIN(video_id) FROM video")
+        with db.batch():
+            db.modify("UPDATE video SET watched = 1 WHERE video_id < ?", [min_id + 4])
+        db.query_all("SELECT video_id FROM video WHERE video_id < ?", [min_id + 4])
+        (update,) = [
+            s for s in stats.statements.values() if s.template.startswith("UPDATE")
+        ]
+        assert update.rows == 4
+        # Every execution is slow, but explaining does not record anything.
+        assert len(stats.slow_queries) == sum(
+            s.calls for s in stats.statements.values()
+        )
+        assert all(slow.plan for slow in stats.slow_queries)
+        report = memory_database.get_sql_stats_report()
+        assert "UPDATE video SET watched = 1" in report
+        assert "SEARCH video USING INTEGER PRIMARY KEY" in report
@@ -151,6 +151,20 @@ class MockAppContext:
         self._view.group = self._last_result.group_id
         return self._last_result
 
+    def get_view_video_ids(self, selector=None) -> list[int]:
+        if not self._database:
+            return []
+        context = self._database.query_videos(self._view, 0, 0, selector)
+        return [video.video_id for video in context.result]
+
+    def get_videos_by_ids(self, video_ids: list[int]) -> list:
+        if not self._database:
+            return []
+        wanted = set(video_ids)
+        return [
+            video for video in self._database.get_videos() if video.video_id in wanted
+        ]
+
     def set_group(self, group_id) -> None:
         if self._database:
             self._view.set_group(group_id)
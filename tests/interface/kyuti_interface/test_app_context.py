@@ -59,6 +59,17 @@ class TestGetVideos:
         ctx._api.database = None
         assert ctx.get_videos(10, 0) is None
 
+    def test_view_video_ids(self, ctx):
+        page = ctx.get_videos(page_size=5, page_number=0)
+        video_ids = ctx.get_view_video_ids()
+        assert len(video_ids) == page.view_count
+        assert video_ids[:5] == [video.video_id for video in page.result]
+        videos = ctx.get_videos_by_ids(video_ids[:5])
+        assert sorted(video.video_id for video in videos) == sorted(video_ids[:5])
+        ctx._api.database = None
+        assert ctx.get_view_video_ids() == []
+        assert ctx.get_videos_by_ids(video_ids[:5]) == []
+
 
 # =========================================================================
 # set_groups / clear_groups / set_search / set_sorting
@@ -296,6 +307,20 @@ class TestApiDelegation:
         monkeypatch.setattr(type(ctx._api), "playlist", lambda self: "test.m3u")
         assert ctx.playlist() == "test.m3u"
 
+    def test_sql_stats(self, ctx, monkeypatch):
+        from pysaurus.application.exceptions import PysaurusError
+        from pysaurus.core.absolute_path import AbsolutePath
+
+        monkeypatch.setattr(AbsolutePath, "open", lambda self: self)
+        assert ctx.set_sql_stats(True)
+        ctx.get_videos(10, 0)
+        filename = ctx.dump_sql_stats()
+        with open(filename, encoding="utf-8") as file:
+            assert "SELECT" in file.read()
+        assert ctx.set_sql_stats(False)
+        with pytest.raises(PysaurusError):
+            ctx.dump_sql_stats()
+
 
 # =========================================================================
 # Notification processing
@@ -129,6 +129,13 @@ class QMockAppContext(QObject):
     def playlist(self) -> str:
         return ""
 
+    def set_sql_stats(self, enabled: bool) -> bool:
+        self._sql_stats = enabled
+        return True
+
+    def dump_sql_stats(self) -> str:
+        return "/tmp/sql_stats.txt"
+
     # Simulate opening a database for tests
     def _simulate_open(self, name="test_db"):
         self._has_database = True
@@ -260,6 +267,57 @@ class TestMenuState:
         assert main_window._radio_properties.isChecked()
 
 
+# =============================================================================
+# SQL statistics
+# =============================================================================
+
+
+class TestSqlStats:
+    """Tests for SQL statistics actions in database menu."""
+
+    def test_sql_stats_actions_disabled_without_database(self, main_window):
+        main_window._update_menu_state()
+        assert not main_window._action_sql_stats.isEnabled()
+        assert not main_window._action_dump_sql_stats.isEnabled()
+
+    def test_toggle_sql_stats(self, main_window):
+        main_window.ctx._simulate_open()
+        main_window.show_videos_page()
+        assert not main_window._action_dump_sql_stats.isEnabled()
+        main_window._action_sql_stats.trigger()
+        assert main_window.ctx._sql_stats is True
+        assert main_window._action_dump_sql_stats.isEnabled()
+        assert "SQL statistics enabled" in main_window.status_bar.currentMessage()
+        main_window._action_sql_stats.trigger()
+        assert main_window.ctx._sql_stats is False
+        assert not main_window._action_dump_sql_stats.isEnabled()
+
+    def test_toggle_sql_stats_not_supported(self, main_window, monkeypatch):
+        main_window.ctx._simulate_open()
+        main_window._update_menu_state()
+        monkeypatch.setattr(main_window.ctx, "set_sql_stats", lambda enabled: False)
+        shown = []
+        monkeypatch.setattr(QMessageBox, "information", lambda *a: shown.append(a))
+        main_window._action_sql_stats.trigger()
+        assert shown
+        assert not main_window._action_sql_stats.isChecked()
+
+    def test_dump_sql_stats(self, main_window):
+        main_window.ctx._simulate_open()
+        main_window._update_menu_state()
+        main_window._action_sql_stats.trigger()
+        main_window._action_dump_sql_stats.trigger()
+        assert "/tmp/sql_stats.txt" in main_window.status_bar.currentMessage()
+
+    def test_sql_stats_unchecked_when_database_closed(self, main_window):
+        main_window.ctx._simulate_open()
+        main_window._update_menu_state()
+        main_window._action_sql_stats.trigger()
+        main_window.ctx.close_database()
+        main_window._update_menu_state()
+        assert not main_window._action_sql_stats.isChecked()
+
+
 # =============================================================================
 # Session logging
 # =============================================================================
@@ -294,3 +294,93 @@ class TestVideoListItemHover:
         style = item.styleSheet()
         # Not-found hover: orange
         assert "#ffecb3" in style
+
+
+class _VideoWithThumbnail(MockVideoPattern):
+    def __init__(self, data: dict, thumbnail: bytes):
+        super().__init__(data)
+        self._thumbnail = thumbnail
+
+    @property
+    def thumbnail(self) -> bytes:
+        return self._thumbnail
+
+
+def _make_jpeg(width=320, height=180) -> bytes:
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    from PySide6.QtGui import QColor, QImage
+
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "JPEG")
+    return bytes(data.data())
+
+
+class TestVideoListItemThumbnail:
+    """Tests for background thumbnail decoding and pixmap cache."""
+
+    def test_thumbnail_decoded_in_background(
+        self, qtbot, sample_video_data, prop_types
+    ):
+        from pysaurus.interface.kyuti.utils.thumbnail_cache import get_thumbnail_cache
+        from pysaurus.interface.kyuti.widgets.video_list_item import VideoListItem
+
+        cache = get_thumbnail_cache()
+        cache.clear()
+        video = _VideoWithThumbnail(sample_video_data, _make_jpeg())
+
+        with qtbot.waitSignal(cache.pixmap_ready, timeout=5000):
+            item = VideoListItem(video, prop_types)
+            qtbot.addWidget(item)
+            # Placeholder is shown while decoding.
+            assert item.thumb_label.pixmap().isNull()
+        assert not item.thumb_label.pixmap().isNull()
+
+        # Second item reuses cached pixmap synchronously.
+        item2 = VideoListItem(video, prop_types)
+        qtbot.addWidget(item2)
+        assert item2.thumb_label.pixmap().cacheKey() == (
+            item.thumb_label.pixmap().cacheKey()
+        )
+        cache.clear()
+
+    def test_invalid_thumbnail(self, qtbot, sample_video_data, prop_types):
+        from pysaurus.interface.kyuti.utils.thumbnail_cache import get_thumbnail_cache
+        from pysaurus.interface.kyuti.widgets.video_list_item import VideoListItem
+
+        cache = get_thumbnail_cache()
+        cache.clear()
+        video = _VideoWithThumbnail(sample_video_data, b"not an image")
+        with qtbot.waitSignal(cache.pixmap_ready, timeout=5000):
+            item = VideoListItem(video, prop_types)
+            qtbot.addWidget(item)
+        assert item.thumb_label.text() == "No thumbnail"
+
+    def test_pixmap_delivered_by_key(self, qtbot):
+        from pysaurus.interface.kyuti.utils.thumbnail_cache import ThumbnailPixmapCache
+
+        cache = ThumbnailPixmapCache()
+        received = {1: [], 2: []}
+        cache.request(1, _make_jpeg(), 90, 50, received[1].append)
+        cache.request(1, _make_jpeg(), 90, 50, received[1].append)
+        with qtbot.waitSignal(cache.pixmap_ready, timeout=5000):
+            cache.request(2, _make_jpeg(), 90, 50, received[2].append)
+        qtbot.waitUntil(lambda: cache.get(1, 90, 50) is not None, timeout=5000)
+        # Each callback gets its own thumbnail, once.
+        assert len(received[1]) == 2 and len(received[2]) == 1
+        assert cache._callbacks == {}
+
+    def test_cancel_pending_drops_callbacks(self, qtbot):
+        from pysaurus.interface.kyuti.utils.thumbnail_cache import ThumbnailPixmapCache
+
+        cache = ThumbnailPixmapCache()
+        received = []
+        cache.request(1, _make_jpeg(), 90, 50, received.append)
+        cache.cancel_pending()
+        assert cache._callbacks == {}
+        cache._pool.waitForDone()
+        qtbot.wait(10)
+        assert received == []
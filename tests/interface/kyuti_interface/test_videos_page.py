@@ -523,3 +523,78 @@ class TestVideosPageSelectionLabel:
         page._update_selection_display()
 
         assert "1 selected" in page.selection_label.text()
+
+
+class TestVideosPageScrollMode:
+    """Tests for continuous (virtualized) list."""
+
+    def test_scroll_mode_uses_model(self, qtbot, mock_context):
+        page = VideosPage(mock_context)
+        qtbot.addWidget(page)
+        page.refresh()
+        nb_videos = len(page._videos)
+
+        page.set_scroll_mode(True)
+
+        assert page._video_list_items == []
+        assert page.list_widget.isHidden()
+        assert not page.list_view.isHidden()
+        assert page.video_model.rowCount() == nb_videos
+        video = page.video_model.video_at(0)
+        assert page._get_video_by_id(video.video_id) is video
+
+        page.set_scroll_mode(False)
+        assert page.video_model.rowCount() == 0
+        assert len(page._video_list_items) == nb_videos
+
+    def test_model_fetches_windows_lazily(self, qtbot, mock_context):
+        from pysaurus.interface.kyuti.widgets.video_list_model import VideoListModel
+
+        calls = []
+
+        def fetch(video_ids):
+            calls.append(video_ids)
+            return mock_context.get_videos_by_ids(video_ids)
+
+        video_ids = mock_context.get_view_video_ids()
+        model = VideoListModel(fetch, window_size=1, max_windows=2)
+        model.reset(video_ids, mock_context.get_videos(1, 0).result)
+        first = model.video_at(0)
+        nb_rows = model.rowCount()
+        assert nb_rows == len(video_ids) > 2
+        assert first.video_id == video_ids[0]
+        assert calls == []
+
+        last = model.video_at(nb_rows - 1)
+        assert last.video_id == video_ids[-1]
+        assert calls == [video_ids[-1:]]
+        model.video_at(1)
+        # Only max_windows windows are kept.
+        assert len(model.loaded_videos()) == 2
+        assert model.row_of(first.video_id) is None
+        assert model.row_of(last.video_id) == nb_rows - 1
+
+    def test_model_does_not_fetch_while_painting(self, qtbot, mock_context):
+        from pysaurus.interface.kyuti.widgets.video_list_model import (
+            VideoListModel,
+            VideoRole,
+        )
+
+        calls = []
+
+        def fetch(video_ids):
+            calls.append(video_ids)
+            return mock_context.get_videos_by_ids(video_ids)
+
+        video_ids = mock_context.get_view_video_ids()
+        model = VideoListModel(fetch, window_size=2)
+        model.reset(video_ids)
+        index = model.index(2)
+        # Unloaded row: placeholder, window is fetched later.
+        assert index.data(VideoRole) is None
+        assert index.data(VideoRole) is None
+        assert calls == []
+        with qtbot.waitSignal(model.dataChanged):
+            pass
+        assert calls == [video_ids[2:4]]
+        assert index.data(VideoRole).video_id == video_ids[2]
@@ -97,6 +97,33 @@ class TestMenuActions:
         app._do_edit_folders(changed)  # changed -> applied
         assert applied == [changed.get_folders()]
 
+    def test_sql_stats(self, videroid_app, monkeypatch):
+        from pysaurus.core.absolute_path import AbsolutePath
+
+        monkeypatch.setattr(AbsolutePath, "open", lambda self: self)
+        app, _ = videroid_app
+        labels = [label for label, _ in app._menu_database()]
+        assert "☐ Record SQL Statistics" in labels
+        assert "Show SQL Statistics…" not in labels
+        app._toggle_sql_stats()
+        assert app.context.sql_stats_enabled()
+        assert "enabled" in app._status.text
+        labels = [label for label, _ in app._menu_database()]
+        assert "☑ Record SQL Statistics" in labels
+        app.context.get_videos(10, 0)
+        app._dump_sql_stats()
+        filename = app._status.text.split(": ", 1)[1]
+        with open(filename, encoding="utf-8") as file:
+            assert "SELECT" in file.read()
+        app._toggle_sql_stats()
+        assert not app.context.sql_stats_enabled()
+
+    def test_sql_stats_reset_on_close(self, videroid_app):
+        app, _ = videroid_app
+        app._toggle_sql_stats()
+        app._do_close_db()
+        assert not app.context.sql_stats_enabled()
+
     def test_close_db(self, videroid_app):
         app, _ = videroid_app
         assert app.context.has_database()
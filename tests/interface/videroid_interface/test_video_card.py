@@ -12,8 +12,17 @@ and a subclass is needed for an invalid (non-empty) thumbnail.
 from unittest.mock import Mock
 
 import videre
-
-from pysaurus.interface.videroid.widgets.video_card import VideoCard
+from videre.testing.step_window import StepWindow
+
+from pysaurus.interface.videroid.widgets.video_card import (
+    LazyCardList,
+    VideoCard,
+    VideoCardCache,
+)
+from pysaurus.interface.videroid.widgets.virtual_scroll import (
+    SCROLLBAR_INTERNALS,
+    VIDERE_INTERNALS,
+)
 from tests.interface.videroid_interface._widget_tree import find as _find
 from tests.interface.videroid_interface._widget_tree import texts as _texts
 from tests.mocks.mock_database import MockVideoPattern
@@ -117,3 +126,107 @@ class TestVideoCardStates:
     def test_watched_status(self):
         texts = _texts(VideoCard(_video(found=True, watched=True), 0))
         assert "Watched" in texts
+
+
+class TestVideoCardCache:
+    def test_same_video_reuses_card(self):
+        cache = VideoCardCache()
+        card = cache.get(_video(found=True), 0)
+        assert cache.get(_video(found=True), 5) is card
+        assert len(cache) == 1
+
+    def test_displayed_change_builds_new_card(self):
+        cache = VideoCardCache()
+        card = cache.get(_video(found=True), 0)
+        assert cache.get(_video(found=True, watched=True), 0) is not card
+        assert cache.get(_video(found=True), 0, Mock(), selected=True) is not card
+
+    def test_probed_change_builds_new_card(self):
+        # Re-probing a modified file changes its specs, not its id nor its name.
+        cache = VideoCardCache()
+        card = cache.get(_video(found=True), 0)
+        assert cache.get(_video(found=True, size="2 MB"), 0) is not card
+        assert cache.get(_video(found=True, width=1280), 0) is not card
+        assert cache.get(_video(found=True, video_codec="hevc"), 0) is not card
+
+    def test_reused_card_resyncs_checkbox(self):
+        cache = VideoCardCache()
+        page = Mock()
+        card = cache.get(_video(found=True), 0, page)
+        card.checkbox.checked = True  # toggled by user, then page reloaded
+        assert cache.get(_video(found=True), 0, page).checkbox.checked is False
+
+    def test_lru_bound(self):
+        cache = VideoCardCache(max_size=2)
+        first = cache.get(_video(video_id=1), 0)
+        cache.get(_video(video_id=2), 1)
+        cache.get(_video(video_id=3), 2)
+        assert len(cache) == 2
+        assert cache.get(_video(video_id=1), 0) is not first
+
+
+class TestLazyCardList:
+    def _render(self, nb_videos: int):
+        built = []
+
+        def build(index):
+            built.append(index)
+            return VideoCard(_video(found=True, video_id=index), index)
+
+        window = StepWindow(width=800, height=600)
+        cards = LazyCardList(weight=1)
+        window.controls = [cards]
+        cards.set_items(nb_videos, build)
+        return window, cards, built
+
+    def test_builds_only_visible_cards(self):
+        window, cards, built = self._render(200)
+        with window:
+            window.render()
+            assert 0 < len(built) < 20
+            assert built == sorted(built) and built[0] == 0
+            assert cards.controls == cards.cards
+            assert cards.count == 200
+
+    def test_scrolling_builds_cards_in_view(self):
+        window, cards, built = self._render(200)
+        with window:
+            window.render()
+            nb_built = len(built)
+            cards.on_jump_y(10_000)
+            window.render()
+            assert min(built[nb_built:]) > 20
+            assert len(cards.cards) < 20
+
+    def test_empty_widget(self):
+        window, cards, built = self._render(0)
+        cards.set_items(0, empty=videre.Text("empty"))
+        with window:
+            window.render()
+            assert [control.text for control in cards.controls] == ["empty"]
+            assert not built
+
+    def test_mouse_wheel_scrolls_virtually(self):
+        window, cards, built = self._render(200)
+        with window:
+            window.render()
+            nb_built = len(built)
+            cards.handle_mouse_wheel(0, -50, False)
+            window.render()
+            assert cards.scroll_top == 50 * cards.SCROLL_STEP
+            assert min(built[nb_built:]) > 20
+            cards.handle_mouse_wheel(0, 1000, False)
+            window.render()
+            assert cards.scroll_top == 0
+
+
+class TestVirtualScrollView:
+    def test_videre_internals_exist(self):
+        # VirtualScrollView relies on these ScrollView internals: if a videre
+        # upgrade removes them, update the adapter.
+        view = videre.ScrollView(videre.Text("content"))
+        for name in VIDERE_INTERNALS:
+            assert hasattr(view, name), name
+        for name in SCROLLBAR_INTERNALS:
+            assert hasattr(view._vscrollbar, name), name
+        assert hasattr(view._vscrollbar.background, "pos")
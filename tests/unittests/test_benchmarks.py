@@ -0,0 +1,142 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pysaurus.application.application import Application
+from pysaurus.benchmarks.first_render import growth, run_first_render
+from pysaurus.benchmarks.media_corpus import generate_corpus, write_video
+from pysaurus.benchmarks.probe import PROBE_FUNCTION, run_probes
+from pysaurus.benchmarks.scenarios import SCENARIOS, quiet_notifier, run_scenarios
+from pysaurus.benchmarks.synthetic_collection import (
+    VIDEO_FOLDER,
+    generate_collection,
+    open_collection,
+)
+from pysaurus.database.algorithms.videos import Videos
+from pysaurus.database.features.db_similar_videos import DbSimilarVideos
+
+SIZE = 200
+
+
+@pytest.fixture(scope="module")
+def synthetic_database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("benchmarks") / "synthetic"
+    db = generate_collection(path, SIZE, seed=1, notifier=quiet_notifier())
+    yield db
+    # Close pooled connections, so that their file descriptors
+    # are not inherited by process pools forked in later tests.
+    db.db.close()
+
+
+def test_synthetic_collection(synthetic_database, tmp_path):
+    db = synthetic_database
+    videos = db.get_videos(include=["filename", "found", "readable"])
+    assert len(videos) == SIZE
+    assert any(not video.found for video in videos)
+    assert any(not video.readable for video in videos)
+    assert list(db.videos_get_moves())
+    assert db.count_videos(where={"readable": True, "with_thumbnails": True}) == sum(
+        video.readable for video in videos
+    )
+    assert {pt.name for pt in db.get_prop_types()} == {
+        "category",
+        "actor",
+        "rating",
+        "watched",
+    }
+    # Same seed gives same videos.
+    other = generate_collection(tmp_path / "other", SIZE, 1, quiet_notifier())
+    try:
+        assert sorted(
+            video.filename.get_basename()
+            for video in other.get_videos(include=["filename"])
+        ) == sorted(video.filename.get_basename() for video in videos)
+    finally:
+        other.db.close()
+
+
+def test_synthetic_collection_is_up_to_date(synthetic_database):
+    db = synthetic_database
+    (folder,) = db.get_folders()
+    assert folder.get_basename() == VIDEO_FOLDER
+    files = Videos.get_runtime_info_from_paths(db.get_folders())
+    assert len(files) == db.count_videos(where={"found": True})
+    assert db.algos._find_video_paths_for_update(files) == []
+
+
+def test_synthetic_similarities(synthetic_database):
+    db = synthetic_database
+    DbSimilarVideos.find_similar_videos(db)
+    similarities = [
+        video.similarity_id
+        for video in db.get_videos(include=["similarity_id"])
+        if video.similarity_id not in (None, -1)
+    ]
+    assert similarities
+    assert len(similarities) > len(set(similarities))
+
+
+def test_open_collection_checks_parameters(synthetic_database):
+    path = synthetic_database.get_database_folder()
+    db = open_collection(path, SIZE, 1, quiet_notifier())
+    try:
+        assert db.count_videos() == SIZE
+    finally:
+        db.db.close()
+    with pytest.raises(FileExistsError):
+        open_collection(path, SIZE, 2)
+
+
+def test_run_scenarios_records_history(synthetic_database, tmp_path):
+    names = [name for name in SCENARIOS if name not in ("similarity", "miniatures")]
+    history = tmp_path / "history"
+    results = run_scenarios(synthetic_database, names, 1, str(history))
+    assert [result.name for result in results] == names
+    assert all(result.reference is None for result in results)
+    (result,) = run_scenarios(synthetic_database, ["group"], 2, str(history))
+    assert result.reference == results[names.index("group")].median
+    assert len(result.microseconds) == 2
+    with open(history / f"group-{SIZE}.json") as file:
+        assert len(json.load(file)) == 2
+    with pytest.raises(ValueError):
+        run_scenarios(synthetic_database, ["unknown"])
+
+
+def test_probe_media_corpus(tmp_path):
+    corpus_folder = tmp_path / "corpus"
+    corpus = generate_corpus(corpus_folder, 12, seed=3)
+    write_video(str(corpus_folder / "no_video.mkv"), None, "flac")
+    results = run_probes(corpus_folder, [1, 2], [1, 4], tmp_path)
+    assert [(result.pool_size, result.chunk_size) for result in results] == [
+        (1, 1),
+        (1, 4),
+        (2, 1),
+        (2, 4),
+    ]
+    for result in results:
+        assert result.nb_files == len(corpus) + 1
+        assert result.nb_unreadable >= 1
+        assert result.worker_steps[PROBE_FUNCTION] > 0
+        assert 0 < result.utilization <= 1
+
+
+def test_first_render_does_not_grow_with_page_size(synthetic_database, tmp_path):
+    class TestApplication(Application):
+        # App scans a test home folder instead of user's one.
+        def __init__(self, notifier):
+            super().__init__(notifier, home_dir=tmp_path)
+
+    with patch("pysaurus.interface.api.feature_api.Application", TestApplication):
+        results = run_first_render(
+            synthetic_database, [10, SIZE], repeat=2, width=800, height=600
+        )
+    assert [(result.page_size, result.nb_cards) for result in results] == [
+        (10, 10),
+        (SIZE, SIZE),
+    ]
+    small, large = results
+    # Only cards in the viewport are built.
+    assert 0 < large.nb_built < SIZE // 4
+    assert len(large.cold) == len(large.warm) == 2
+    assert growth(results) == large.cold_median / small.cold_median
@@ -0,0 +1,59 @@
+from pysaurus.database.db_thumbnails import ThumbnailService
+
+
+class _FakeDatabase:
+    def __init__(self, thumbnails: dict[int, bytes]):
+        self.thumbnails = thumbnails
+        self.calls: list[list[int]] = []
+
+    def get_thumbnails(self, video_ids):
+        self.calls.append(list(video_ids))
+        return {
+            video_id: self.thumbnails[video_id]
+            for video_id in video_ids
+            if video_id in self.thumbnails
+        }
+
+
+def test_prefetch_uses_one_query():
+    database = _FakeDatabase({1: b"one", 2: b"two"})
+    service = ThumbnailService(database)
+    service.prefetch([1, 2, 3, 1])
+    assert database.calls == [[1, 2, 3]]
+    assert service.get(1) == b"one"
+    assert service.get(2) == b"two"
+    # Missing thumbnails are cached too.
+    assert service.get(3) is None
+    assert database.calls == [[1, 2, 3]]
+
+
+def test_etag():
+    database = _FakeDatabase({1: b"one", 2: b"two"})
+    service = ThumbnailService(database)
+    assert service.etag(1)
+    assert service.etag(1) != service.etag(2)
+    assert service.etag(3) is None
+
+
+def test_lru_eviction():
+    database = _FakeDatabase({i: bytes(100) for i in range(10)})
+    service = ThumbnailService(database, max_bytes=3 * (100 + 64))
+    service.prefetch([0, 1, 2])
+    assert len(service) == 3
+    service.get(0)
+    service.prefetch([3])
+    assert 0 in service
+    assert 1 not in service
+    assert len(service) == 3
+
+
+def test_invalidate():
+    database = _FakeDatabase({1: b"one"})
+    service = ThumbnailService(database)
+    assert service.get(1) == b"one"
+    database.thumbnails[1] = b"new"
+    assert service.get(1) == b"one"
+    service.invalidate([1])
+    assert service.get(1) == b"new"
+    service.invalidate()
+    assert len(service) == 0
@@ -0,0 +1,84 @@
+import pickle
+import queue
+
+from pysaurus.core.informer import Information
+from pysaurus.core.job_notifications import JobStep, JobToDo
+from pysaurus.core.notification_bus import (
+    NotificationLog,
+    PipeNotifier,
+    ProgressCoalescer,
+    WorkerPipe,
+)
+from pysaurus.core.notifications import Done
+from pysaurus.core.parallelization import parallelize
+
+
+def _square(x):
+    return x * x
+
+
+def _steps(notifications):
+    return [(n.channel, n.step) for n in notifications if isinstance(n, JobStep)]
+
+
+class TestProgressCoalescer:
+    def test_last_value_wins_within_interval(self):
+        coalescer = ProgressCoalescer(interval=0.05)
+        out = coalescer.push(JobToDo("job", 10), 0.0)
+        out += coalescer.push(JobStep("job", None, 0, 10), 0.0)
+        for step in range(1, 6):
+            out += coalescer.push(JobStep("job", None, step, 10), 0.001 * step)
+        assert _steps(out) == [(None, 0)]
+        assert coalescer.timeout(0.01) == 0.04
+        assert coalescer.due(0.02) == []
+        assert _steps(coalescer.due(0.05)) == [(None, 5)]
+        assert coalescer.timeout(0.05) is None
+
+    def test_job_end_is_released_immediately(self):
+        coalescer = ProgressCoalescer(interval=10)
+        out = coalescer.push(JobToDo("job", 2), 0.0)
+        out += coalescer.push(JobStep("job", None, 0, 2), 0.0)
+        out += coalescer.push(JobStep("job", "a", 1, 1), 0.1)
+        assert _steps(out) == [(None, 0)]
+        out = coalescer.push(JobStep("job", "b", 1, 1), 0.2)
+        assert _steps(out) == [("a", 1), ("b", 1)]
+
+    def test_other_notification_releases_pending_steps_first(self):
+        coalescer = ProgressCoalescer(interval=10)
+        coalescer.push(JobStep("job", None, 1, 10), 0.0)
+        coalescer.push(JobStep("job", None, 2, 10), 0.1)
+        done = Done()
+        out = coalescer.push(done, 0.2)
+        assert _steps(out) == [(None, 2)]
+        assert out[-1] is done
+
+
+def test_notification_log_keeps_file_open(tmp_path):
+    log = NotificationLog()
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    log.write(str(first), "a")
+    log.write(str(first), "b")
+    log.flush()
+    assert [line[-1] for line in first.read_text().splitlines()] == ["a", "b"]
+    log.write(str(second), "c")
+    log.close()
+    assert len(second.read_text().splitlines()) == 1
+
+
+def test_pickled_notifier_uses_pipe():
+    notifier = pickle.loads(pickle.dumps(Information.notifier()))
+    assert isinstance(notifier, PipeNotifier)
+
+
+def test_pool_workers_notify_through_pipe():
+    output = queue.SimpleQueue()
+    pipe = WorkerPipe(output)
+    results = list(parallelize(_square, [1, 2, 3], notifier=pipe.notifier()))
+    assert results == [1, 4, 9]
+    # Job start (JobToDo and first step) is notified from main process,
+    # then a step per task from workers.
+    received = [output.get(timeout=5) for _ in range(5)]
+    assert isinstance(received[0], JobToDo)
+    assert _steps(received[1:2]) == [(None, 0)]
+    assert sorted(_steps(received[2:])) == [(0, 1), (1, 1), (2, 1)]
@@ -0,0 +1,46 @@
+from pysaurus.core.absolute_path import AbsolutePath
+from pysaurus.core.file_utils import (
+    iter_m3u8_playlist,
+    iter_playlist,
+    iter_xspf_playlist,
+)
+
+ENTRIES = [
+    (AbsolutePath("/videos/a & b.mp4"), "A <&> B", 61.5),
+    (AbsolutePath("/videos/c.mkv"), "multi\nline  title", 2),
+]
+
+
+def test_xspf_playlist():
+    text = "".join(iter_xspf_playlist(ENTRIES))
+    assert "<title>A &lt;&amp;&gt; B</title>" in text
+    assert "<duration>61500</duration>" in text
+    assert "<duration>2000</duration>" in text
+    assert "a%20%26%20b.mp4</location>" in text
+
+
+def test_m3u8_playlist():
+    lines = "".join(iter_m3u8_playlist(ENTRIES)).splitlines()
+    assert lines == [
+        "#EXTM3U",
+        "#EXTINF:62,A <&> B",
+        str(ENTRIES[0][0]),
+        "#EXTINF:2,multi line title",
+        str(ENTRIES[1][0]),
+    ]
+
+
+def test_playlist_chunks_are_lazy():
+    def entries():
+        for i in range(1000):
+            yield AbsolutePath(f"/videos/{i}.mp4"), f"video {i}", i
+            consumed.append(i)
+
+    consumed = []
+    chunks = iter_playlist(entries(), "m3u8", chunk_size=1024)
+    first = next(chunks)
+    assert len(first) >= 1024
+    assert len(consumed) < 100
+    data = first + b"".join(chunks)
+    assert len(consumed) == 1000
+    assert data.decode("utf-8").count("#EXTINF:") == 1000
@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+import urllib.request
+
+from pysaurus.database.db_video_server import ServerLauncher
+
+# Modules imported by GUI at startup.
+STARTUP_MODULES = ("pysaurus.interface.api.gui_api",)
+# Modules that must only be imported when their feature is first used.
+HEAVY_MODULES = ("av", "numpy", "flask", "werkzeug", "send2trash", "filedial")
+# Budget for cold import of startup modules, in milliseconds.
+IMPORT_BUDGET_MS = 1000
+
+
+def _import_in_subprocess(module: str) -> tuple[float, list[str]]:
+    """Import module in a fresh interpreter.
+
+    Return import time (ms) and imported heavy modules.
+    """
+    code = (
+        f"import json, sys; import {module}; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # -X importtime lines: "import time: self [us] | cumulative | name",
+    # with name indented by import depth. Sum top-level imports.
+    microseconds = 0
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit() and not name.startswith("  "):
+                microseconds += int(cumulative)
+    return microseconds / 1000, json.loads(process.stdout)
+
+
+def test_startup_does_not_import_heavy_modules():
+    for module in STARTUP_MODULES:
+        _, heavy_modules = _import_in_subprocess(module)
+        assert heavy_modules == [], module
+
+
+def test_startup_import_budget():
+    for module in STARTUP_MODULES:
+        milliseconds, _ = _import_in_subprocess(module)
+        assert milliseconds < IMPORT_BUDGET_MS, (
+            f"importing {module} took {milliseconds:.0f} ms "
+            f"(budget: {IMPORT_BUDGET_MS} ms)"
+        )
+
+
+def test_server_starts_on_first_use():
+    server = ServerLauncher(lambda: None)
+    # Never started: nothing to stop.
+    server.stop()
+    try:
+        url = server.url("/")
+        assert url.startswith("http://127.0.0.1:")
+        with urllib.request.urlopen(url) as response:
+            assert response.read() == b"Pysaurus Video Server"
+        # Same server is reused.
+        assert server.url("/") == url
+    finally:
+        server.stop()
+
+
+def test_server_without_database():
+    server = ServerLauncher(lambda: None, lambda: None)
+    client = server.application.test_client()
+    assert client.get("/thumbnail/1").status_code == 404
+    assert client.get("/playlist.m3u8").status_code == 404
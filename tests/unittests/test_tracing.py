@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+
+from pysaurus.core import tracing
+from pysaurus.core.job_notifications import AbstractNotifier
+from pysaurus.core.parallelization import parallelize
+from pysaurus.core.profiling import Profiler
+from pysaurus.core.tracing import PerfLog
+
+
+class _NullNotifier(AbstractNotifier):
+    __slots__ = ()
+
+    def notify(self, notification):
+        pass
+
+
+def _count_and_square(x):
+    tracing.count("items", 1)
+    with tracing.span("square"):
+        return x * x
+
+
+def _run_span(name):
+    with tracing.span(name):
+        pass
+
+
+def _spans(tracer):
+    return [event for event in tracer.events if event["ph"] == "X"]
+
+
+def test_disabled_tracing_is_no_op():
+    assert tracing.get_tracer() is None
+    assert tracing.span("a") is tracing.span("b")
+    tracing.count("nothing")
+    assert tracing.get_tracer() is None
+
+
+def test_nested_spans_and_counters():
+    with tracing.recording() as tracer:
+        with tracing.span("outer", key="value"):
+            with tracing.span("inner"):
+                tracing.count("rows fetched", 10)
+            tracing.count("rows fetched", 5)
+        thread = threading.Thread(target=_run_span, args=("other",))
+        thread.start()
+        thread.join()
+    assert tracing.get_tracer() is None
+    inner, outer, other = _spans(tracer)
+    assert other["tid"] == thread.ident != threading.get_ident()
+    assert (inner["name"], outer["name"]) == ("inner", "outer")
+    assert outer["args"] == {"key": "value"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert inner["tid"] == outer["tid"] == threading.get_ident()
+    assert tracer.counters == {"rows fetched": 15}
+    counter_events = [event for event in tracer.events if event["ph"] == "C"]
+    assert counter_events[-1]["args"] == {"rows fetched": 15}
+
+
+def test_profiler_records_span():
+    with tracing.recording() as tracer:
+        with Profiler("profiled", notifier=_NullNotifier()):
+            pass
+    assert [span["name"] for span in _spans(tracer)] == ["profiled"]
+
+
+def test_parallelize_merges_worker_traces():
+    with tracing.recording() as tracer:
+        results = list(parallelize(_count_and_square, [1, 2, 3], cpu_count=2))
+    assert results == [1, 4, 9]
+    assert tracer.counters == {"items": 3}
+    spans = _spans(tracer)
+    assert (
+        sorted(span["name"] for span in spans)
+        == ["_count_and_square"] * 3 + ["square"] * 3
+    )
+    assert all(span["pid"] != os.getpid() for span in spans)
+
+
+def test_chrome_trace(tmp_path):
+    with tracing.recording() as tracer:
+        with tracing.span("work"):
+            tracing.count("bytes read", 100)
+    path = tracer.save(tmp_path / "trace.json")
+    with open(path.path) as file:
+        trace = json.load(file)
+    phases = [event["ph"] for event in trace["traceEvents"]]
+    assert phases == ["M", "M", "X", "C"]
+    assert trace["otherData"]["counters"] == {"bytes read": 100}
+
+
+def test_perf_log(tmp_path):
+    path = tmp_path / "perf.jsonl"
+    with tracing.recording(perf_log=path):
+        for i in range(3):
+            with tracing.span("update", index=i):
+                with tracing.span("nested"):
+                    tracing.count("files stat'ed", 2)
+    records = PerfLog(path).read()
+    assert [record["name"] for record in records] == ["update"] * 3
+    assert [record["args"]["index"] for record in records] == [0, 1, 2]
+    assert all(record["counters"] == {"files stat'ed": 2} for record in records)
+
+
+def test_perf_log_rolls_over(tmp_path):
+    perf_log = PerfLog(tmp_path / "perf.jsonl", max_bytes=100)
+    for i in range(10):
+        perf_log.append({"name": "span", "index": i})
+    assert os.path.isfile(tmp_path / "perf.jsonl.1")
+    assert os.path.getsize(tmp_path / "perf.jsonl") <= 100
+    indices = [record["index"] for record in perf_log.read()]
+    assert indices == list(range(10))[-len(indices) :]
+    assert len(indices) < 10
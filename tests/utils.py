@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 
 from pysaurus.database.saurus.pysaurus_collection import PysaurusCollection
 from pysaurus.database.saurus.pysaurus_connection import PysaurusConnection
@@ -7,15 +9,32 @@ TEST_HOME_DIR = os.path.join(os.path.dirname(__file__), "home_dir_test")
 TEST_DB_FOLDER = os.path.join(TEST_HOME_DIR, ".Pysaurus", "databases", "test_database")
 
 
+def copy_database_folder(folder: str, parent: str | None = None) -> str:
+    """
+    Copy a database folder into `parent` (default: a new temporary folder).
+
+    Opening a collection migrates and writes its database, so tests open
+    a copy to keep tracked files unchanged. Return path of the copy.
+    """
+    parent = parent or tempfile.mkdtemp(prefix="pysaurus-test-")
+    return shutil.copytree(
+        folder,
+        os.path.join(parent, os.path.basename(folder)),
+        ignore=shutil.ignore_patterns("*-wal", "*-shm"),
+    )
+
+
 def get_saurus_sql_database(folder: str = TEST_DB_FOLDER) -> PysaurusCollection:
     """
     Get a PysaurusCollection with an in-memory copy of the database.
 
-    Uses skullite's copy_from() to create an in-memory copy,
-    so the returned object can be used directly without `with` statement.
+    Database is read from a temporary copy of the folder, then copied in memory
+    with skullite's copy_from(), so the returned object can be used directly
+    without `with` statement.
     """
-    collection = PysaurusCollection(folder)
+    collection = PysaurusCollection(copy_database_folder(folder))
     memory_db = PysaurusConnection(None)
     memory_db.copy_from(collection.db)
+    collection.db.close()
     collection.db = memory_db
     return collection
@@ -10,8 +10,8 @@ wrapped seam (negligible vs HarfBuzz), median of COLD_REPS cold cycles per size:
 
 WARNING: the shape/paint split is NOISY at this granularity (medians don't sum;
 swings ~40% run-to-run). Use it only as a rough where-does-time-go map; to decide
-whether a change actually helps, use bench_first_500.py and compare TOTALS over
-many cold cycles. raster being ~0.2% confirms a GPU backend won't speed up text.
+whether a change actually helps, use pysaurus.benchmarks.first_render and compare
+TOTALS over many cold cycles. raster being ~0.2% confirms a GPU backend won't speed up text.
 
 Requires the local "Divertissement" DB. videre is an editable dep of pysaurus,
 so videre working-tree changes are live; stash/unstash between before/after runs
@@ -86,6 +86,7 @@ def main() -> None:
                     firsts, shapes, paints, rasters, others = [], [], [], [], []
                     n = 0
                     for _ in range(COLD_REPS):
+                        vp._card_cache.clear()  # cold: no card reused
                         vp.page_size = (
                             size  # setter resets page + reloads (cold rebuild)
                         )
@@ -93,7 +94,7 @@ def main() -> None:
                         t0 = time.perf_counter()
                         win.render()
                         total = time.perf_counter() - t0
-                        n = len(vp._cards.controls)
+                        n = len(vp._cards.cards)
                         shape = stats["shape"][1]
                         text_draw = stats["text_draw"][1]
                         raster = stats["raster"][1]